@@ -36,18 +36,51 @@ from datetime import datetime
 from pathlib import Path
 import json
 
+from git_analytics import RepoAnalytics
+from git_bloat import BloatAnalyzer, format_size
+from git_change_detect import ChangeDetector
+from git_core import get_core, run_command
+from git_bundle_backup import BundleBackup
+from git_remotes import RemoteManager
+from git_snapshot import SnapshotBackup
+from git_sparse import SparseCheckoutManager
+from git_fetch_scheduler import BranchTracking, format_divergence
+from git_submodules import SubmoduleManager
+from git_untracked import UntrackedAnalyzer
+from git_worktrees import WorktreeManager
+from git_manager_daemon import DaemonClient
+from git_output import run_captured
+from git_precommit import PrecommitPipeline
+
 class GitManager:
-    def __init__(self):
+    def __init__(self, probe=True):
         self.project_path = os.getcwd()
         self.git_version = None         
         self.git_config = None          
-        self.git_exists = self.check_git_installation()
+        # Cache-urile din git_manager_daemon.py (folosite doar dacă daemon-ul rulează)
+        self.daemon = DaemonClient()
+        # În modul non-interactiv (git_cli) verificarea instalării este omisă
+        self.git_exists = self.check_git_installation() if probe else None
         self.repo_initialized = self.check_git_repo()
+        
+        # Continuă în worktree-ul ales la sesiunea anterioară
+        if self.repo_initialized:
+            self.project_path = WorktreeManager(self.project_path).active_path() or self.project_path
 
 
 
     def check_git_installation(self):
         """Verifică dacă Git este instalat în sistem și obține informații detaliate"""
+        # Daemon-ul are deja versiunea și configurația (fără cele 3 procese git)
+        info = self.daemon.git_info()
+        if info:
+            self.git_version = info['version']
+            self.git_config = {
+                'name': info['name'] or "Nu este configurat",
+                'email': info['email'] or "Nu este configurat"
+            }
+            return True
+        
         try:
             # Verifică versiunea Git
             result = subprocess.run(['git', '--version'], capture_output=True, text=True, check=True)
@@ -136,7 +169,12 @@ class GitManager:
     
     def check_git_repo(self):
         """Verifică dacă directorul curent este un repository Git"""
-        return os.path.exists('.git')
+        return os.path.exists(os.path.join(self.project_path, '.git'))
+    
+    def status_pathspecs(self):
+        """Cu sparse-checkout activ, status-ul și add-ul privesc doar directoarele din cone"""
+        pathspecs = SparseCheckoutManager(self.project_path).pathspecs()
+        return ['--'] + pathspecs if pathspecs else []
     
     def run_git_command(self, command, show_output=True):
         """
@@ -149,22 +187,15 @@ class GitManager:
         Returns:
             tuple: (success, output, error)
         """
-        try:
-            result = subprocess.run(
-                command, 
-                capture_output=True, 
-                text=True, 
-                check=True,
-                cwd=self.project_path
-            )
-            if show_output and result.stdout:
-                print(f"✅ Succes: {result.stdout}")
-            return True, result.stdout, None
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            if show_output:
-                print(f"❌ Eroare: {error_msg}")
-            return False, None, error_msg
+        # Execuția este comună cu aplicația web (git_core); în terminal git poate cere parola
+        result = run_command(command, self.project_path, interactive=sys.stdin.isatty())
+        if result['success']:
+            if show_output and result['output']:
+                print(f"✅ Succes: {result['output']}")
+            return True, result['output'], None
+        if show_output:
+            print(f"❌ Eroare: {result['error']}")
+        return False, None, result['error']
     
     def display_header(self):
         """Afișează header-ul aplicației"""
@@ -190,7 +221,11 @@ class GitManager:
             print("❌ Repository-ul nu este inițializat!")
             return
         
-        success, output, error = self.run_git_command(['git', 'status', '--porcelain'])
+        cached = self.daemon.query(self.project_path, 'status')
+        if cached:
+            success, output, error = cached['success'], cached['output'], cached['error']
+        else:
+            success, output, error = self.run_git_command(['git', 'status', '--porcelain'] + self.status_pathspecs())
         
         if success:
             if not output:
@@ -214,9 +249,28 @@ class GitManager:
                         print(f"  ❌ {filename} (șters)")
         
         # Afișează și branch-ul curent
-        success, branch_output, _ = self.run_git_command(['git', 'branch', '--show-current'], False)
-        if success and branch_output:
-            print(f"\n🌿 Branch curent: {branch_output.strip()}")
+        current_branch = get_core(self.project_path).current_branch()
+        if current_branch:
+            print(f"\n🌿 Branch curent: {current_branch}")
+        
+        # Submodulele sunt repository-uri separate, verificate în paralel
+        submodules = SubmoduleManager(self.project_path)
+        if submodules.has_submodules():
+            print("\n📦 Submodule:")
+            for entry in submodules.status():
+                indent = "  " * (entry['depth'] + 1)
+                if entry['state'] == 'uninitialized':
+                    print(f"{indent}⚪ {entry['path']} (neinițializat)")
+                    continue
+                details = [entry['branch'] or 'HEAD detașat']
+                if entry['changes']:
+                    details.append(f"{entry['changes']} modificări")
+                if entry['ahead']:
+                    details.append(f"{entry['ahead']} commit-uri netrimise")
+                if entry['state'] == 'out_of_sync':
+                    details.append('alt commit decât cel înregistrat')
+                icon = "📝" if entry['dirty'] else "✅"
+                print(f"{indent}{icon} {entry['path']} @ {entry['commit']} ({', '.join(details)})")
     
     def initialize_repository(self):
         """
@@ -315,7 +369,7 @@ build/
 """
         
         try:
-            with open('.gitignore', 'w', encoding='utf-8') as f:
+            with open(os.path.join(self.project_path, '.gitignore'), 'w', encoding='utf-8') as f:
                 f.write(gitignore_content)
             print("✅ Fișierul .gitignore a fost creat!")
         except Exception as e:
@@ -397,17 +451,20 @@ build/
             print("❌ Repository-ul nu este inițializat!")
             return
         
-        # Verifică dacă există fișiere în staging area
-        success, output, error = self.run_git_command(['git', 'diff', '--cached', '--name-only'], False)
+        # Verifică dacă există fișiere în staging area (citite direct din .git/index)
+        staged = get_core(self.project_path).staged()
         
-        if not success or not output:
+        if not staged:
             print("⚠️  Nu există fișiere pregătite pentru commit!")
             print("💡 Folosește opțiunea 'Adaugă fișiere' întâi.")
             return
         
         print("📝 Fișiere pregătite pentru commit:")
-        for filename in output.strip().split('\n'):
-            print(f"  ✅ {filename}")
+        for change in staged:
+            print(f"  ✅ {change['path']}")
+        
+        if not self.confirm_precommit_checks():
+            return
         
         print("\n📖 Exemple de mesaje bune de commit:")
         print("  - 'Adaugă funcționalitatea de login'")
@@ -548,6 +605,8 @@ build/
         
         branches = []
         current_branch = None
+        # Diferența față de upstream (după ultimul fetch): ↑ commit-uri de trimis, ↓ de descărcat
+        tracking = BranchTracking().get(self.project_path) or {}
         
         print("🌿 Branch-uri disponibile:")
         for line in output.strip().split('\n'):
@@ -555,10 +614,14 @@ build/
                 if line.startswith('*'):
                     branch_name = line[2:].strip()
                     current_branch = branch_name
-                    print(f"  👉 {branch_name} (curent)")
+                    print(f"  👉 {branch_name} (curent){format_divergence(tracking.get(branch_name, {}))}")
+                elif line.startswith('+'):
+                    # Branch activ într-un alt worktree
+                    branch_name = line[2:].strip()
+                    print(f"  📂 {branch_name} (worktree separat){format_divergence(tracking.get(branch_name, {}))}")
                 else:
                     branch_name = line.strip()
-                    print(f"     {branch_name}")
+                    print(f"     {branch_name}{format_divergence(tracking.get(branch_name, {}))}")
                 branches.append(branch_name)
         
         if len(branches) <= 1:
@@ -575,6 +638,11 @@ build/
             print(f"❌ Branch-ul '{target_branch}' nu există!")
             return
         
+        # Un branch care are deja worktree nu mai este scos a doua oară: se comută directorul
+        if WorktreeManager(self.project_path).find(target_branch):
+            self.activate_worktree(target_branch)
+            return
+        
         success, output, error = self.run_git_command(['git', 'checkout', target_branch])
         
         if success:
@@ -606,7 +674,7 @@ build/
             print("🔗 Repository-uri remote existente:")
             print(output)
             
-            overwrite = input("\n🤔 Vrei să schimbi repository-ul remote? (y/n): ").lower()
+            overwrite = input("\n🤔 Vrei să adaugi sau să schimbi un repository remote? (y/n): ").lower()
             if overwrite != 'y':
                 return
         
@@ -625,18 +693,22 @@ build/
             print("❌ URL-ul nu poate fi gol!")
             return
         
-        # Adaugă remote-ul
-        success, output, error = self.run_git_command(['git', 'remote', 'add', 'origin', remote_url])
+        print("\n💡 Poți avea mai multe remote-uri (ex: origin, backup, mirror).")
+        print("   Push-ul se va face în paralel către toate.")
+        remote_name = input("🏷️  Numele remote-ului (Enter = origin): ").strip() or 'origin'
         
-        if success:
-            print("✅ Repository-ul remote a fost configurat!")
+        # Adaugă remote-ul (sau actualizează URL-ul unuia existent)
+        result = RemoteManager(self.project_path).add_or_update(remote_name, remote_url)
+        
+        if result['success']:
+            print(f"✅ {result['message']}!")
             
             # Întreabă dacă vrea să facă primul push
             push_now = input("\n🚀 Vrei să trimiți proiectul pe server acum? (y/n): ").lower()
             if push_now == 'y':
                 self.push_to_remote(first_push=True)
         else:
-            print(f"❌ Eroare la configurarea remote-ului: {error}")
+            print(f"❌ Eroare la configurarea remote-ului: {result['message']}")
     
     def push_to_remote(self, first_push=False):
         """
@@ -663,13 +735,24 @@ build/
         success, branch_output, error = self.run_git_command(['git', 'branch', '--show-current'], False)
         current_branch = branch_output.strip() if success else 'main'
         
+        remote_manager = RemoteManager(self.project_path)
         if first_push:
             print("📤 Se face primul push și se setează branch-ul ca upstream...")
-            command = ['git', 'push', '-u', 'origin', current_branch]
+            command = ['git', 'push', '-u', remote_manager.push_target(), current_branch]
         else:
             print(f"📤 Se trimit modificările pe branch-ul '{current_branch}'...")
             command = ['git', 'push']
         
+        if not self.confirm_large_blobs():
+            print("❌ Push anulat.")
+            return
+        
+        if len(remote_manager.remote_names()) > 1:
+            print("🌐 Există mai multe remote-uri: push în paralel către toate...")
+            result = remote_manager.push_all(current_branch, set_upstream=first_push)
+            self.print_remote_results(result)
+            return
+        
         success, output, error = self.run_git_command(command)
         
         if success:
@@ -683,6 +766,62 @@ build/
                 print("  - Verifică dacă ai permisiuni pe repository")
                 print("  - Poate ai nevoie să faci 'git pull' întâi")
     
+    def print_remote_results(self, result):
+        """Afișează rezultatul per remote al unui push/fetch paralel"""
+        for entry in result['results']:
+            icon = "✅" if entry['success'] else ("⏱️ " if entry['timed_out'] else "❌")
+            print(f"  {icon} {entry['remote']:<15} {entry['duration_ms']:>9.0f} ms"
+                  + (f"  {entry['error']}" if not entry['success'] and entry['error'] else ""))
+        print(("🎉 " if result['success'] else "⚠️  ") + result['message'])
+    
+    def fetch_all_remotes(self):
+        """
+        EXPLICAȚIE: git fetch
+        
+        Fetch descarcă noutățile de pe server fără să modifice fișierele
+        tale. Cu mai multe remote-uri, toate sunt interogate în paralel.
+        """
+        print("\n🔄 SINCRONIZARE REMOTE-URI (FETCH)")
+        print("-" * 40)
+        
+        if not self.repo_initialized:
+            print("❌ Repository-ul nu este inițializat!")
+            return
+        
+        remote_manager = RemoteManager(self.project_path)
+        remotes = remote_manager.list_remotes()
+        if not remotes:
+            print("❌ Nu este configurat niciun repository remote!")
+            return
+        
+        print("🌐 Remote-uri configurate:")
+        for remote in remotes:
+            print(f"  - {remote['name']}: {remote['fetch_url']}")
+        
+        print("\n📥 Se descarcă în paralel...")
+        self.print_remote_results(remote_manager.fetch_all())
+    
+    def confirm_large_blobs(self):
+        """
+        Verifică dacă următorul push ar trimite fișiere foarte mari
+        și cere confirmare înainte de a continua.
+        """
+        analyzer = BloatAnalyzer(self.project_path)
+        large_blobs = analyzer.outgoing_large_blobs()
+        if analyzer.incomplete:
+            print("⚠️  Verificarea fișierelor mari a fost oprită înainte de final (istoric prea mare).")
+        if not large_blobs:
+            return True
+        
+        print("\n⚠️  ATENȚIE: Următoarele fișiere mari vor fi trimise pe server:")
+        for blob in large_blobs[:10]:
+            print(f"  📦 {blob['path'] or blob['oid'][:10]} ({format_size(blob['size'])})")
+        if len(large_blobs) > 10:
+            print(f"  ... și încă {len(large_blobs) - 10}")
+        print("💡 Fișierele mari încetinesc clonarea și nu pot fi șterse ușor din istoric.")
+        
+        return input("\n🤔 Continui cu push-ul? (y/n): ").lower() == 'y'
+    
     def pull_from_remote(self):
         """
         EXPLICAȚIE: git pull
@@ -712,13 +851,19 @@ build/
         print("\n📁 STRUCTURA PROIECTULUI")
         print("-" * 30)
         
+        # Cu sparse-checkout activ sunt afișate doar directoarele din cone
+        sparse = SparseCheckoutManager(self.project_path) if self.repo_initialized else None
+        cone = sparse.directories() if sparse and sparse.is_enabled() else None
+        
         def show_tree(path, prefix="", max_depth=3, current_depth=0):
             if current_depth >= max_depth:
                 return
             
             try:
                 items = sorted(os.listdir(path))
-                dirs = [item for item in items if os.path.isdir(os.path.join(path, item)) and not item.startswith('.')]
+                dirs = [item for item in items if os.path.isdir(os.path.join(path, item)) and not item.startswith('.')
+                        and SparseCheckoutManager.in_cone(
+                            os.path.relpath(os.path.join(path, item), self.project_path).replace(os.sep, '/'), cone)]
                 files = [item for item in items if os.path.isfile(os.path.join(path, item)) and not item.startswith('.')]
                 
                 # Afișează directoarele
@@ -879,6 +1024,25 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
         print(help_text)
         input("\n📖 Apasă Enter pentru a continua...")
     
+    def confirm_precommit_checks(self, env=None):
+        """
+        Verificările pre-commit (mărime, secrete, conflicte, sintaxă) pentru
+        fișierele din staging (sau din index-ul temporar dat prin env).
+        Rezultatele sunt păstrate după conținut, deci doar fișierele
+        modificate de la ultima verificare sunt citite din nou.
+        Returnează True dacă se poate continua cu commit-ul.
+        """
+        print("🔎 Verificări pre-commit...")
+        checks = PrecommitPipeline(self.project_path, env=env).run()
+        if checks['success']:
+            print(f"  ✅ {checks['message']}")
+            return True
+        
+        print(f"  ⚠️  {checks['message']}:")
+        for problem in checks.get('problems', []):
+            print(f"     ❌ {problem['path']} [{problem['check']}]: {problem['message']}")
+        return input("🤔 Continui totuși cu commit-ul? (y/n): ").lower() == 'y'
+    
     def create_quick_backup(self):
         """
         Funcție rapidă pentru backup complet:
@@ -894,14 +1058,41 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
             print("❌ Repository-ul nu este inițializat!")
             return
         
+        # Cu gitmanager.backupMode=snapshot, backup-ul nu atinge staging area și branch-ul
+        backup = SnapshotBackup(self.project_path)
+        if backup.is_default():
+            self.create_snapshot_backup(backup)
+            return
+        
         print("🔍 Se verifică dacă există modificări...")
         
-        # Verifică mai întâi dacă există modificări
-        success_status, status_output, _ = self.run_git_command(['git', 'status', '--porcelain'], False)
+        # Fast path: snapshot-ul de la ultimul backup evită 'git status' complet
+        detector = ChangeDetector(self.project_path)
+        changed = detector.detect()
         
-        if not success_status:
-            print("❌ Nu se poate verifica status-ul repository-ului!")
-            return
+        # Snapshot-ul nu vede în interiorul submodulelor: un submodul modificat cere status complet
+        submodules = SubmoduleManager(self.project_path)
+        submodule_status = submodules.status() if submodules.has_submodules() else []
+        if any(entry['dirty'] for entry in submodule_status):
+            changed = None
+        
+        pathspecs = self.status_pathspecs()
+        if changed is None:
+            success_status, status_output, _ = self.run_git_command(['git', 'status', '--porcelain'] + pathspecs, False)
+            
+            if not success_status:
+                print("❌ Nu se poate verifica status-ul repository-ului!")
+                return
+            
+            if not status_output or not status_output.strip():
+                detector.refresh()
+        else:
+            # Codurile din 'git status': fișierele noi nu sunt în index
+            tracked = detector.tracked_paths(changed) if changed else set()
+            codes = {path: '??' if path not in tracked else
+                     ' M' if os.path.lexists(os.path.join(self.project_path, path)) else ' D'
+                     for path in changed}
+            status_output = '\n'.join(f"{codes[path]} {path}" for path in changed)
         
         if not status_output or not status_output.strip():
             print("✅ Nu există modificări de salvat!")
@@ -915,7 +1106,8 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
         
         # Afișează ce modificări vor fi salvate
         print("📝 Modificări detectate:")
-        for line in status_output.strip().split('\n'):
+        # Doar liniile goale de la final: prima coloană de status poate fi un spațiu
+        for line in status_output.rstrip('\n').split('\n'):
             status = line[:2]
             filename = line[3:]
             
@@ -941,14 +1133,41 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
         
         print("\n🔄 Se execută backup-ul complet...")
         
-        # 1. Add all files
-        print("  1️⃣ Adaugă toate fișierele...")
-        success1, _, error1 = self.run_git_command(['git', 'add', '.'], False)
+        # 0. Submodulele modificate sunt salvate înaintea proiectului principal
+        if any(entry['dirty'] for entry in submodule_status):
+            print("  0️⃣ Salvează submodulele (în paralel, de la cele mai adânci)...")
+            has_remote = bool(RemoteManager(self.project_path).remote_names())
+            submodule_result = submodules.backup(commit_message, push=has_remote, statuses=submodule_status)
+            for entry in submodule_result['results']:
+                if entry['error']:
+                    print(f"     ⚠️  {entry['path']}: {entry['error']}")
+                elif entry['committed']:
+                    print(f"     ✅ {entry['path']}" + (" (trimis pe server)" if entry['pushed'] else ""))
+        
+        # 1. Add all files (sau doar cele modificate, dacă snapshot-ul este valid)
+        if changed is None:
+            print("  1️⃣ Adaugă toate fișierele...")
+            add_command = ['git', 'add', '-A'] + pathspecs if pathspecs else ['git', 'add', '.']
+            success1, _, error1 = self.run_git_command(add_command, False)
+        else:
+            print(f"  1️⃣ Adaugă {len(changed)} căi modificate...")
+            success1, error1 = detector.add_paths(changed)
         
         if not success1:
             print(f"❌ Eroare la adăugarea fișierelor: {error1}")
             return
         
+        # Un fișier atins (mtime nou) dar cu același conținut nu ajunge în staging
+        if changed is not None and not detector.has_staged_changes():
+            detector.refresh()
+            print("✅ Nu există modificări de salvat!")
+            print("💡 Fișierele detectate au același conținut ca în ultimul commit.")
+            return
+        
+        if not self.confirm_precommit_checks():
+            print("❌ Backup anulat (fișierele au rămas în staging).")
+            return
+        
         # 2. Commit
         print("  2️⃣ Creează commit...")
         success2, commit_output, error2 = self.run_git_command(['git', 'commit', '-m', commit_message], False)
@@ -972,11 +1191,39 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
         
         print("✅ Commit creat cu succes!")
         
+        if changed is None:
+            detector.refresh()
+        else:
+            detector.update(changed)
+        
+        # Bundle offline, dacă este configurat un director de backup
+        bundle = BundleBackup(self.project_path)
+        if bundle.target_dir:
+            print("  💽 Scrie bundle incremental...")
+            bundle_result = bundle.create()
+            if bundle_result['success']:
+                print(f"  ✅ {bundle_result['message']} ({format_size(bundle_result['bytes_written'])})")
+            else:
+                print(f"  ⚠️  {bundle_result['message']}")
+        
         # 3. Push dacă există remote
         print("  3️⃣ Verifică repository remote...")
         success3, remote_output, _ = self.run_git_command(['git', 'remote', '-v'], False)
         
         if success3 and remote_output:
+            if not self.confirm_large_blobs():
+                print("💾 Commit realizat local, push anulat.")
+                return
+            
+            remote_manager = RemoteManager(self.project_path)
+            if len(remote_manager.remote_names()) > 1:
+                print("  4️⃣ Trimite în paralel către toate remote-urile...")
+                _, branch_output, _ = self.run_git_command(['git', 'branch', '--show-current'], False)
+                push_result = remote_manager.push_all((branch_output or 'main').strip())
+                self.print_remote_results(push_result)
+                print(f"💾 Commit: {commit_message}")
+                return
+            
             print("  4️⃣ Trimite pe server...")
             success4, push_output, error4 = self.run_git_command(['git', 'push'], False)
             
@@ -996,6 +1243,34 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
             print(f"💾 Commit: {commit_message}")
             print("💡 Configurează un repository remote pentru backup online.")
     
+    def create_snapshot_backup(self, backup):
+        """
+        EXPLICAȚIE: Backup snapshot (fără git add / git commit)
+        
+        Fișierele sunt salvate într-un commit separat, în
+        refs/backups/<branch>, folosind o copie temporară a index-ului.
+        Fișierele pregătite pentru commit (staging area) și branch-ul
+        curent rămân exact cum erau.
+        """
+        print("📸 Se creează snapshot-ul (staging area rămâne neschimbată)...")
+        message = f"Backup automat - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        
+        result = backup.create(message, check=lambda env: {
+            'success': self.confirm_precommit_checks(env), 'message': 'Backup anulat'})
+        if not result['success']:
+            print(f"❌ {result['message']}")
+            return
+        if not result.get('committed'):
+            print("✅ Nu există modificări de salvat față de ultimul snapshot!")
+            return
+        
+        print(f"✅ {result['message']}")
+        if RemoteManager(self.project_path).remote_names():
+            print("🚀 Se trimite snapshot-ul pe server...")
+            push_result = backup.push(result['ref'])
+            print(("✅ " if push_result['success'] else "⚠️  ") + push_result['message'])
+        print(f"💡 Restaurare: git checkout {result['ref']} -- <fișier>")
+    
     def emergency_restore(self):
         """
         Funcții de urgență pentru restaurarea fișierelor
@@ -1056,13 +1331,383 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
         elif choice == '3':
             filename = input("📁 Pentru care fișier să afișez diferențele? ").strip()
             if filename:
-                success, output, error = self.run_git_command(['git', 'diff', filename])
-                if success:
-                    if not output:
+                # Large diffs are streamed in chunks instead of being held in memory
+                diff = run_captured(['git', 'diff', '--', filename], self.project_path)
+                if diff.success:
+                    if not diff.size:
                         print("✅ Nu există diferențe pentru acest fișier!")
-                    # Output is already displayed by run_git_command
+                    sys.stdout.flush()
+                    for chunk in diff.iter_chunks():
+                        sys.stdout.buffer.write(chunk)
+                    sys.stdout.buffer.flush()
                 else:
-                    print(f"❌ Eroare: {error}")
+                    print(f"❌ Eroare: {diff.error}")
+                diff.close()
+    
+    def show_repository_analytics(self):
+        """
+        EXPLICAȚIE: Statistici repository
+        
+        Istoricul este indexat o singură dată într-o bază locală
+        (.git/git_manager/analytics.sqlite3). La rulările următoare
+        se adaugă doar commit-urile noi, deci statisticile apar instant.
+        """
+        print("\n📈 STATISTICI REPOSITORY")
+        print("-" * 30)
+        
+        if not self.repo_initialized:
+            print("❌ Repository-ul nu este inițializat!")
+            return
+        
+        analytics = RepoAnalytics(self.project_path)
+        
+        print("🔄 Se actualizează indexul de statistici...")
+        sync_result = analytics.sync()
+        print(("✅ " if sync_result['success'] else "⚠️  ") + sync_result['message'])
+        
+        summary = analytics.summary()
+        if not summary['commits']:
+            print("⚠️  Nu există commit-uri de analizat.")
+            return
+        
+        print(f"\n📊 {summary['commits']} commit-uri, {summary['authors']} autori, {summary['files']} fișiere")
+        print(f"📅 Perioada: {summary['first_commit']} → {summary['last_commit']}")
+        
+        print("\n🔥 Fișiere cu cele mai multe modificări (churn):")
+        for entry in analytics.top_churned_paths(10):
+            print(f"  {entry['churn']:>8}  (+{entry['added']} / -{entry['deleted']}, {entry['commits']} commit-uri)  {entry['path']}")
+        
+        print("\n👥 Commit-uri pe autor (ultimele 8 săptămâni):")
+        for entry in analytics.commits_per_author_week(8):
+            print(f"  {entry['week']}  {entry['commits']:>4}  {entry['author']}")
+        
+        print("\n📈 Creșterea proiectului (linii de cod):")
+        for entry in analytics.file_size_growth()[-8:]:
+            print(f"  {entry['week']}  {entry['lines']:>10}  ({entry['delta']:+d})")
+        
+        path = input("\n📁 Evoluția unui fișier/director anume (Enter pentru a sări): ").strip()
+        if path:
+            growth = analytics.file_size_growth(path)
+            if not growth:
+                print(f"⚠️  Nu există istoric pentru '{path}'.")
+            for entry in growth[-12:]:
+                print(f"  {entry['week']}  {entry['lines']:>10}  ({entry['delta']:+d})")
+    
+    def show_bloat_analysis(self):
+        """
+        EXPLICAȚIE: Obiecte mari în istoric
+        
+        Un fișier mare adăugat o singură dată rămâne pentru totdeauna
+        în istoric, chiar dacă este șters ulterior. Analiza caută cele
+        mai mari fișiere din tot istoricul și commit-ul care le-a adăugat.
+        """
+        print("\n📦 ANALIZA OBIECTELOR MARI")
+        print("-" * 30)
+        
+        if not self.repo_initialized:
+            print("❌ Repository-ul nu este inițializat!")
+            return
+        
+        print("🔍 Se analizează obiectele din repository...")
+        report = BloatAnalyzer(self.project_path).analyze(limit=15)
+        
+        if not report['largest_blobs']:
+            print("✅ Nu există fișiere în istoric.")
+        else:
+            print("\n🏋️  Cele mai mari fișiere din istoric:")
+            for blob in report['largest_blobs']:
+                commit = blob.get('commit')
+                origin = f"{commit['short']} {commit['subject']}" if commit else "commit necunoscut"
+                print(f"  {format_size(blob['size']):>10}  {blob['path'] or blob['oid'][:10]}")
+                print(f"              ↳ adăugat în: {origin}")
+        
+        print("\n📊 Obiecte pe tipuri:")
+        for obj_type, stats in sorted(report['objects'].items()):
+            print(f"  {obj_type:<7} {stats['count']:>10} obiecte  {format_size(stats['size']):>10}"
+                  f" (pe disc: {format_size(stats['disk_size'])})")
+        
+        pack = report['pack']
+        print("\n🗃️  Stocare:")
+        print(f"  Obiecte loose: {pack['loose_objects']} ({format_size(pack['loose_size'])})")
+        print(f"  Pachete: {pack['pack_count']} cu {pack['packed_objects']} obiecte ({format_size(pack['pack_size'])})")
+        if pack['prune_packable']:
+            print(f"  ⚠️  {pack['prune_packable']} obiecte loose există deja în pachete (git prune-packed)")
+        if pack['loose_objects'] > 1000 or pack['pack_count'] > 20:
+            print("  💡 Recomandare: rulează 'git gc' pentru a compacta repository-ul.")
+    
+    def manage_bundle_backups(self):
+        """
+        EXPLICAȚIE: Backup offline cu git bundle
+        
+        Un "bundle" este un fișier care conține commit-uri Git.
+        Primul bundle conține tot istoricul, iar următoarele doar
+        commit-urile noi, deci backup-urile frecvente rămân mici.
+        Directorul poate fi pe un disc extern sau un stick USB.
+        """
+        print("\n💽 BACKUP OFFLINE (GIT BUNDLE)")
+        print("-" * 35)
+        
+        if not self.repo_initialized:
+            print("❌ Repository-ul nu este inițializat!")
+            return
+        
+        bundle = BundleBackup(self.project_path)
+        print(f"📁 Director backup: {bundle.target_dir or 'neconfigurat'}")
+        
+        print("\n🔧 Opțiuni:")
+        print("1. Configurează directorul de backup")
+        print("2. Creează bundle incremental acum")
+        print("3. Listează bundle-urile")
+        print("4. Verifică bundle-urile")
+        print("5. Restaurează din bundle-uri")
+        
+        choice = input("\n🔢 Alege opțiunea (1-5): ").strip()
+        
+        if choice == '1':
+            target_dir = input("📁 Calea directorului (ex: /media/usb/backup): ").strip()
+            if target_dir:
+                result = bundle.set_target(target_dir)
+                print(("✅ " if result['success'] else "❌ ") + result['message'])
+            return
+        
+        if not bundle.target_dir:
+            print("❌ Configurează mai întâi directorul de backup (opțiunea 1)!")
+            return
+        
+        if choice == '2':
+            result = bundle.create()
+            print(("✅ " if result['success'] else "❌ ") + result['message'])
+            if result['success']:
+                print(f"💾 Scris: {format_size(result['bytes_written'])}")
+        
+        elif choice == '3':
+            summary = bundle.summary()
+            if not summary['bundles']:
+                print("⚠️  Nu există bundle-uri încă.")
+            for index, entry in enumerate(summary['bundles']):
+                print(f"  {index:>3}. {entry['created_at']}  {format_size(entry['bytes']):>10}  {entry['file']}")
+            print(f"\n📊 Total: {format_size(summary['total_bytes'])}")
+        
+        elif choice == '4':
+            result = bundle.verify()
+            for entry in result['bundles']:
+                status = "✅" if entry['valid'] else f"❌ {entry.get('error', '')}"
+                print(f"  {status} {entry['file']}")
+            print(("\n✅ " if result['success'] else "\n❌ ") + result['message'])
+        
+        elif choice == '5':
+            destination = input("📁 Directorul în care se restaurează (trebuie să fie gol): ").strip()
+            upto = input("🔢 Restaurează până la bundle-ul nr. (Enter = ultimul): ").strip()
+            if destination:
+                result = bundle.restore(destination, int(upto) if upto.isdigit() else None)
+                print(("✅ " if result['success'] else "❌ ") + result['message'])
+    
+    def activate_worktree(self, branch_or_path):
+        """Comută managerul în worktree-ul dat (creat la nevoie), fără checkout"""
+        result = WorktreeManager(self.project_path).switch(branch_or_path)
+        if result['success']:
+            self.project_path = result['path']
+            print(f"✅ {result['message']}")
+            print("💡 Fișierele celorlalte branch-uri au rămas neatinse în directoarele lor.")
+        else:
+            print(f"❌ {result['message']}")
+    
+    def manage_worktrees(self):
+        """
+        EXPLICAȚIE: git worktree
+        
+        Un worktree este un director de lucru suplimentar pentru un alt
+        branch al aceluiași repository. În loc să rescrie toate fișierele
+        la fiecare comutare (git checkout), fiecare branch își păstrează
+        propriul director, iar comutarea este instantă.
+        """
+        print("\n📂 WORKTREE-URI (BRANCH-URI ÎN DIRECTOARE SEPARATE)")
+        print("-" * 50)
+        
+        if not self.repo_initialized:
+            print("❌ Repository-ul nu este inițializat!")
+            return
+        
+        manager = WorktreeManager(self.project_path)
+        for worktree in manager.list_worktrees():
+            marker = "👉" if worktree['current'] else "  "
+            label = worktree['branch'] or f"HEAD detașat @ {worktree['head']}"
+            notes = []
+            if worktree['main']:
+                notes.append("principal")
+            if worktree['prunable']:
+                notes.append("director lipsă")
+            if worktree['locked']:
+                notes.append("blocat")
+            suffix = f" ({', '.join(notes)})" if notes else ""
+            print(f"{marker} 📂 {label}{suffix}\n      {worktree['path']}")
+        
+        print("\n🔧 Opțiuni:")
+        print("1. Comută pe un worktree (creat automat pentru branch, dacă lipsește)")
+        print("2. Creează branch nou într-un worktree separat")
+        print("3. Șterge un worktree")
+        print("4. Curăță worktree-urile al căror director a fost șters")
+        
+        choice = input("\n🔢 Alege opțiunea (1-4): ").strip()
+        
+        if choice == '1':
+            target = input("🌿 Branch-ul sau calea worktree-ului: ").strip()
+            if target:
+                self.activate_worktree(target)
+        
+        elif choice == '2':
+            branch_name = input("🌿 Numele branch-ului nou: ").strip()
+            if not branch_name:
+                print("❌ Numele nu poate fi gol!")
+                return
+            path = input(f"📁 Director (Enter = {manager.default_path(branch_name)}): ").strip()
+            result = manager.create(branch_name, path or None, new_branch=True, base='HEAD')
+            print(("✅ " if result['success'] else "❌ ") + result['message'])
+            if result['success'] and input("🔄 Comuți acum pe el? (y/n): ").lower() == 'y':
+                self.activate_worktree(branch_name)
+        
+        elif choice == '3':
+            target = input("🗑️  Branch-ul sau calea worktree-ului de șters: ").strip()
+            worktree = manager.find(target) if target else None
+            if not worktree:
+                print("❌ Worktree inexistent!")
+                return
+            if worktree['path'] == self.project_path:
+                print("❌ Comută pe alt worktree înainte de a-l șterge pe cel activ!")
+                return
+            result = manager.remove(target)
+            if not result['success'] and input("⚠️  Are modificări nesalvate. Forțezi ștergerea? (y/n): ").lower() == 'y':
+                result = manager.remove(target, force=True)
+            print(("✅ " if result['success'] else "❌ ") + result['message'])
+        
+        elif choice == '4':
+            result = manager.prune()
+            print(("✅ " if result['success'] else "❌ ") + result['message'])
+        
+        else:
+            print("❌ Opțiune invalidă!")
+    
+    def manage_sparse_checkout(self):
+        """
+        EXPLICAȚIE: Sparse checkout și partial clone
+        
+        Într-un repository foarte mare (monorepo) lucrezi de obicei doar în
+        câteva directoare. Partial clone descarcă fișierele doar când ai
+        nevoie de ele, iar sparse checkout păstrează pe disc doar
+        directoarele alese. Status-ul și backup-ul devin astfel rapide.
+        """
+        print("\n🧩 SPARSE CHECKOUT / PARTIAL CLONE")
+        print("-" * 40)
+        
+        sparse = SparseCheckoutManager(self.project_path)
+        
+        if self.repo_initialized:
+            info = sparse.get_info()
+            print(f"🧩 Sparse checkout: {'✅ activ' if info['enabled'] else '❌ inactiv'}")
+            print(f"☁️  Partial clone: {'✅ da' if info['partial_clone'] else '❌ nu'}")
+            if info['enabled']:
+                print("📁 Directoare în cone: " + (", ".join(info['directories']) or "doar rădăcina"))
+        
+        print("\n🔧 Opțiuni:")
+        print("1. Clonează un repository (partial clone + sparse)")
+        print("2. Activează sparse checkout pe acest repository")
+        print("3. Adaugă directoare")
+        print("4. Elimină directoare")
+        print("5. Dezactivează (working tree complet)")
+        
+        choice = input("\n🔢 Alege opțiunea (1-5): ").strip()
+        
+        if choice == '1':
+            url = input("🔗 URL-ul repository-ului: ").strip()
+            destination = input("📁 Directorul destinație: ").strip()
+            directories = input("📁 Directoare (separate prin spațiu, Enter = doar rădăcina): ").split()
+            if not url or not destination:
+                print("❌ URL-ul și destinația sunt obligatorii!")
+                return
+            print("⏳ Se clonează...")
+            result = sparse.clone(url, destination, directories)
+            print(("✅ " if result['success'] else "❌ ") + result['message'])
+            return
+        
+        if not self.repo_initialized:
+            print("❌ Repository-ul nu este inițializat!")
+            return
+        
+        if choice == '2':
+            directories = input("📁 Directoare (separate prin spațiu, Enter = doar rădăcina): ").split()
+            result = sparse.convert(directories)
+        elif choice == '3':
+            result = sparse.add(input("📁 Directoare de adăugat (separate prin spațiu): ").split())
+        elif choice == '4':
+            result = sparse.remove(input("📁 Directoare de eliminat (separate prin spațiu): ").split())
+        elif choice == '5':
+            result = sparse.disable()
+        else:
+            print("❌ Opțiune invalidă!")
+            return
+        
+        print(("✅ " if result['success'] else "❌ ") + result['message'])
+    
+    def manage_untracked_files(self):
+        """
+        EXPLICAȚIE: Fișiere neurmărite și .gitignore
+        
+        Git verifică la fiecare status (și la fiecare 'git add .') toate
+        fișierele care nu sunt în repository. Directoarele generate
+        (node_modules, build, dist) pot conține zeci de mii de fișiere și
+        încetinesc totul. Analiza le grupează, estimează cât timp costă
+        fiecare grup și propune reguli pentru .gitignore.
+        """
+        print("\n🧹 ANALIZA FIȘIERELOR NEURMĂRITE")
+        print("-" * 35)
+        
+        if not self.repo_initialized:
+            print("❌ Repository-ul nu este inițializat!")
+            return
+        
+        print("🔍 Se măsoară git status și se grupează fișierele neurmărite...")
+        analyzer = UntrackedAnalyzer(self.project_path)
+        report = analyzer.analyze()
+        timing = report['timing']
+        print(f"⏱️  git status: {timing['status_ms']} ms, parcurgerea fișierelor neurmărite: {timing['untracked_scan_ms']} ms")
+        print(f"📄 Fișiere neurmărite: {report['untracked_files']}")
+        
+        suggestions = report['suggestions']
+        if not suggestions:
+            print("✅ Nu există reguli de propus pentru .gitignore.")
+            return
+        
+        print("\n💡 Reguli propuse (ordonate după timpul estimat):")
+        for index, suggestion in enumerate(suggestions, 1):
+            print(f"{index:>3}. {suggestion['rule']:<30} ~{suggestion['cost_ms']} ms, {suggestion['files']} fișiere,"
+                  f" {format_size(suggestion['size'])} ({suggestion['reason']})")
+            print(f"       ↳ {', '.join(suggestion['paths'])}")
+        
+        choice = input("\n🔢 Regulile de adăugat (ex: 1,3 sau 'all', Enter pentru a anula): ").strip().lower()
+        if not choice:
+            print("❌ Operațiune anulată.")
+            return
+        
+        if choice == 'all':
+            rules = [suggestion['rule'] for suggestion in suggestions]
+        else:
+            try:
+                rules = [suggestions[int(item) - 1]['rule'] for item in choice.split(',') if item.strip()]
+            except (ValueError, IndexError):
+                print("❌ Selecție invalidă!")
+                return
+        
+        print("⏳ Se actualizează .gitignore și se măsoară din nou...")
+        result = analyzer.apply(rules)
+        if not result['success']:
+            print(f"❌ {result['message']}")
+            return
+        
+        print(f"✅ {result['message']}")
+        for rule in result['added']:
+            print(f"  + {rule}")
+        print(f"⏱️  git status: {result['before']['status_ms']} ms → {result['after']['status_ms']} ms")
+        print(f"⏱️  Fișiere neurmărite: {result['before']['untracked_scan_ms']} ms → {result['after']['untracked_scan_ms']} ms")
     
     def show_main_menu(self):
         """Afișează meniul principal al aplicației"""
@@ -1126,6 +1771,13 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
                 print("🆘 11. Restaurare de urgență")
                 print("📁 12. Vizualizează structura proiectului")
                 print("🎓 13. Ghid complet Git")
+                print("📈 14. Statistici repository")
+                print("📦 15. Analiza fișierelor mari")
+                print("💽 16. Backup offline (bundle)")
+                print("🔄 17. Fetch de la toate remote-urile")
+                print("🧩 18. Sparse checkout / partial clone")
+                print("📂 19. Worktree-uri (comutare fără checkout)")
+                print("🧹 20. Analiza fișierelor neurmărite (.gitignore)")
                 print("❌ 0.  Ieșire")
                 
                 choice = input("\n🔢 Alege opțiunea: ").strip()
@@ -1156,6 +1808,20 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
                     self.show_project_structure()
                 elif choice == '13':
                     self.show_help()
+                elif choice == '14':
+                    self.show_repository_analytics()
+                elif choice == '15':
+                    self.show_bloat_analysis()
+                elif choice == '16':
+                    self.manage_bundle_backups()
+                elif choice == '17':
+                    self.fetch_all_remotes()
+                elif choice == '18':
+                    self.manage_sparse_checkout()
+                elif choice == '19':
+                    self.manage_worktrees()
+                elif choice == '20':
+                    self.manage_untracked_files()
                 elif choice == '0':
                     print("\n👋 Proiectul tău este sigur cu Git! La revedere!")
                     break
@@ -1166,6 +1832,11 @@ Acest script automatizează toate aceste operații pentru tine! 🚀
 
 def main():
     """Funcția principală care pornește aplicația"""
+    # Cu argumente: mod non-interactiv (scripturi, cron, CI), fără meniu
+    if len(sys.argv) > 1:
+        from git_cli import run_cli
+        sys.exit(run_cli(sys.argv[1:], GitManager))
+
     try:
         print("🔧 Se inițializează Git Manager...")
         manager = GitManager()
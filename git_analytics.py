@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Motor de statistici pentru repository
+Istoricul este citit o singură dată cu 'git log --numstat -z' într-o bază
+SQLite locală; rulările următoare adaugă doar commit-urile noi, iar
+interogările (churn, activitate pe autori, creștere) rulează pe SQLite.
+Într-un partial clone, --numstat ar descărca toate blob-urile istorice, deci
+sunt indexate doar commit-urile (fără statistici pe fișiere).
+"""
+
+import os
+import sqlite3
+import subprocess
+import threading
+from datetime import datetime, timezone
+
+from git_governor import governor, run_process
+from git_sparse import SparseCheckoutManager
+from git_state import state_dir
+
+# Separatori folosiți în formatul log-ului (nu apar în nume sau email-uri)
+RECORD_SEP = '\x1e'
+FIELD_SEP = '\x1f'
+LOG_FORMAT = '%x1e%H%x1f%an%x1f%ae%x1f%at'
+
+BATCH_SIZE = 1000
+READ_CHUNK = 64 * 1024
+
+_sync_lock = threading.Lock()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    hash TEXT PRIMARY KEY,
+    author TEXT NOT NULL,
+    email TEXT NOT NULL,
+    ts INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    hash TEXT NOT NULL,
+    path TEXT NOT NULL,
+    added INTEGER NOT NULL,
+    deleted INTEGER NOT NULL,
+    binary INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_changes_path ON changes(path);
+CREATE INDEX IF NOT EXISTS idx_changes_hash ON changes(hash);
+CREATE INDEX IF NOT EXISTS idx_commits_ts ON commits(ts);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def iter_numstat_records(stream):
+    """
+    Parcurge incremental ieșirea 'git log --numstat -z'.
+
+    Produce tupluri (commit, changes), unde commit = (hash, autor, email, ts)
+    iar changes = listă de (path, added, deleted, binary). Nu se citește
+    niciodată întreaga ieșire în memorie, doar câte un bloc de READ_CHUNK.
+    """
+    buffer = b''
+    current = None
+    changes = []
+    pending = None  # (added, deleted, binary, [căi rename]) în așteptare
+
+    def tokens():
+        nonlocal buffer
+        while True:
+            chunk = stream.read(READ_CHUNK)
+            if not chunk:
+                break
+            buffer += chunk
+            parts = buffer.split(b'\0')
+            buffer = parts.pop()
+            for part in parts:
+                yield part.decode('utf-8', errors='replace')
+        if buffer:
+            yield buffer.decode('utf-8', errors='replace')
+
+    for token in tokens():
+        if pending is not None:
+            # Rename: "added\tdeleted\t" urmat de cale veche și cale nouă
+            pending[3].append(token)
+            if len(pending[3]) == 2:
+                added, deleted, binary, paths = pending
+                changes.append((paths[1], added, deleted, binary))
+                pending = None
+            continue
+
+        token = token.lstrip('\n')
+        if token.startswith(RECORD_SEP):
+            if current is not None:
+                yield current, changes
+            fields = token[1:].split(FIELD_SEP)
+            if len(fields) < 4:
+                current = None
+                changes = []
+                continue
+            current = (fields[0], fields[1], fields[2], int(fields[3] or 0))
+            changes = []
+            continue
+
+        if not token or current is None:
+            continue
+
+        parts = token.split('\t', 2)
+        if len(parts) != 3:
+            continue
+
+        binary = parts[0] == '-' or parts[1] == '-'
+        added = 0 if binary else int(parts[0])
+        deleted = 0 if binary else int(parts[1])
+
+        if parts[2]:
+            changes.append((parts[2], added, deleted, int(binary)))
+        else:
+            pending = (added, deleted, int(binary), [])
+
+    if current is not None:
+        yield current, changes
+
+
+class RepoAnalytics:
+    """Index local de statistici pentru un repository Git"""
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+        self.db_path = os.path.join(state_dir(project_path), 'analytics.sqlite3')
+
+    def connect(self):
+        connection = sqlite3.connect(self.db_path)
+        connection.executescript(SCHEMA)
+        return connection
+
+    def _git(self, args):
+        return run_process(['git'] + args, self.project_path)
+
+    def _get_meta(self, connection, key):
+        row = connection.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, connection, key, value):
+        connection.execute(
+            'INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value)
+        )
+
+    def sync(self):
+        """
+        Aduce indexul la zi cu HEAD.
+
+        Dacă ultimul HEAD indexat este strămoș al HEAD-ului curent, se citesc
+        doar commit-urile noi (last..HEAD). Dacă istoricul a fost rescris,
+        indexul este reconstruit de la zero.
+        """
+        head_result = self._git(['rev-parse', '--verify', '-q', 'HEAD'])
+        if head_result.returncode != 0:
+            return {'success': True, 'new_commits': 0, 'message': 'Nu există commit-uri încă'}
+        head = head_result.stdout.strip()
+
+        with _sync_lock:
+            connection = self.connect()
+            try:
+                last_head = self._get_meta(connection, 'last_head')
+                if last_head == head:
+                    return {'success': True, 'new_commits': 0, 'message': 'Statisticile sunt la zi'}
+
+                rev_range = head
+                if last_head:
+                    ancestor = self._git(['merge-base', '--is-ancestor', last_head, head])
+                    if ancestor.returncode == 0:
+                        rev_range = f'{last_head}..{head}'
+                    else:
+                        connection.execute('DELETE FROM changes')
+                        connection.execute('DELETE FROM commits')
+
+                partial = SparseCheckoutManager(self.project_path).is_partial_clone()
+                count, error = self._ingest(connection, rev_range, numstat=not partial)
+                if error:
+                    # last_head rămâne neschimbat: commit-urile sunt citite din nou la următorul sync
+                    connection.rollback()
+                    return {'success': False, 'new_commits': 0, 'message': f'Eroare la citirea istoricului: {error}'}
+                self._set_meta(connection, 'last_head', head)
+                connection.commit()
+            finally:
+                connection.close()
+
+        message = f'{count} commit-uri noi indexate'
+        if partial:
+            message += ' (partial clone: fără statistici pe fișiere)'
+        return {'success': True, 'new_commits': count, 'message': message}
+
+    def _ingest(self, connection, rev_range, numstat=True):
+        """Citește commit-urile din rev_range; returnează (număr, eroare sau None)"""
+        command = ['git', 'log', '-z', f'--format={LOG_FORMAT}', rev_range]
+        if numstat:
+            command[2:2] = ['--numstat', '-M']
+        # Citirea întregului istoric poate dura: timeout-ul de mentenanță, nu cel de citire
+        timeout = governor.timeouts['maintenance']
+        if governor.acquire(self.project_path, 'read') is None:
+            return 0, 'Prea multe procese git în așteptare'
+
+        count = 0
+        commit_rows = []
+        change_rows = []
+        timed_out = threading.Event()
+        try:
+            try:
+                process = governor.popen(command, self.project_path, governor.environment(False, None), False,
+                                         subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            except OSError as e:
+                return 0, str(e)
+
+            def expire():
+                timed_out.set()
+                governor.record_timeout('read')
+                governor.terminate(process)
+
+            timer = threading.Timer(timeout, expire)
+            timer.daemon = True
+            timer.start()
+            try:
+                for commit, changes in iter_numstat_records(process.stdout):
+                    commit_rows.append(commit)
+                    change_rows.extend((commit[0], path, added, deleted, binary)
+                                       for path, added, deleted, binary in changes)
+                    count += 1
+                    if len(commit_rows) >= BATCH_SIZE:
+                        self._flush(connection, commit_rows, change_rows)
+                self._flush(connection, commit_rows, change_rows)
+            except BaseException:
+                governor.terminate(process)
+                raise
+            finally:
+                timer.cancel()
+                process.stdout.close()
+                returncode = process.wait()
+                governor.forget(process)
+        finally:
+            governor.release(self.project_path)
+
+        if timed_out.is_set():
+            return count, f'Timeout după {timeout}s'
+        if returncode != 0:
+            return count, f'Cod de ieșire {returncode}'
+        return count, None
+
+    def _flush(self, connection, commit_rows, change_rows):
+        connection.executemany(
+            'INSERT OR IGNORE INTO commits (hash, author, email, ts) VALUES (?, ?, ?, ?)',
+            commit_rows
+        )
+        connection.executemany(
+            'INSERT INTO changes (hash, path, added, deleted, binary) VALUES (?, ?, ?, ?, ?)',
+            change_rows
+        )
+        commit_rows.clear()
+        change_rows.clear()
+
+    def top_churned_paths(self, limit=20):
+        """Fișierele cu cele mai multe linii adăugate + șterse"""
+        self.sync()
+        connection = self.connect()
+        try:
+            rows = connection.execute("""
+                SELECT path, SUM(added + deleted) AS churn, SUM(added), SUM(deleted),
+                       COUNT(DISTINCT hash)
+                FROM changes
+                GROUP BY path
+                ORDER BY churn DESC
+                LIMIT ?
+            """, (limit,)).fetchall()
+        finally:
+            connection.close()
+
+        return [
+            {'path': path, 'churn': churn, 'added': added, 'deleted': deleted, 'commits': commits}
+            for path, churn, added, deleted, commits in rows
+        ]
+
+    def commits_per_author_week(self, weeks=12):
+        """Numărul de commit-uri pe autor pentru fiecare din ultimele săptămâni"""
+        self.sync()
+        connection = self.connect()
+        try:
+            newest = connection.execute('SELECT MAX(ts) FROM commits').fetchone()[0]
+            if newest is None:
+                return []
+            since = newest - weeks * 7 * 24 * 3600
+            rows = connection.execute("""
+                SELECT author, strftime('%Y-W%W', ts, 'unixepoch') AS week, COUNT(*)
+                FROM commits
+                WHERE ts > ?
+                GROUP BY author, week
+                ORDER BY week, author
+            """, (since,)).fetchall()
+        finally:
+            connection.close()
+
+        return [{'author': author, 'week': week, 'commits': commits} for author, week, commits in rows]
+
+    def file_size_growth(self, path=None):
+        """
+        Evoluția dimensiunii (în linii) pe săptămâni, pentru tot proiectul
+        sau doar pentru un fișier / director.
+        """
+        self.sync()
+        query = """
+            SELECT strftime('%Y-W%W', c.ts, 'unixepoch') AS week, SUM(ch.added - ch.deleted)
+            FROM changes ch JOIN commits c ON c.hash = ch.hash
+        """
+        params = ()
+        if path:
+            path = path.strip('/')
+            query += ' WHERE ch.path = ? OR ch.path LIKE ?'
+            params = (path, path + '/%')
+        query += ' GROUP BY week ORDER BY week'
+
+        connection = self.connect()
+        try:
+            rows = connection.execute(query, params).fetchall()
+        finally:
+            connection.close()
+
+        growth = []
+        total = 0
+        for week, delta in rows:
+            total += delta
+            growth.append({'week': week, 'delta': delta, 'lines': total})
+        return growth
+
+    def summary(self):
+        """Totaluri rapide pentru afișare"""
+        self.sync()
+        connection = self.connect()
+        try:
+            commits, authors, first_ts, last_ts = connection.execute(
+                'SELECT COUNT(*), COUNT(DISTINCT author), MIN(ts), MAX(ts) FROM commits'
+            ).fetchone()
+            files = connection.execute('SELECT COUNT(DISTINCT path) FROM changes').fetchone()[0]
+        finally:
+            connection.close()
+
+        def fmt(ts):
+            if ts is None:
+                return None
+            return datetime.fromtimestamp(ts, tz=timezone.utc).strftime('%Y-%m-%d')
+
+        return {
+            'commits': commits,
+            'authors': authors,
+            'files': files,
+            'first_commit': fmt(first_ts),
+            'last_commit': fmt(last_ts)
+        }
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Pipeline pentru fișierele statice ale interfeței web
+static/style.css și static/script.js sunt minificate și copiate în
+static/dist/ cu hash-ul conținutului în nume (style.<hash>.css), împreună
+cu variantele precomprimate .gz și .br (brotli, dacă pachetul este
+instalat). Fișierele din dist/ nu se schimbă niciodată sub același nume,
+deci sunt servite cu Cache-Control: immutable.
+
+Regulile CSS necesare primei afișări (header-ul terminalului, secțiunile,
+butoanele) sunt extrase separat și puse direct în pagină; restul foii de
+stil se încarcă fără să blocheze afișarea.
+
+Build manual: python git_assets.py (aplicația web îl rulează și singură
+când sursele sunt mai noi decât manifestul).
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import sys
+import threading
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ASSETS = ('style.css', 'script.js')
+DIST_DIR = 'dist'
+MANIFEST = 'manifest.json'
+
+# Un an: numele fișierului se schimbă odată cu conținutul
+CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Ordinea de preferință a variantelor precomprimate
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+# Selectori (începutul lor) pentru elementele vizibile la prima afișare
+CRITICAL_SELECTORS = (
+    ':root', '*', 'body', '.terminal-', '.btn-close', '.btn-minimize', '.btn-maximize', '#current-path',
+    '.section-header', '.status-grid', '.loading', '.command-grid', '.cmd-', '.console-', '.prompt',
+    '.output', '.timestamp', '.modal'
+)
+# Stări care nu contează la prima afișare
+DEFERRED_PSEUDO = re.compile(r':(hover|focus|active|checked|disabled)')
+
+_CSS_TOKENS = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+_JS_WORD = re.compile(r'[\w$]')
+# După aceste caractere (sau cuvinte), '/' începe o expresie regulată, nu o împărțire
+_JS_REGEX_AFTER = set('(,=:[!&|?{};+-*%<>~^')
+_JS_REGEX_KEYWORDS = ('return', 'typeof', 'case', 'void', 'delete', 'in', 'of')
+
+
+def minify_css(source):
+    """Elimină comentariile și spațiile inutile (șirurile rămân neschimbate)"""
+    parts = []
+    code = ''
+    position = 0
+    for match in _CSS_TOKENS.finditer(source):
+        code += source[position:match.start()]
+        if match.group(1):
+            parts.extend((_compact_css(code), match.group(1)))
+            code = ''
+        position = match.end()
+    parts.append(_compact_css(code + source[position:]))
+    return ''.join(parts).replace(';}', '}').strip()
+
+
+def _compact_css(text):
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r' ?([{};,>]) ?', r'\1', text)
+    return re.sub(r': ', ':', text)
+
+
+def minify_js(source):
+    """
+    Minificare conservatoare: fără comentarii și fără indentare. Sfârșiturile
+    de linie rămân (inserarea automată de ';'), iar șirurile, template
+    literal-urile și expresiile regulate sunt copiate neschimbate.
+    """
+    out = []
+    stack = []          # '{' pentru acolade din cod, '${' pentru expresii din template literal
+    i, n = 0, len(source)
+
+    def last_code():
+        for chunk in reversed(out):
+            stripped = chunk.rstrip()
+            if stripped:
+                return stripped
+        return ''
+
+    def copy_string(start, quote):
+        j = start + 1
+        while j < n and source[j] != quote:
+            j += 2 if source[j] == '\\' else 1
+        return j + 1
+
+    def copy_template(start):
+        # Până la '`' final sau până la '${' (codul din expresie este minificat normal)
+        j = start
+        while j < n:
+            if source[j] == '\\':
+                j += 2
+            elif source[j] == '`':
+                return j + 1, False
+            elif source.startswith('${', j):
+                return j + 2, True
+            else:
+                j += 1
+        return n, False
+
+    while i < n:
+        c = source[i]
+        if c in '"\'':
+            end = copy_string(i, c)
+            out.append(source[i:end])
+            i = end
+        elif c == '`' or (c == '}' and stack and stack[-1] == '${'):
+            if c == '}':
+                stack.pop()
+            end, expression = copy_template(i + 1)
+            out.append(source[i:end])
+            if expression:
+                stack.append('${')
+            i = end
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            i = n if end == -1 else end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+        elif c == '/' and _regex_allowed(last_code()):
+            j, in_class = i + 1, False
+            while j < n and (source[j] != '/' or in_class) and source[j] != '\n':
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] in '[]':
+                    in_class = source[j] == '['
+                j += 1
+            j += 1
+            while j < n and source[j].isalpha():
+                j += 1
+            out.append(source[i:j])
+            i = j
+        elif c.isspace():
+            j = i
+            while j < n and source[j].isspace():
+                j += 1
+            previous = out[-1][-1] if out and out[-1] else ''
+            following = source[j] if j < n else ''
+            if '\n' in source[i:j]:
+                if previous and previous != '\n':
+                    out.append('\n')
+            elif previous and following and (
+                    (_JS_WORD.match(previous) and _JS_WORD.match(following)) or
+                    (previous == following and previous in '+-')):
+                out.append(' ')
+            i = j
+        else:
+            if c == '{':
+                stack.append('{')
+            elif c == '}' and stack:
+                stack.pop()
+            out.append(c)
+            i += 1
+    return ''.join(out).strip() + '\n'
+
+
+def _regex_allowed(previous):
+    if not previous:
+        return True
+    if previous[-1] in _JS_REGEX_AFTER:
+        return True
+    return any(previous.endswith(word) and not _JS_WORD.match(previous[-len(word) - 1:-len(word)] or ' ')
+               for word in _JS_REGEX_KEYWORDS)
+
+
+def critical_css(css):
+    """Regulile de nivel superior (fără @media/@keyframes) pentru elementele de la prima afișare"""
+    rules = []
+    depth = 0
+    start = 0
+    for match in re.finditer(r'[{}]', css):
+        if match.group() == '{':
+            if depth == 0:
+                selector_start = start
+                body_start = match.end()
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0:
+            selectors = css[selector_start:body_start - 1].strip()
+            if not selectors.startswith('@') and all(
+                    _is_critical(selector) for selector in selectors.split(',')):
+                rules.append(css[selector_start:match.end()].strip())
+            start = match.end()
+    return ''.join(rules)
+
+
+def _is_critical(selector):
+    selector = selector.strip()
+    return not DEFERRED_PSEUDO.search(selector) and selector.startswith(CRITICAL_SELECTORS)
+
+
+def _write(path, data):
+    temporary = f'{path}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+
+def build_assets(static_dir):
+    """Minifică, adaugă hash-ul în nume, precomprimă; returnează manifestul"""
+    dist = os.path.join(static_dir, DIST_DIR)
+    os.makedirs(dist, exist_ok=True)
+    manifest_path = os.path.join(dist, MANIFEST)
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+
+    manifest = {'files': {}, 'critical_css': '', 'sources': {}}
+    for name in ASSETS:
+        source_path = os.path.join(static_dir, name)
+        with open(source_path, encoding='utf-8') as f:
+            source = f.read()
+        minified = minify_css(source) if name.endswith('.css') else minify_js(source)
+        if name.endswith('.css'):
+            manifest['critical_css'] = critical_css(minified)
+
+        data = minified.encode('utf-8')
+        stem, extension = os.path.splitext(name)
+        hashed = f'{stem}.{hashlib.sha256(data).hexdigest()[:12]}{extension}'
+        target = os.path.join(dist, hashed)
+        if not os.path.exists(target):
+            _write(target, data)
+            _write(target + '.gz', gzip.compress(data, 9, mtime=0))
+            if brotli is not None:
+                _write(target + '.br', brotli.compress(data, quality=11))
+        manifest['files'][name] = hashed
+        manifest['sources'][name] = os.stat(source_path).st_mtime_ns
+
+    # Versiunea anterioară rămâne pentru paginile deja deschise; restul sunt șterse
+    keep = {MANIFEST} | set(manifest['files'].values()) | set(previous.get('files', {}).values())
+    for entry in os.listdir(dist):
+        base = entry[:-3] if entry.endswith(('.gz', '.br')) else entry
+        if base not in keep:
+            os.remove(os.path.join(dist, entry))
+
+    _write(manifest_path, json.dumps(manifest, indent=2).encode('utf-8'))
+    return manifest
+
+
+class AssetPipeline:
+    """Manifestul fișierelor statice pentru template-uri și servirea variantelor comprimate"""
+
+    def __init__(self, static_dir, url_prefix='/static'):
+        self.static_dir = static_dir
+        self.url_prefix = url_prefix
+        self.dist = os.path.join(static_dir, DIST_DIR)
+        self.manifest = None
+        self.lock = threading.Lock()
+
+    def _stale(self):
+        for name in ASSETS:
+            try:
+                if os.stat(os.path.join(self.static_dir, name)).st_mtime_ns != self.manifest['sources'].get(name):
+                    return True
+            except OSError:
+                return False
+        return False
+
+    def current(self):
+        """Manifestul actual, reconstruit dacă sursele s-au schimbat (None dacă build-ul nu este posibil)"""
+        with self.lock:
+            if self.manifest is None:
+                try:
+                    with open(os.path.join(self.dist, MANIFEST), encoding='utf-8') as f:
+                        self.manifest = json.load(f)
+                except (OSError, ValueError):
+                    self.manifest = {'files': {}, 'critical_css': '', 'sources': {}}
+            if self._stale():
+                try:
+                    self.manifest = build_assets(self.static_dir)
+                except OSError:
+                    # Director static read-only: se folosesc fișierele originale
+                    pass
+            return self.manifest
+
+    def url(self, name):
+        hashed = self.current()['files'].get(name)
+        return f'{self.url_prefix}/{DIST_DIR}/{hashed}' if hashed else f'{self.url_prefix}/{name}'
+
+    def template_context(self):
+        manifest = self.current()
+        return {'asset_url': self.url, 'critical_css': manifest['critical_css'] if manifest['files'] else ''}
+
+    def lookup(self, filename, accept_encoding=''):
+        """
+        (cale, mimetype, header-e) pentru un fișier din dist/, preferând
+        varianta precomprimată acceptată de client; None dacă nu există.
+        """
+        if os.path.basename(filename) != filename or filename == MANIFEST:
+            return None
+        path = os.path.join(self.dist, filename)
+        if not os.path.isfile(path):
+            return None
+
+        accepted = {item.split(';')[0].strip() for item in accept_encoding.split(',')}
+        headers = {'Cache-Control': CACHE_CONTROL, 'Vary': 'Accept-Encoding'}
+        for encoding, suffix in ENCODINGS:
+            if encoding in accepted and os.path.isfile(path + suffix):
+                headers['Content-Encoding'] = encoding
+                path += suffix
+                break
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        return path, mimetype, headers
+
+
+if __name__ == '__main__':
+    static_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+    manifest = build_assets(static_dir)
+    for name, hashed in manifest['files'].items():
+        source = os.path.getsize(os.path.join(static_dir, name))
+        target = os.path.join(static_dir, DIST_DIR, hashed)
+        sizes = [f'{os.path.getsize(target)} B minificat']
+        for encoding, suffix in ENCODINGS:
+            if os.path.exists(target + suffix):
+                sizes.append(f'{os.path.getsize(target + suffix)} B {encoding}')
+        print(f"✅ {name} ({source} B) → {DIST_DIR}/{hashed}: {', '.join(sizes)}")
+    print(f"✅ CSS critic: {len(manifest['critical_css'])} B inclus în pagină")
+    if brotli is None:
+        print("ℹ️  Fără variante .br (pip install brotli)")
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Analiza obiectelor mari și a pachetelor
+'git rev-list --objects' este conectat direct (pipe) la un singur proces
+'git cat-file --batch-check', iar rezultatul este citit linie cu linie.
+În memorie se păstrează doar primele N blob-uri (heap), indiferent de
+numărul total de obiecte din repository.
+"""
+
+import heapq
+import os
+import subprocess
+import threading
+
+from git_governor import governor, run_process
+from git_state import git_common_dir
+
+BATCH_FORMAT = '%(objectname) %(objecttype) %(objectsize) %(objectsize:disk) %(rest)'
+
+# Pragul peste care un fișier trimis pe server este semnalat
+LARGE_BLOB_THRESHOLD = 10 * 1024 * 1024
+
+# Verificarea dinaintea push-ului / backup-ului: fără branch-uri remote parcurge tot istoricul
+OUTGOING_TIMEOUT = 30
+
+
+def format_size(size):
+    """Formatează o dimensiune în bytes pentru afișare"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024 or unit == 'GB':
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+
+
+class BloatAnalyzer:
+    """Detectează blob-urile mari și starea pachetelor dintr-un repository"""
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+        # True dacă ultima parcurgere a fost oprită (timeout sau coadă plină), deci rezultatul este parțial
+        self.incomplete = False
+
+    def iter_objects(self, revisions, timeout=None):
+        """
+        Produce (oid, tip, dimensiune, dimensiune_pe_disc, cale) pentru toate
+        obiectele accesibile din revisions, fără a încărca lista în memorie.
+        Pipeline-ul ocupă un loc la guvernator; timeout (secunde) îl oprește.
+        """
+        self.incomplete = False
+        if governor.acquire(self.project_path, 'read') is None:
+            self.incomplete = True
+            return
+
+        try:
+            env = governor.environment(False, None)
+            try:
+                rev_list = governor.popen(['git', 'rev-list', '--objects'] + list(revisions), self.project_path,
+                                          env, False, subprocess.DEVNULL,
+                                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            except OSError:
+                self.incomplete = True
+                return
+            try:
+                cat_file = governor.popen(['git', 'cat-file', f'--batch-check={BATCH_FORMAT}', '--buffer'],
+                                          self.project_path, env, False, rev_list.stdout,
+                                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            except OSError:
+                self.incomplete = True
+                governor.terminate(rev_list)
+                rev_list.wait()
+                governor.forget(rev_list)
+                return
+            # cat-file este singurul cititor al pipe-ului
+            rev_list.stdout.close()
+
+            def expire():
+                self.incomplete = True
+                governor.record_timeout('read')
+                governor.terminate(rev_list)
+                governor.terminate(cat_file)
+
+            timer = threading.Timer(timeout, expire) if timeout else None
+            if timer is not None:
+                timer.daemon = True
+                timer.start()
+            try:
+                for raw_line in cat_file.stdout:
+                    parts = raw_line.decode('utf-8', errors='replace').rstrip('\n').split(' ', 4)
+                    if len(parts) < 4 or parts[1] == 'missing':
+                        continue
+                    path = parts[4] if len(parts) == 5 else ''
+                    yield parts[0], parts[1], int(parts[2]), int(parts[3]), path
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                cat_file.stdout.close()
+                cat_file.wait()
+                rev_list.wait()
+                governor.forget(cat_file)
+                governor.forget(rev_list)
+        finally:
+            governor.release(self.project_path)
+
+    def largest_blobs(self, limit=20, revisions=('--all',)):
+        """Returnează (top blob-uri, statistici pe tip de obiect)"""
+        heap = []
+        seen_top = set()
+        totals = {}
+
+        for oid, obj_type, size, disk_size, path in self.iter_objects(revisions):
+            stats = totals.setdefault(obj_type, {'count': 0, 'size': 0, 'disk_size': 0})
+            stats['count'] += 1
+            stats['size'] += size
+            stats['disk_size'] += disk_size
+
+            if obj_type != 'blob' or oid in seen_top:
+                continue
+
+            entry = (size, oid, path, disk_size)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+                seen_top.add(oid)
+            elif size > heap[0][0]:
+                removed = heapq.heappushpop(heap, entry)
+                seen_top.discard(removed[1])
+                seen_top.add(oid)
+
+        blobs = [
+            {'oid': oid, 'path': path, 'size': size, 'disk_size': disk_size}
+            for size, oid, path, disk_size in sorted(heap, reverse=True)
+        ]
+        return blobs, totals
+
+    def find_introducing_commits(self, oids):
+        """
+        Găsește commit-ul care a introdus fiecare blob.
+
+        Un singur 'git log --raw' parcurge istoricul de la cel mai nou la cel
+        mai vechi commit; ultima potrivire găsită este cea mai veche.
+        """
+        targets = set(oids)
+        found = {}
+        if not targets:
+            return found
+
+        process = subprocess.Popen(
+            ['git', 'log', '--all', '--raw', '--root', '--no-abbrev', '--no-renames',
+             '--format=%x1e%H %s'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.project_path
+        )
+
+        current = None
+        try:
+            for raw_line in process.stdout:
+                line = raw_line.decode('utf-8', errors='replace').rstrip('\n')
+                if line.startswith('\x1e'):
+                    commit_hash, _, subject = line[1:].partition(' ')
+                    current = {'hash': commit_hash, 'short': commit_hash[:7], 'subject': subject}
+                elif line.startswith(':') and current is not None:
+                    fields = line[1:].split('\t', 1)[0].split(' ')
+                    if len(fields) >= 4 and fields[3] in targets and fields[2] != fields[3]:
+                        found[fields[3]] = current
+        finally:
+            process.stdout.close()
+            process.wait()
+
+        return found
+
+    def pack_statistics(self):
+        """Statistici despre obiectele loose și pachete ('git count-objects -v')"""
+        result = run_process(['git', 'count-objects', '-v'], self.project_path)
+
+        stats = {}
+        for line in result.stdout.strip().split('\n'):
+            if ':' in line:
+                key, value = line.split(':', 1)
+                value = value.strip()
+                stats[key.strip()] = int(value) if value.isdigit() else value
+
+        packs = []
+        pack_dir = os.path.join(git_common_dir(self.project_path), 'objects', 'pack')
+        if os.path.isdir(pack_dir):
+            for name in sorted(os.listdir(pack_dir)):
+                if name.endswith('.pack'):
+                    packs.append({
+                        'name': name,
+                        'size': os.path.getsize(os.path.join(pack_dir, name))
+                    })
+        packs.sort(key=lambda pack: pack['size'], reverse=True)
+
+        return {
+            'loose_objects': stats.get('count', 0),
+            'loose_size': stats.get('size', 0) * 1024,
+            'packed_objects': stats.get('in-pack', 0),
+            'pack_count': stats.get('packs', 0),
+            'pack_size': stats.get('size-pack', 0) * 1024,
+            'prune_packable': stats.get('prune-packable', 0),
+            'garbage': stats.get('garbage', 0),
+            'packs': packs
+        }
+
+    def analyze(self, limit=20, with_commits=True):
+        """Raport complet: cele mai mari blob-uri + statistici de pachete"""
+        blobs, totals = self.largest_blobs(limit)
+
+        if with_commits:
+            commits = self.find_introducing_commits(blob['oid'] for blob in blobs)
+            for blob in blobs:
+                blob['commit'] = commits.get(blob['oid'])
+
+        return {
+            'largest_blobs': blobs,
+            'objects': totals,
+            'pack': self.pack_statistics()
+        }
+
+    def outgoing_large_blobs(self, threshold=LARGE_BLOB_THRESHOLD, timeout=OUTGOING_TIMEOUT):
+        """
+        Blob-urile mai mari decât pragul care ar fi trimise la următorul push
+        (accesibile din HEAD, dar nu din niciun branch remote). Rulează înaintea
+        fiecărui push / backup, deci este limitată la timeout secunde.
+        """
+        large = []
+        for oid, obj_type, size, disk_size, path in self.iter_objects(['HEAD', '--not', '--remotes'], timeout):
+            if obj_type == 'blob' and size >= threshold:
+                large.append({'oid': oid, 'path': path, 'size': size})
+        large.sort(key=lambda blob: blob['size'], reverse=True)
+        return large
+
+    def outgoing_warnings(self, threshold=LARGE_BLOB_THRESHOLD):
+        """Mesaje de avertizare pentru fișierele mari care urmează să fie trimise"""
+        warnings = [
+            f"Fișier mare trimis pe server: {blob['path'] or blob['oid'][:10]} ({format_size(blob['size'])})"
+            for blob in self.outgoing_large_blobs(threshold)
+        ]
+        if self.incomplete:
+            warnings.append('Verificarea fișierelor mari a fost oprită înainte de final (istoric prea mare)')
+        return warnings
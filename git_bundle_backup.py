@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Backup incremental în fișiere bundle
+Fiecare rulare scrie un 'git bundle' care conține doar obiectele apărute
+după vârfurile (tips) salvate în bundle-ul anterior. Un manifest.json în
+directorul țintă păstrează lanțul de bundle-uri, necesar la verificare și
+la restaurare.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from git_governor import run_process
+
+MANIFEST_NAME = 'manifest.json'
+CONFIG_KEY = 'gitmanager.bundleDir'
+REF_PATTERNS = ['refs/heads', 'refs/tags']
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BundleBackup:
+    """Backup offline într-un director local sau pe un disc montat"""
+
+    def __init__(self, project_path, target_dir=None):
+        self.project_path = project_path
+        self.target_dir = target_dir or self.configured_target()
+
+    def _git(self, args, cwd=None, input_text=None):
+        return run_process(['git'] + args, cwd or self.project_path, input_text)
+
+    # --- Configurare ---
+
+    def configured_target(self):
+        result = self._git(['config', '--get', CONFIG_KEY])
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
+
+    def set_target(self, target_dir):
+        target_dir = os.path.abspath(os.path.expanduser(target_dir.strip()))
+        try:
+            os.makedirs(target_dir, exist_ok=True)
+        except OSError as e:
+            return {'success': False, 'message': f'Nu se poate crea directorul: {e}'}
+
+        result = self._git(['config', CONFIG_KEY, target_dir])
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare: {result.stderr}'}
+
+        self.target_dir = target_dir
+        return {'success': True, 'message': f'Backup-urile bundle vor fi scrise în {target_dir}'}
+
+    # --- Manifest ---
+
+    def manifest_path(self):
+        return os.path.join(self.target_dir, MANIFEST_NAME)
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path(), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'repository': os.path.basename(os.path.abspath(self.project_path)), 'bundles': []}
+
+    def save_manifest(self, manifest):
+        tmp_path = self.manifest_path() + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path())
+
+    # --- Backup ---
+
+    def current_refs(self):
+        result = self._git(['for-each-ref', '--format=%(objectname) %(refname)'] + REF_PATTERNS)
+        refs = {}
+        for line in result.stdout.strip().split('\n'):
+            if line:
+                oid, ref = line.split(' ', 1)
+                refs[ref] = oid
+        return refs
+
+    def create(self):
+        """Scrie un bundle nou cu obiectele apărute după ultimul bundle"""
+        if not self.target_dir:
+            return {'success': False, 'message': 'Nu este configurat un director pentru bundle-uri'}
+        os.makedirs(self.target_dir, exist_ok=True)
+
+        refs = self.current_refs()
+        if not refs:
+            return {'success': False, 'message': 'Nu există commit-uri de salvat'}
+
+        manifest = self.load_manifest()
+        previous = manifest['bundles'][-1]['refs'] if manifest['bundles'] else {}
+        if previous == refs:
+            return {'success': True, 'message': 'Bundle-ul este deja la zi', 'bytes_written': 0}
+
+        # Vârfurile anterioare care încă există local devin prerechizite
+        basis = []
+        if previous:
+            check = self._git(['cat-file', '--batch-check=%(objectname)'],
+                              input_text=''.join(oid + '\n' for oid in set(previous.values())))
+            basis = [line for line in check.stdout.split('\n') if line and not line.endswith('missing')]
+
+        head = self._git(['symbolic-ref', '-q', 'HEAD']).stdout.strip() or None
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        filename = f"{manifest['repository']}-{timestamp}-{len(manifest['bundles']) + 1:04d}.bundle"
+        path = os.path.join(self.target_dir, filename)
+        tmp_path = path + '.tmp'
+
+        # Argumentele rev-list sunt trimise prin stdin (pot fi mii de vârfuri)
+        rev_args = ''.join(ref + '\n' for ref in refs) + ''.join(f'^{oid}\n' for oid in basis)
+        result = self._git(['bundle', 'create', '-q', tmp_path, '--stdin'], input_text=rev_args)
+        if result.returncode != 0:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if 'empty bundle' in result.stderr:
+                return {'success': True, 'message': 'Nu există obiecte noi de salvat', 'bytes_written': 0}
+            return {'success': False, 'message': f'Eroare la crearea bundle-ului: {result.stderr.strip()}'}
+
+        verify = self._git(['bundle', 'verify', '-q', tmp_path])
+        if verify.returncode != 0:
+            os.remove(tmp_path)
+            return {'success': False, 'message': f'Bundle invalid: {verify.stderr.strip()}'}
+
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+        manifest['bundles'].append({
+            'file': filename,
+            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'head': head,
+            'refs': refs,
+            'prerequisites': basis,
+            'bytes': size,
+            'sha256': file_sha256(path)
+        })
+        self.save_manifest(manifest)
+
+        return {
+            'success': True,
+            'message': f'Bundle creat: {filename}',
+            'file': filename,
+            'bytes_written': size
+        }
+
+    # --- Verificare ---
+
+    def verify(self):
+        """Verifică integritatea (sha256) și conectivitatea fiecărui bundle din lanț"""
+        if not self.target_dir:
+            return {'success': False, 'message': 'Nu este configurat un director pentru bundle-uri'}
+
+        results = []
+        for bundle in self.load_manifest()['bundles']:
+            path = os.path.join(self.target_dir, bundle['file'])
+            entry = {'file': bundle['file'], 'valid': False}
+            if not os.path.exists(path):
+                entry['error'] = 'Fișier lipsă'
+            elif file_sha256(path) != bundle['sha256']:
+                entry['error'] = 'Checksum diferit (fișier corupt)'
+            else:
+                result = self._git(['bundle', 'verify', '-q', path])
+                entry['valid'] = result.returncode == 0
+                if not entry['valid']:
+                    entry['error'] = result.stderr.strip()
+            results.append(entry)
+
+        valid = all(entry['valid'] for entry in results)
+        return {
+            'success': valid,
+            'message': 'Toate bundle-urile sunt valide' if valid else 'Există bundle-uri invalide',
+            'bundles': results
+        }
+
+    # --- Restaurare ---
+
+    def restore(self, destination, upto=None):
+        """
+        Recreează repository-ul în destination aplicând lanțul de bundle-uri
+        (opțional doar până la bundle-ul cu indexul upto, inclusiv).
+        """
+        if not self.target_dir:
+            return {'success': False, 'message': 'Nu este configurat un director pentru bundle-uri'}
+
+        bundles = self.load_manifest()['bundles']
+        if upto is not None:
+            bundles = bundles[:upto + 1]
+        if not bundles:
+            return {'success': False, 'message': 'Nu există bundle-uri de restaurat'}
+
+        destination = os.path.abspath(os.path.expanduser(destination))
+        if os.path.exists(destination) and os.listdir(destination):
+            return {'success': False, 'message': 'Directorul destinație nu este gol'}
+
+        result = self._git(['init', '-q', destination])
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare: {result.stderr.strip()}'}
+
+        for bundle in bundles:
+            path = os.path.join(self.target_dir, bundle['file'])
+            result = self._git(
+                ['fetch', '-q', '--update-head-ok', path,
+                 '+refs/heads/*:refs/heads/*', '+refs/tags/*:refs/tags/*'],
+                cwd=destination
+            )
+            if result.returncode != 0:
+                return {'success': False, 'message': f'Eroare la {bundle["file"]}: {result.stderr.strip()}'}
+
+        head = bundles[-1].get('head')
+        if head:
+            self._git(['symbolic-ref', 'HEAD', head], cwd=destination)
+            self._git(['reset', '-q', '--hard'], cwd=destination)
+
+        return {
+            'success': True,
+            'message': f'Repository restaurat în {destination} din {len(bundles)} bundle-uri',
+            'destination': destination
+        }
+
+    def summary(self):
+        manifest = self.load_manifest() if self.target_dir else {'bundles': []}
+        return {
+            'success': True,
+            'target': self.target_dir,
+            'bundles': manifest['bundles'],
+            'total_bytes': sum(bundle['bytes'] for bundle in manifest['bundles'])
+        }
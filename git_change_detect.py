@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Detectarea rapidă a modificărilor pentru backup
+După fiecare backup se salvează un snapshot cu datele stat() ale fișierelor
+urmărite și ale directoarelor lor. La următorul backup, snapshot-ul este
+comparat direct în Python (fără 'git status'): dacă nimic nu s-a schimbat,
+backup-ul se oprește imediat; altfel 'git add' primește doar căile modificate.
+"""
+
+import json
+import os
+import time
+
+from git_governor import run_process
+from git_sparse import SparseCheckoutManager
+from git_state import git_dir, worktree_state_dir
+
+SNAPSHOT_VERSION = 1
+
+# Modificările făcute în aceeași secundă cu snapshot-ul sunt tratate ca
+# "racy" (ca în git) și verificate din nou, nu considerate neschimbate
+RACY_WINDOW_NS = 1_000_000_000
+
+# 'git ls-files' nu acceptă --pathspec-from-file: pathspec-urile sunt date ca argumente, pe loturi
+PATHSPEC_BATCH = 1000
+
+
+def _stat_key(path):
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+class ChangeDetector:
+    """Snapshot persistent al stării working tree-ului folosit de backup"""
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+        # Fiecare worktree are propriul index și deci propriul snapshot
+        self.snapshot_path = os.path.join(worktree_state_dir(project_path), 'backup_snapshot.json')
+
+    def _git(self, args, input_data=None):
+        return run_process(['git'] + args, self.project_path, input_data, text=False)
+
+    def _head(self):
+        result = self._git(['rev-parse', '--verify', '-q', 'HEAD'])
+        return result.stdout.decode().strip() if result.returncode == 0 else None
+
+    def _index_stat(self):
+        return _stat_key(os.path.join(git_dir(self.project_path), 'index'))
+
+    def _abs(self, rel_path):
+        return os.path.join(self.project_path, *rel_path.split('/')) if rel_path else self.project_path
+
+    def _list_paths(self, paths=None):
+        """
+        Fișierele urmărite + cele neurmărite și neignorate (ls-files), limitate
+        la căile date sau, cu sparse-checkout activ, la directoarele din cone.
+        """
+        if paths is not None:
+            pathspecs = [f':(top,literal){path}' for path in paths]
+        else:
+            pathspecs = SparseCheckoutManager(self.project_path).pathspecs()
+        return self._ls_files(['--cached', '--others', '--exclude-standard'], pathspecs)
+
+    def _ls_files(self, args, pathspecs=None):
+        """Căile listate de 'git ls-files -z' sau None dacă o rulare eșuează"""
+        if pathspecs is None:
+            batches = [[]]
+        else:
+            batches = [pathspecs[i:i + PATHSPEC_BATCH] for i in range(0, len(pathspecs), PATHSPEC_BATCH)]
+        paths = {}
+        for batch in batches:
+            result = self._git(['ls-files', '-z'] + args + (['--'] + batch if batch else []))
+            if result.returncode != 0:
+                return None
+            paths.update(dict.fromkeys(path for path in
+                                       result.stdout.decode('utf-8', errors='surrogateescape').split('\0') if path))
+        return list(paths)
+
+    def load(self):
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if snapshot.get('version') != SNAPSHOT_VERSION:
+            return None
+        return snapshot
+
+    def _save(self, snapshot):
+        snapshot['version'] = SNAPSHOT_VERSION
+        snapshot['taken_ns'] = time.time_ns()
+        snapshot['head'] = self._head()
+        snapshot['index'] = self._index_stat()
+        tmp_path = self.snapshot_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, separators=(',', ':'))
+        os.replace(tmp_path, self.snapshot_path)
+
+    def _record(self, snapshot, paths):
+        files = snapshot['files']
+        dirs = snapshot['dirs']
+        for path in paths:
+            key = _stat_key(self._abs(path))
+            if key is None:
+                continue
+            files[path] = key
+            parent = path.rpartition('/')[0]
+            while parent not in dirs:
+                dirs[parent] = _stat_key(self._abs(parent))
+                if not parent:
+                    break
+                parent = parent.rpartition('/')[0]
+
+    def _subdirectories(self, directory, known):
+        """Subdirectoarele unui director care nu sunt încă urmărite în snapshot"""
+        prefix = directory + '/' if directory else ''
+        try:
+            with os.scandir(self._abs(directory)) as entries:
+                return [prefix + entry.name for entry in entries
+                        if entry.is_dir(follow_symlinks=False) and prefix + entry.name not in known
+                        and prefix + entry.name != '.git']
+        except OSError:
+            return []
+
+    def _record_dirs(self, snapshot, candidates):
+        """
+        Urmărește și directoarele fără fișiere listate (goale sau doar cu
+        fișiere ignorate), recursiv: un fișier nou creat în ele schimbă
+        mtime-ul directorului și este găsit de detect(). Directoarele
+        ignorate nu sunt parcurse.
+        """
+        dirs = snapshot['dirs']
+        while candidates:
+            found = []
+            for directory in self._filter_ignored(candidates):
+                key = _stat_key(self._abs(directory))
+                if key is not None and directory not in dirs:
+                    dirs[directory] = key
+                    found.extend(self._subdirectories(directory, dirs))
+            candidates = found
+
+    def refresh(self):
+        """Reconstruiește snapshot-ul complet (după un backup sau un status complet)"""
+        paths = self._list_paths()
+        if paths is None:
+            return False
+        snapshot = {'files': {}, 'dirs': {'': _stat_key(self.project_path)}}
+        self._record(snapshot, paths)
+        dirs = snapshot['dirs']
+        self._record_dirs(snapshot, [path for directory in list(dirs)
+                                     for path in self._subdirectories(directory, dirs)])
+        self._save(snapshot)
+        return True
+
+    def update(self, changed_paths):
+        """Actualizează snapshot-ul doar pentru căile modificate"""
+        snapshot = self.load()
+        if snapshot is None:
+            return self.refresh()
+
+        paths = self._list_paths(changed_paths)
+        if paths is None:
+            return self.refresh()
+
+        files = snapshot['files']
+        dirs = snapshot['dirs']
+        for path in changed_paths:
+            files.pop(path, None)
+            prefix = path + '/'
+            for stale in [name for name in files if name.startswith(prefix)]:
+                del files[stale]
+        self._record(snapshot, paths)
+        self._record_dirs(snapshot, [path for path in changed_paths
+                                     if path not in dirs and os.path.isdir(self._abs(path))])
+
+        # Directoarele modificate primesc noul mtime; cele dispărute sunt eliminate
+        for directory in list(dirs):
+            key = _stat_key(self._abs(directory))
+            if key is None:
+                del dirs[directory]
+            else:
+                dirs[directory] = key
+        self._save(snapshot)
+        return True
+
+    def detect(self):
+        """
+        Returnează lista căilor modificate față de snapshot ([] = nicio
+        modificare) sau None dacă snapshot-ul nu poate fi folosit (lipsește,
+        HEAD sau index-ul s-au schimbat) și trebuie făcut un status complet.
+        """
+        snapshot = self.load()
+        if snapshot is None:
+            return None
+        if snapshot.get('head') != self._head() or snapshot.get('index') != self._index_stat():
+            return None
+
+        racy_limit = snapshot['taken_ns'] - RACY_WINDOW_NS
+        files = snapshot['files']
+        changed = []
+
+        for path, key in files.items():
+            current = _stat_key(self._abs(path))
+            if current != key or current[0] >= racy_limit:
+                changed.append(path)
+
+        # Un director cu mtime schimbat are intrări noi sau șterse
+        new_entries = []
+        for directory, key in snapshot['dirs'].items():
+            current = _stat_key(self._abs(directory))
+            if current is None or current[0] == key[0]:
+                continue
+            prefix = directory + '/' if directory else ''
+            try:
+                with os.scandir(self._abs(directory)) as entries:
+                    for entry in entries:
+                        rel_path = prefix + entry.name
+                        if rel_path == '.git' or rel_path in files or rel_path in snapshot['dirs']:
+                            continue
+                        new_entries.append(rel_path)
+            except OSError:
+                continue
+
+        if new_entries:
+            changed.extend(self._filter_ignored(new_entries))
+
+        return changed
+
+    def _filter_ignored(self, paths):
+        """Elimină căile ignorate de .gitignore (un singur 'git check-ignore')"""
+        result = self._git(
+            ['check-ignore', '--stdin', '-z'],
+            b''.join(path.encode('utf-8', errors='surrogateescape') + b'\0' for path in paths)
+        )
+        ignored = set(result.stdout.decode('utf-8', errors='surrogateescape').split('\0'))
+        return [path for path in paths if path not in ignored]
+
+    def add_paths(self, paths):
+        """'git add -A' limitat la căile date (transmise prin stdin, fără limită de argumente)"""
+        result = self._git(
+            ['add', '-A', '--pathspec-from-file=-', '--pathspec-file-nul'],
+            b''.join(f':(top,literal){path}'.encode('utf-8', errors='surrogateescape') + b'\0'
+                     for path in paths)
+        )
+        error = result.stderr.decode('utf-8', errors='replace') if result.returncode else None
+        return result.returncode == 0, error
+
+    def tracked_paths(self, paths):
+        """Căile din listă aflate în index (restul sunt fișiere sau directoare noi)"""
+        listed = self._ls_files(['--cached'], [f':(top,literal){path}' for path in paths])
+        return set(listed or ()) & set(paths)
+
+    def has_staged_changes(self):
+        return self._git(['diff', '--cached', '--quiet']).returncode == 1
@@ -0,0 +1,825 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Mod non-interactiv (scripting, cron, CI)
+Fiecare acțiune din meniu are o comandă echivalentă, fără input() și fără
+ecranele de introducere. Rezultatul este text sau JSON (--json), iar codul
+de ieșire este 0 la succes și 1 la eroare. Cu --batch, comenzile dintr-un
+fișier rulează una după alta în același proces.
+
+Exemple:
+    python "Git Manager.py" status --json
+    python "Git Manager.py" backup --no-confirm
+    python "Git Manager.py" history --limit 500 --format ndjson
+    python "Git Manager.py" --batch comenzi.txt --json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shlex
+import sys
+from datetime import datetime
+
+from git_analytics import RepoAnalytics
+from git_bloat import BloatAnalyzer, format_size
+from git_bundle_backup import BundleBackup
+from git_change_detect import ChangeDetector
+from git_core import LOG_FORMAT, get_core, parse_log_records
+from git_fetch_scheduler import BranchTracking, format_divergence
+from git_maintenance import MaintenanceScheduler
+from git_manager_daemon import DaemonClient, daemon_status, start_daemon, stop_daemon
+from git_output import CapturedOutput, run_captured
+from git_precommit import PrecommitPipeline
+from git_remotes import DEFAULT_TIMEOUT, RemoteManager
+from git_snapshot import SnapshotBackup
+from git_sparse import SparseCheckoutManager
+from git_submodules import SubmoduleManager
+from git_untracked import UntrackedAnalyzer
+from git_worktrees import WorktreeManager
+
+STATUS_NAMES = {'??': 'untracked', 'A': 'added', 'D': 'deleted', 'R': 'renamed', 'M': 'modified'}
+
+# Comenzile care nu modifică repository-ul (restul golesc cache-ul daemon-ului)
+READ_COMMANDS = {'cmd_status', 'cmd_history', 'cmd_branches', 'cmd_tree', 'cmd_analytics', 'cmd_bloat',
+                 'cmd_submodules', 'cmd_core', 'cmd_daemon'}
+
+
+class CommandError(Exception):
+    """Eroare de utilizare a unei comenzi (mesajul este afișat, codul de ieșire este 1)"""
+
+
+class ScriptRunner:
+    """Execută comenzile non-interactive pe un GitManager creat fără verificările inițiale"""
+
+    def __init__(self, manager, daemon=None):
+        self.manager = manager
+        self.daemon = daemon
+
+    @property
+    def project_path(self):
+        return self.manager.project_path
+
+    def git(self, command):
+        return self.manager.run_git_command(command, False)
+
+    @property
+    def core(self):
+        return get_core(self.project_path)
+
+    def daemon_query(self, name, fresh=False, **params):
+        """Răspunsul din cache-ul daemon-ului, sau None dacă daemon-ul nu rulează"""
+        if self.daemon is None:
+            return None
+        return self.daemon.query(self.project_path, name, fresh=fresh, **params)
+
+    def cached(self, name, command, fresh=False, **params):
+        """Răspunsul din cache-ul daemon-ului (dacă rulează), altfel comanda rulată direct"""
+        result = self.daemon_query(name, fresh, **params)
+        if result is not None:
+            return result['success'], result['output'], result['error']
+        return self.git(command() if callable(command) else command)
+
+    def require_repo(self):
+        if not self.manager.check_git_repo():
+            raise CommandError('Repository nu este inițializat')
+
+    def current_branch(self):
+        result = self.daemon_query('branch')
+        if result is not None:
+            return (result['output'] or '').strip() if result['success'] else ''
+        return self.core.current_branch() or ''
+
+    @staticmethod
+    def result(success, message, **data):
+        return {'success': success, 'message': message, **data}
+
+    def confirm(self, args, question):
+        """Confirmarea este posibilă doar într-un terminal; altfel cere flag-ul explicit"""
+        if getattr(args, 'no_confirm', False) or getattr(args, 'yes', False):
+            return True
+        if not sys.stdin.isatty():
+            raise CommandError('Mod non-interactiv: folosește --no-confirm / --yes pentru a confirma')
+        return input(f"{question} (y/n): ").strip().lower() == 'y'
+
+    # --- Status / fișiere ---
+
+    def parse_status(self, output):
+        """Parsează 'git status --porcelain -z' (numele pot conține spații sau caractere speciale)"""
+        files = []
+        entries = iter(output.split('\0'))
+        for entry in entries:
+            if not entry:
+                continue
+            code, name = entry[:2], entry[3:]
+            if code == '??':
+                state = STATUS_NAMES['??']
+            else:
+                letter = code[0] if code[0] != ' ' else code[1]
+                state = STATUS_NAMES.get(letter, 'unknown')
+            item = {'name': name, 'code': code, 'status': state, 'staged': code[0] not in (' ', '?')}
+            if code[0] in ('R', 'C'):
+                item['from'] = next(entries, '')
+            files.append(item)
+        return files
+
+    def cmd_status(self, args):
+        self.require_repo()
+        lite = self.core.status_lite() if args.lite else None
+        if lite is not None:
+            # Direct din .git/index: fără fișiere netrasate și fără submodule
+            files = self.parse_status(''.join(f"{item['code']} {item['path']}\0" for item in lite))
+            return self.result(True, 'Working tree curat' if not files else f'{len(files)} fișiere modificate',
+                               branch=self.current_branch(), files=files, lite=True)
+
+        success, output, error = self.cached(
+            'status', lambda: ['git', 'status', '--porcelain', '-z'] + self.manager.status_pathspecs(), nul=True
+        )
+        if not success:
+            return self.result(False, f'Eroare: {error}')
+
+        files = self.parse_status(output or '')
+        result = self.result(True, 'Working tree curat' if not files else f'{len(files)} fișiere modificate',
+                             branch=self.current_branch(), files=files)
+        submodules = SubmoduleManager(self.project_path)
+        if submodules.has_submodules():
+            result['submodules'] = submodules.status()
+        return result
+
+    def cmd_init(self, args):
+        if self.manager.check_git_repo():
+            return self.result(False, 'Repository deja inițializat')
+        success, _, error = self.git(['git', 'init'])
+        if not success:
+            return self.result(False, f'Eroare: {error}')
+        if not args.no_gitignore:
+            # Mesajele metodei interactive nu trebuie să ajungă în output-ul JSON
+            with contextlib.redirect_stdout(sys.stderr):
+                self.manager.create_gitignore()
+        self.manager.repo_initialized = True
+        return self.result(True, 'Repository inițializat cu succes')
+
+    def cmd_add(self, args):
+        self.require_repo()
+        paths = args.paths or ['.']
+        success, _, error = self.git(['git', 'add', '--'] + paths)
+        if not success:
+            return self.result(False, f'Eroare: {error}')
+        return self.result(True, 'Fișiere adăugate cu succes', paths=paths)
+
+    def cmd_commit(self, args):
+        self.require_repo()
+        if not args.message.strip():
+            raise CommandError('Mesajul nu poate fi gol')
+
+        message = args.message
+        if not args.no_timestamp:
+            message = f"{message} [{datetime.now().strftime('%Y-%m-%d %H:%M')}]"
+        if args.all:
+            # Echivalentul 'commit -a', dar verificările văd conținutul care intră în commit
+            success, _, error = self.git(['git', 'add', '-u'])
+            if not success:
+                return self.result(False, f'Eroare: {error}')
+        if not args.no_verify:
+            checks = PrecommitPipeline(self.project_path).run()
+            if not checks['success']:
+                return checks
+        success, _, error = self.git(['git', 'commit', '-m', message])
+        if not success:
+            return self.result(False, f'Eroare la commit: {error}')
+
+        _, hash_output, _ = self.git(['git', 'rev-parse', '--short', 'HEAD'])
+        return self.result(True, 'Commit realizat cu succes', hash=(hash_output or '').strip(), full_message=message)
+
+    def cmd_history(self, args):
+        self.require_repo()
+        if args.format == 'text':
+            command = ['git', 'log', '--oneline', '--graph', '--decorate', f'-{args.limit}']
+            if args.skip:
+                command.append(f'--skip={args.skip}')
+            success, output, error = self.git(command)
+            if not success:
+                return self.result(False, f'Eroare: {error}')
+            return self.result(True, 'Istoric', lines=(output or '').rstrip('\n').split('\n'))
+
+        result = self.daemon_query('history', format=LOG_FORMAT, limit=args.limit, skip=args.skip)
+        if result is not None:
+            if not result['success']:
+                return self.result(False, f"Eroare: {result['error']}")
+            commits = parse_log_records(result['output'])
+        else:
+            commits = self.core.log(args.limit, args.skip)
+            if commits is None:
+                return self.result(False, 'Eroare: istoricul nu poate fi citit')
+        return self.result(True, f'{len(commits)} commit-uri', commits=commits)
+
+    # --- Branch-uri / worktree-uri ---
+
+    def cmd_branches(self, args):
+        self.require_repo()
+        result = self.daemon_query('branches', format='%(HEAD)%(refname:short)')
+        if result is not None:
+            if not result['success']:
+                return self.result(False, f"Eroare: {result['error']}")
+            branches = [{'name': line[1:], 'current': line[0] == '*'}
+                        for line in (result['output'] or '').split('\n') if line]
+        else:
+            branches = self.core.branches()
+            if branches is None:
+                return self.result(False, 'Eroare: branch-urile nu pot fi citite')
+        worktrees = {w['branch']: w['path'] for w in WorktreeManager(self.project_path).list_worktrees() if w['branch']}
+        tracking = BranchTracking().get(self.project_path) or {}
+        for branch in branches:
+            branch['worktree'] = worktrees.get(branch['name'])
+            info = tracking.get(branch['name'], {})
+            branch.update({key: info.get(key) for key in ('upstream', 'ahead', 'behind', 'gone')})
+        current = next((branch['name'] for branch in branches if branch['current']), None)
+        return self.result(True, f'{len(branches)} branch-uri', branches=branches, current=current)
+
+    def cmd_branch(self, args):
+        self.require_repo()
+        if args.worktree:
+            result = WorktreeManager(self.project_path).create(args.name, new_branch=True, base='HEAD')
+            if result['success']:
+                return self.switch_worktree(args.name)
+            return result
+        success, _, error = self.git(['git', 'checkout', '-b', args.name])
+        if not success:
+            return self.result(False, f'Eroare: {error}')
+        return self.result(True, f'Branch {args.name} creat și activat')
+
+    def switch_worktree(self, target):
+        result = WorktreeManager(self.project_path).switch(target)
+        if result['success']:
+            self.manager.project_path = result['path']
+        return result
+
+    def cmd_switch(self, args):
+        self.require_repo()
+        if args.worktree or WorktreeManager(self.project_path).find(args.name):
+            return self.switch_worktree(args.name)
+        success, _, error = self.git(['git', 'checkout', args.name])
+        if not success:
+            return self.result(False, f'Eroare: {error}')
+        return self.result(True, f'Comutat pe branch-ul {args.name}')
+
+    def cmd_worktree(self, args):
+        self.require_repo()
+        manager = WorktreeManager(self.project_path)
+        if args.action == 'list':
+            worktrees = manager.list_worktrees()
+            return self.result(True, f'{len(worktrees)} worktree-uri', worktrees=worktrees)
+        if args.action == 'create':
+            return manager.create(args.target, args.dir, args.new)
+        if args.action == 'switch':
+            return self.switch_worktree(args.target)
+        if args.action == 'remove':
+            return manager.remove(args.target, args.force)
+        return manager.prune()
+
+    # --- Remote-uri ---
+
+    def cmd_remote(self, args):
+        self.require_repo()
+        manager = RemoteManager(self.project_path)
+        if args.action == 'list':
+            remotes = manager.list_remotes()
+            return self.result(True, f'{len(remotes)} remote-uri', remotes=remotes)
+        if args.action == 'add':
+            if not args.url:
+                raise CommandError('URL-ul este obligatoriu: remote add NUME URL')
+            return manager.add_or_update(args.name, args.url)
+        return manager.remove(args.name)
+
+    def push(self, remotes=None, first_push=False, timeout=DEFAULT_TIMEOUT):
+        manager = RemoteManager(self.project_path)
+        names = remotes or manager.remote_names()
+        if not names:
+            return self.result(False, 'Nu este configurat repository remote')
+        return manager.push_all(self.current_branch() or 'main', names, first_push, timeout)
+
+    def cmd_push(self, args):
+        self.require_repo()
+        # Avertismentele se calculează înainte de push (după push nu mai există commit-uri de trimis)
+        warnings = BloatAnalyzer(self.project_path).outgoing_warnings()
+        result = self.push(args.remote, args.first, args.timeout)
+        result['warnings'] = warnings
+        return result
+
+    def cmd_pull(self, args):
+        self.require_repo()
+        success, output, error = self.git(['git', 'pull'])
+        if not success:
+            return self.result(False, f'Eroare: {error}')
+        if 'Already up to date' in (output or ''):
+            return self.result(True, 'Proiectul este deja la zi')
+        return self.result(True, 'Modificări descărcate și combinate')
+
+    def cmd_fetch(self, args):
+        self.require_repo()
+        return RemoteManager(self.project_path).fetch_all(args.remote, args.timeout)
+
+    # --- Backup / restaurare ---
+
+    def cmd_backup(self, args):
+        self.require_repo()
+        message = args.message or f"Backup automat - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        backup = SnapshotBackup(self.project_path)
+        if args.snapshot or backup.is_default():
+            return self.snapshot_backup(backup, args, message)
+        detector = ChangeDetector(self.project_path)
+        changed = detector.detect()
+
+        submodules = SubmoduleManager(self.project_path)
+        submodule_status = submodules.status() if submodules.has_submodules() else []
+        if any(entry['dirty'] for entry in submodule_status):
+            changed = None
+
+        pathspecs = self.manager.status_pathspecs()
+        if changed is None:
+            success, output, error = self.git(['git', 'status', '--porcelain', '-z'] + pathspecs)
+            if not success:
+                return self.result(False, f'Nu se poate verifica status-ul: {error}')
+            files = [entry['name'] for entry in self.parse_status(output or '')]
+            if not files:
+                detector.refresh()
+        else:
+            files = changed
+
+        if not files:
+            return self.result(True, 'Nu există modificări de salvat', committed=False)
+        if not self.confirm(args, f"{len(files)} fișiere modificate. Continui cu backup-ul?"):
+            return self.result(False, 'Backup anulat', committed=False)
+
+        warnings = []
+        submodule_result = None
+        if any(entry['dirty'] for entry in submodule_status):
+            submodule_result = submodules.backup(message, push=not args.no_push, statuses=submodule_status)
+            if not submodule_result['success']:
+                warnings.append(submodule_result['message'])
+
+        if changed is None:
+            add_command = ['git', 'add', '-A'] + pathspecs if pathspecs else ['git', 'add', '.']
+            success, _, error = self.git(add_command)
+        else:
+            success, error = detector.add_paths(changed)
+        if not success:
+            return self.result(False, f'Eroare la adăugare: {error}', committed=False)
+        # Fișierele atinse (mtime nou) dar neschimbate nu ajung în staging: nu e o eroare
+        if changed is not None and not detector.has_staged_changes():
+            detector.update(changed)
+            return self.result(True, 'Nu există modificări de salvat', committed=False)
+
+        if not args.no_verify:
+            checks = PrecommitPipeline(self.project_path).run()
+            if not checks['success']:
+                return dict(checks, committed=False)
+
+        success, _, error = self.git(['git', 'commit', '-m', message])
+        if not success:
+            return self.result(False, f'Eroare la commit: {error}', committed=False)
+        if changed is None:
+            detector.refresh()
+        else:
+            detector.update(changed)
+
+        bundle = BundleBackup(self.project_path)
+        bundle_result = bundle.create() if bundle.target_dir else None
+        if bundle_result and not bundle_result['success']:
+            warnings.append(bundle_result['message'])
+
+        push_result = None
+        if not args.no_push and RemoteManager(self.project_path).remote_names():
+            warnings += BloatAnalyzer(self.project_path).outgoing_warnings()
+            push_result = self.push(timeout=args.timeout)
+            if not push_result['success']:
+                warnings.append(push_result['message'])
+
+        if push_result and push_result['success']:
+            summary = 'Backup complet realizat (local + server)'
+        elif push_result:
+            summary = 'Backup local realizat (eroare la push)'
+        else:
+            summary = 'Backup local realizat'
+        return self.result(True, summary, committed=True, commit_message=message, files=len(files),
+                           bundle=bundle_result, push=push_result, submodules=submodule_result, warnings=warnings)
+
+    def snapshot_backup(self, backup, args, message):
+        # Index-ul temporar nu atinge staging area, deci nu este nevoie de confirmare pentru fișiere
+        check = None if args.no_verify else (lambda env: PrecommitPipeline(self.project_path, env=env).run())
+        result = backup.create(message, check=check)
+        if not result['success'] or not result.get('committed'):
+            return dict(result, committed=False)
+
+        warnings = []
+        push_result = None
+        if not args.no_push and RemoteManager(self.project_path).remote_names():
+            push_result = backup.push(result['ref'])
+            if not push_result['success']:
+                warnings.append(push_result['message'])
+        summary = f"Snapshot salvat în {result['ref']} ({result['commit'][:8]})" + (
+            ' și trimis pe server' if push_result and push_result['success'] else '')
+        return self.result(True, summary, committed=True, commit_message=message, snapshot=result,
+                           push=push_result, warnings=warnings)
+
+    def cmd_restore(self, args):
+        self.require_repo()
+        if args.action == 'diff':
+            # Diff-ul poate fi uriaș: rămâne pe disc și este afișat în bucăți
+            diff = run_captured(['git', 'diff', '--'] + ([args.file] if args.file else []), self.project_path)
+            if not diff.success:
+                diff.close()
+                return self.result(False, f'Eroare: {diff.error}')
+            return self.result(True, 'Diferențe' if diff.size else 'Nu există diferențe', diff=diff)
+
+        if args.action == 'file':
+            if not args.file:
+                raise CommandError('Fișierul este obligatoriu: restore file CALE')
+            if not self.confirm(args, f"Modificările din '{args.file}' se vor PIERDE. Continui?"):
+                return self.result(False, 'Restaurare anulată')
+            success, _, error = self.git(['git', 'checkout', '--', args.file])
+            return self.result(success, f'{args.file} a fost restaurat' if success else f'Eroare: {error}')
+
+        if not self.confirm(args, "Toate modificările nesalvate se vor PIERDE. Continui?"):
+            return self.result(False, 'Restaurare anulată')
+        success, _, error = self.git(['git', 'reset', '--hard', 'HEAD'])
+        return self.result(success, 'Toate fișierele au fost restaurate la ultimul commit' if success
+                           else f'Eroare: {error}')
+
+    def cmd_bundle(self, args):
+        self.require_repo()
+        bundle = BundleBackup(self.project_path)
+        if args.action == 'target':
+            if not args.value:
+                raise CommandError('Directorul este obligatoriu: bundle target DIR')
+            return bundle.set_target(args.value)
+        if not bundle.target_dir:
+            return self.result(False, 'Nu este configurat un director pentru bundle-uri')
+        if args.action == 'create':
+            return bundle.create()
+        if args.action == 'list':
+            summary = bundle.summary()
+            return self.result(True, f"{len(summary['bundles'])} bundle-uri", **summary)
+        if args.action == 'verify':
+            return bundle.verify()
+        if not args.value:
+            raise CommandError('Destinația este obligatorie: bundle restore DEST')
+        return bundle.restore(args.value, args.upto)
+
+    # --- Informații ---
+
+    def cmd_tree(self, args):
+        sparse = SparseCheckoutManager(self.project_path)
+        cone = sparse.directories() if self.manager.check_git_repo() and sparse.is_enabled() else None
+        entries = []
+
+        def walk(path, depth):
+            if depth >= args.depth:
+                return
+            try:
+                items = sorted(os.scandir(path), key=lambda entry: (not entry.is_dir(), entry.name))
+            except OSError:
+                return
+            for item in items:
+                if item.name.startswith('.'):
+                    continue
+                rel_path = os.path.relpath(item.path, self.project_path).replace(os.sep, '/')
+                if item.is_dir():
+                    if not SparseCheckoutManager.in_cone(rel_path, cone):
+                        continue
+                    entries.append({'name': item.name, 'path': rel_path, 'type': 'dir', 'depth': depth})
+                    walk(item.path, depth + 1)
+                else:
+                    entries.append({'name': item.name, 'path': rel_path, 'type': 'file', 'depth': depth})
+
+        walk(self.project_path, 0)
+        return self.result(True, os.path.basename(self.project_path) + '/', entries=entries)
+
+    def cmd_analytics(self, args):
+        self.require_repo()
+        analytics = RepoAnalytics(self.project_path)
+        sync = analytics.sync()
+        if args.report == 'churn':
+            data = analytics.top_churned_paths(args.limit)
+        elif args.report == 'authors':
+            data = analytics.commits_per_author_week(args.limit)
+        elif args.report == 'growth':
+            data = analytics.file_size_growth(args.file)
+        else:
+            data = analytics.summary()
+        return self.result(sync['success'], sync['message'], report=args.report, data=data)
+
+    def cmd_bloat(self, args):
+        self.require_repo()
+        report = BloatAnalyzer(self.project_path).analyze(args.limit, not args.no_commits)
+        return self.result(True, 'Analiza fișierelor mari', **report)
+
+    def cmd_untracked(self, args):
+        self.require_repo()
+        analyzer = UntrackedAnalyzer(self.project_path)
+        if args.action == 'apply':
+            rules = list(args.rule or [])
+            if args.all:
+                rules += [suggestion['rule'] for suggestion in analyzer.analyze()['suggestions']]
+            if not rules:
+                raise CommandError('Folosire: untracked apply --rule REGULĂ [--rule ...] sau --all')
+            result = analyzer.apply(rules)
+            if result['success']:
+                result['lines'] = [f"  + {rule}" for rule in result['added']] + [
+                    f"  git status: {result['before']['status_ms']} ms → {result['after']['status_ms']} ms",
+                    f"  fișiere neurmărite: {result['before']['untracked_scan_ms']} ms → "
+                    f"{result['after']['untracked_scan_ms']} ms"]
+            return result
+
+        report = analyzer.analyze()
+        report['lines'] = [
+            f"  ~{suggestion['cost_ms']:>8} ms  {suggestion['files']:>7} fișiere  {format_size(suggestion['size']):>10}"
+            f"  {suggestion['rule']}  ({suggestion['reason']})"
+            for suggestion in report['suggestions']]
+        return report
+
+    def cmd_sparse(self, args):
+        sparse = SparseCheckoutManager(self.project_path)
+        if args.action == 'clone':
+            if len(args.values) < 2:
+                raise CommandError('Folosire: sparse clone URL DEST [DIRECTOARE...]')
+            result = sparse.clone(args.values[0], args.values[1], args.values[2:])
+            if result['success']:
+                self.manager.project_path = result['destination']
+            return result
+
+        self.require_repo()
+        if args.action == 'list':
+            return self.result(True, 'Sparse checkout', **sparse.get_info())
+        if args.action == 'enable':
+            return sparse.convert(args.values)
+        if args.action == 'add':
+            return sparse.add(args.values)
+        if args.action == 'remove':
+            return sparse.remove(args.values)
+        return sparse.disable()
+
+    def cmd_submodules(self, args):
+        self.require_repo()
+        entries = SubmoduleManager(self.project_path).status()
+        return self.result(True, f'{len(entries)} submodule', submodules=entries)
+
+    def cmd_core(self, args):
+        self.require_repo()
+        if args.action == 'benchmark':
+            return self.core.benchmark(args.repeat)
+        return self.result(True, 'Backend-uri git', **self.core.get_info())
+
+    def cmd_daemon(self, args):
+        if args.action == 'start':
+            return start_daemon()
+        if args.action == 'stop':
+            return stop_daemon()
+        return daemon_status()
+
+    def cmd_maintenance(self, args):
+        self.require_repo()
+        return MaintenanceScheduler(lambda: self.project_path).run(force=args.force, manual=True)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='Git Manager.py',
+        description='Git Manager - mod non-interactiv. Fără argumente pornește meniul interactiv.'
+    )
+    parser.add_argument('--json', action='store_true', help='rezultatul ca JSON (un obiect per comandă)')
+    parser.add_argument('--path', help='directorul proiectului (implicit directorul curent)')
+    parser.add_argument('--batch', metavar='FIȘIER', help="rulează comenzile din fișier ('-' = stdin), una pe linie")
+    parser.add_argument('--keep-going', action='store_true', help='în modul batch, continuă după o comandă eșuată')
+    parser.add_argument('--no-daemon', action='store_true', help='nu folosi cache-ul daemon-ului, chiar dacă rulează')
+
+    commands = parser.add_subparsers(dest='command', metavar='COMANDĂ')
+
+    def command(name, help_text, handler):
+        sub = commands.add_parser(name, help=help_text)
+        sub.set_defaults(handler=handler)
+        sub.add_argument('--json', action='store_true', default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+        return sub
+
+    sub = command('init', 'inițializează repository-ul (meniu: 1)', 'cmd_init')
+    sub.add_argument('--no-gitignore', action='store_true', help='nu crea .gitignore')
+
+    sub = command('status', 'status-ul proiectului (meniu: 1)', 'cmd_status')
+    sub.add_argument('--lite', action='store_true',
+                     help='doar fișierele urmărite, citite direct din .git/index (fără procese git)')
+
+    sub = command('add', 'adaugă fișiere pentru commit (meniu: 2)', 'cmd_add')
+    sub.add_argument('paths', nargs='*', help='căile de adăugat (implicit toate)')
+
+    sub = command('commit', 'salvează modificările (meniu: 3)', 'cmd_commit')
+    sub.add_argument('-m', '--message', required=True)
+    sub.add_argument('-a', '--all', action='store_true', help='include fișierele urmărite modificate')
+    sub.add_argument('--no-timestamp', action='store_true', help='nu adăuga data la mesaj')
+    sub.add_argument('--no-verify', action='store_true', help='fără verificările pre-commit')
+
+    sub = command('history', 'istoricul commit-urilor (meniu: 4)', 'cmd_history')
+    sub.add_argument('--limit', type=int, default=10)
+    sub.add_argument('--skip', type=int, default=0)
+    sub.add_argument('--format', choices=['text', 'json', 'ndjson'], default='text')
+
+    command('branches', 'listează branch-urile', 'cmd_branches')
+
+    sub = command('branch', 'creează branch nou (meniu: 5)', 'cmd_branch')
+    sub.add_argument('name')
+    sub.add_argument('--worktree', action='store_true', help='creează branch-ul într-un worktree separat')
+
+    sub = command('switch', 'comută pe un branch (meniu: 6)', 'cmd_switch')
+    sub.add_argument('name')
+    sub.add_argument('--worktree', action='store_true', help='comută prin worktree, fără checkout')
+
+    sub = command('remote', 'configurează remote-uri (meniu: 7)', 'cmd_remote')
+    sub.add_argument('action', choices=['list', 'add', 'remove'])
+    sub.add_argument('name', nargs='?', default='origin')
+    sub.add_argument('url', nargs='?')
+
+    sub = command('push', 'trimite pe server (meniu: 8)', 'cmd_push')
+    sub.add_argument('--first', action='store_true', help='setează upstream-ul (primul push)')
+    sub.add_argument('--remote', action='append', help='doar acest remote (se poate repeta)')
+    sub.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT)
+
+    command('pull', 'descarcă de pe server (meniu: 9)', 'cmd_pull')
+
+    sub = command('backup', 'backup rapid complet (meniu: 10)', 'cmd_backup')
+    sub.add_argument('--no-confirm', action='store_true', help='fără confirmare (necesar în cron/CI)')
+    sub.add_argument('--no-push', action='store_true', help='doar commit local (și bundle)')
+    sub.add_argument('--no-verify', action='store_true', help='fără verificările pre-commit')
+    sub.add_argument('--snapshot', action='store_true',
+                     help='commit în refs/backups/<branch> cu un index temporar (staging area și branch-ul rămân neschimbate)')
+    sub.add_argument('-m', '--message', help='mesajul commit-ului (implicit "Backup automat - <data>")')
+    sub.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT)
+
+    sub = command('restore', 'restaurare de urgență (meniu: 11)', 'cmd_restore')
+    sub.add_argument('action', choices=['file', 'all', 'diff'])
+    sub.add_argument('file', nargs='?')
+    sub.add_argument('--yes', action='store_true', help='confirmă pierderea modificărilor')
+
+    sub = command('tree', 'structura proiectului (meniu: 12)', 'cmd_tree')
+    sub.add_argument('--depth', type=int, default=3)
+
+    sub = command('analytics', 'statistici repository (meniu: 14)', 'cmd_analytics')
+    sub.add_argument('report', nargs='?', choices=['summary', 'churn', 'authors', 'growth'], default='summary')
+    sub.add_argument('--limit', type=int, default=20, help='număr de fișiere (churn) sau săptămâni (authors)')
+    sub.add_argument('--file', help='fișierul/directorul pentru raportul growth')
+
+    sub = command('bloat', 'analiza fișierelor mari (meniu: 15)', 'cmd_bloat')
+    sub.add_argument('--limit', type=int, default=20)
+    sub.add_argument('--no-commits', action='store_true', help='fără căutarea commit-urilor care le-au introdus')
+
+    sub = command('bundle', 'backup offline cu git bundle (meniu: 16)', 'cmd_bundle')
+    sub.add_argument('action', choices=['target', 'create', 'list', 'verify', 'restore'])
+    sub.add_argument('value', nargs='?', help='directorul (target) sau destinația (restore)')
+    sub.add_argument('--upto', type=int, help='restaurează până la bundle-ul cu acest index')
+
+    sub = command('fetch', 'fetch de la toate remote-urile (meniu: 17)', 'cmd_fetch')
+    sub.add_argument('--remote', action='append')
+    sub.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT)
+
+    sub = command('sparse', 'sparse checkout / partial clone (meniu: 18)', 'cmd_sparse')
+    sub.add_argument('action', choices=['list', 'enable', 'add', 'remove', 'disable', 'clone'])
+    sub.add_argument('values', nargs='*', help='directoare (sau URL DEST [DIRECTOARE] pentru clone)')
+
+    sub = command('worktree', 'worktree-uri (meniu: 19)', 'cmd_worktree')
+    sub.add_argument('action', choices=['list', 'create', 'switch', 'remove', 'prune'])
+    sub.add_argument('target', nargs='?', help='branch-ul sau calea worktree-ului')
+    sub.add_argument('--dir', help='directorul noului worktree')
+    sub.add_argument('--new', action='store_true', help='creează și branch-ul')
+    sub.add_argument('--force', action='store_true')
+
+    sub = command('untracked', 'fișiere neurmărite și reguli .gitignore (meniu: 20)', 'cmd_untracked')
+    sub.add_argument('action', nargs='?', choices=['analyze', 'apply'], default='analyze')
+    sub.add_argument('--rule', action='append', help='regula de adăugat în .gitignore (se poate repeta)')
+    sub.add_argument('--all', action='store_true', help='adaugă toate regulile propuse')
+
+    command('submodules', 'status-ul submodulelor', 'cmd_submodules')
+
+    sub = command('core', 'backend-urile de execuție git (benchmark și alegerea celui mai rapid)', 'cmd_core')
+    sub.add_argument('action', choices=['info', 'benchmark'])
+    sub.add_argument('--repeat', type=int, default=5)
+
+    sub = command('daemon', 'daemon-ul cu cache-uri calde (status, branch-uri, istoric)', 'cmd_daemon')
+    sub.add_argument('action', choices=['start', 'stop', 'status'])
+
+    sub = command('maintenance', 'rulează mentenanța acum (gc, repack, commit-graph)', 'cmd_maintenance')
+    sub.add_argument('--force', action='store_true', help='rulează toate task-urile, inclusiv gc')
+
+    return parser
+
+
+def print_text(result, args):
+    """Afișare pentru oameni (fără --json)"""
+    for line in result.get('lines') or []:
+        print(line)
+    if isinstance(result.get('files'), list):
+        for item in result['files']:
+            print(f"  {item['code']} {item['name']}")
+    for commit in result.get('commits') or []:
+        print(f"{commit['short']} {commit['date'][:10]} {commit['author']}: {commit['subject']}")
+    for branch in result.get('branches') or []:
+        print(f"{'*' if branch['current'] else ' '} {branch['name']}" + format_divergence(branch) +
+              (f"  ({branch['worktree']})" if branch.get('worktree') and not branch['current'] else ''))
+    for remote in result.get('remotes') or []:
+        print(f"  {remote['name']}\t{remote['fetch_url']}")
+    for worktree in result.get('worktrees') or []:
+        print(f"{'*' if worktree['current'] else ' '} {worktree['branch'] or worktree['head']}\t{worktree['path']}")
+    for entry in result.get('entries') or []:
+        print("    " * entry['depth'] + entry['name'] + ('/' if entry['type'] == 'dir' else ''))
+    for entry in result.get('results') or []:
+        if isinstance(entry, dict) and 'remote' in entry:
+            print(f"  {'✅' if entry['success'] else '❌'} {entry['remote']}" + (f": {entry['error']}" if entry.get('error') else ''))
+    for problem in result.get('problems') or []:
+        print(f"  ❌ {problem['path']} [{problem['check']}]: {problem['message']}")
+    if isinstance(result.get('diff'), CapturedOutput):
+        sys.stdout.flush()
+        for chunk in result['diff'].iter_chunks():
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        result['diff'].close()
+    if 'data' in result:
+        print(json.dumps(result['data'], indent=2, ensure_ascii=False))
+    for warning in result.get('warnings') or []:
+        print(f"⚠️  {warning}", file=sys.stderr)
+    print(("✅ " if result.get('success') else "❌ ") + str(result.get('message', '')),
+          file=sys.stdout if result.get('success') else sys.stderr)
+
+
+def json_default(value):
+    if isinstance(value, CapturedOutput):
+        # În JSON intră doar începutul unui output mare (size/truncated arată cât lipsește)
+        summary = value.summary()
+        value.close()
+        return summary
+    return str(value)
+
+
+def emit(result, args):
+    if getattr(args, 'format', None) == 'ndjson' and result.get('success'):
+        # Un commit per linie, fără obiectul rezultat (se poate procesa pe măsură ce apare)
+        for commit in result['commits']:
+            print(json.dumps(commit, ensure_ascii=False))
+    elif args.json or getattr(args, 'format', None) == 'json':
+        print(json.dumps(result, ensure_ascii=False, default=json_default))
+    else:
+        print_text(result, args)
+
+
+def execute(runner, parser, argv, json_output):
+    """Rulează o singură comandă; returnează codul de ieșire"""
+    args = parser.parse_args(argv)
+    args.json = json_output or getattr(args, 'json', False)
+    if not getattr(args, 'handler', None):
+        parser.print_help(sys.stderr)
+        return 2
+    project_path = runner.project_path
+    try:
+        result = getattr(runner, args.handler)(args)
+    except CommandError as e:
+        result = {'success': False, 'message': str(e)}
+    if runner.daemon is not None and args.handler not in READ_COMMANDS:
+        runner.daemon.invalidate(project_path)
+    emit(result, args)
+    sys.stdout.flush()
+    return 0 if result.get('success') else 1
+
+
+def run_batch(runner, parser, path, json_output, keep_going):
+    """Comenzile din fișier, în același proces ('#' începe un comentariu)"""
+    handle = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    exit_code = 0
+    with handle:
+        for number, line in enumerate(handle, 1):
+            argv = shlex.split(line, comments=True)
+            if not argv:
+                continue
+            try:
+                code = execute(runner, parser, argv, json_output)
+            except SystemExit as e:
+                # argparse iese cu 2 la o linie invalidă
+                code = e.code if isinstance(e.code, int) else 2
+                print(f"❌ Linia {number}: comandă invalidă: {line.strip()}", file=sys.stderr)
+            if code:
+                exit_code = code
+                if not keep_going:
+                    break
+    return exit_code
+
+
+def run_cli(argv, manager_class):
+    """Punctul de intrare pentru modul non-interactiv (apelat din 'Git Manager.py')"""
+    parser = build_parser()
+    args, _ = parser.parse_known_args(argv)
+    if args.path:
+        os.chdir(os.path.abspath(os.path.expanduser(args.path)))
+
+    # Fără ecranele de început și fără verificările de instalare (git --version / config)
+    manager = manager_class(probe=False)
+    runner = ScriptRunner(manager, None if args.no_daemon else DaemonClient())
+
+    if args.batch:
+        return run_batch(runner, parser, args.batch, args.json, args.keep_going)
+    return execute(runner, parser, argv, False)
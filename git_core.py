@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Nucleu comun pentru CLI și aplicația web
+Execuția comenzilor git și operațiile de citire frecvente (branch curent,
+rezolvarea unei revizii, conținutul unui fișier, istoric, branch-uri,
+fișierele pregătite pentru commit) sunt
+implementate o singură dată, cu mai multe backend-uri:
+
+- subprocess: câte un proces git pentru fiecare operație (mereu disponibil)
+- persistent: un singur 'git cat-file --batch-command' per repository,
+  reutilizat pentru rezolvarea reviziilor și citirea obiectelor
+- native: cititorul Python pur din git_objects (pachete mapate în memorie)
+  și git_index (fișierul index), fără niciun proces git
+- library: pygit2 (libgit2), în proces, dacă este instalat
+
+Benchmark-ul măsoară backend-urile disponibile pe mașina curentă, verifică
+faptul că dau același rezultat ca subprocess și memorează cel mai rapid
+backend pentru fiecare operație.
+"""
+
+import atexit
+import json
+import os
+import subprocess
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from git_governor import run_process
+from git_index import UnsupportedIndex, read_index
+from git_objects import MissingObject, Repository, UnsupportedRepository, commit_subject
+from git_state import git_common_dir, git_dir, state_dir
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+BACKENDS_FILE = 'core_backends.json'
+OPERATIONS = ('current_branch', 'rev_parse', 'read_blob', 'log', 'branches', 'staged')
+DEFAULT_BACKEND = 'subprocess'
+# Backend-ul folosit înainte de primul benchmark, când este mult mai rapid
+PREFERRED_BACKENDS = {'staged': 'native'}
+BENCHMARK_REPEAT = 5
+
+# Câmpurile pentru log (separate prin \x1f, commit-urile prin \0)
+LOG_FORMAT = '%H%x1f%h%x1f%an%x1f%ae%x1f%aI%x1f%s'
+
+# Un backend returnează UNSUPPORTED pentru cazurile pe care nu le tratează
+UNSUPPORTED = object()
+
+
+def run_command(command, cwd, input_data=None, timeout=None, interactive=False):
+    """
+    Rulează o comandă prin guvernatorul comun (timeout după tipul operației,
+    coadă limitată) și returnează {'success', 'output', 'error'} (formatul
+    comun al managerilor). interactive=True lasă git să ceară parola în terminal.
+    """
+    result = run_process(command, cwd, input_data, timeout=timeout, interactive=interactive)
+    if result.returncode != 0:
+        return {'success': False, 'output': None, 'error': result.stderr or f'Cod de ieșire {result.returncode}'}
+    return {'success': True, 'output': result.stdout, 'error': None}
+
+
+def parse_log_records(output):
+    """Commit-urile din 'git log -z --format=LOG_FORMAT'"""
+    commits = []
+    for record in (output or '').split('\0'):
+        if not record.strip():
+            continue
+        full_hash, short, author, email, date, subject = record.strip('\n').split('\x1f', 5)
+        commits.append({'hash': full_hash, 'short': short, 'author': author, 'email': email,
+                        'date': date, 'subject': subject})
+    return commits
+
+
+class SubprocessBackend:
+    """Câte un proces git pentru fiecare operație"""
+
+    name = 'subprocess'
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+
+    @staticmethod
+    def available():
+        return True
+
+    def _git(self, args):
+        return run_command(['git'] + args, self.project_path)
+
+    def current_branch(self):
+        result = self._git(['branch', '--show-current'])
+        return result['output'].strip() if result['success'] else None
+
+    def rev_parse(self, revision):
+        result = self._git(['rev-parse', '--verify', '-q', f'{revision}^{{commit}}'])
+        return result['output'].strip() if result['success'] else None
+
+    def read_blob(self, revision, path):
+        result = run_process(['git', 'cat-file', 'blob', f'{revision}:{path}'], self.project_path, text=False)
+        return result.stdout if result.returncode == 0 else None
+
+    def log(self, limit=10, skip=0, revision=None):
+        args = ['log', f'--format={LOG_FORMAT}', '-z', f'-{limit}']
+        if skip:
+            args.append(f'--skip={skip}')
+        if revision:
+            args += [revision, '--']
+        result = self._git(args)
+        if not result['success']:
+            # Repository fără commit-uri: istoric gol, nu eroare
+            return [] if not revision and self.rev_parse('HEAD') is None else None
+        return parse_log_records(result['output'])
+
+    def branches(self):
+        result = self._git(['for-each-ref', '--format=%(HEAD)%(refname:short)', 'refs/heads'])
+        if not result['success']:
+            return None
+        return [{'name': line[1:], 'current': line[0] == '*'} for line in result['output'].split('\n') if line]
+
+    def staged(self):
+        result = self._git(['diff', '--cached', '--name-status', '--no-renames', '-z'])
+        if not result['success']:
+            return None
+        fields = result['output'].split('\0')
+        return [{'status': fields[i], 'path': fields[i + 1]} for i in range(0, len(fields) - 1, 2)]
+
+    def close(self):
+        pass
+
+
+class PersistentBackend(SubprocessBackend):
+    """
+    Un proces 'git cat-file --batch-command' păstrat deschis (git >= 2.36):
+    rezolvarea reviziilor și citirea obiectelor nu mai pornesc procese noi.
+    Celelalte operații folosesc implementarea subprocess.
+    """
+
+    name = 'persistent'
+    _supported = None
+
+    def __init__(self, project_path):
+        super().__init__(project_path)
+        self.process = None
+        self.lock = threading.Lock()
+
+    @classmethod
+    def available(cls):
+        if cls._supported is None:
+            try:
+                # 'git cat-file -h' afișează opțiunile și iese cu codul 129
+                result = subprocess.run(['git', 'cat-file', '-h'], capture_output=True, text=True)
+                cls._supported = '--batch-command' in result.stdout + result.stderr
+            except OSError:
+                cls._supported = False
+        return cls._supported
+
+    def _start(self):
+        self.process = subprocess.Popen(
+            ['git', 'cat-file', '--batch-command'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=self.project_path
+        )
+
+    def _request(self, command, spec, read_content):
+        """Trimite o comandă și citește antetul '<oid> <tip> <mărime>' (plus conținutul)"""
+        if '\n' in spec:
+            return UNSUPPORTED
+        with self.lock:
+            for attempt in range(2):
+                if self.process is None or self.process.poll() is not None:
+                    self._start()
+                try:
+                    self.process.stdin.write(f'{command} {spec}\n'.encode('utf-8', errors='surrogateescape'))
+                    self.process.stdin.flush()
+                    header = self.process.stdout.readline().decode('utf-8', errors='replace').rstrip('\n')
+                    if not header:
+                        raise BrokenPipeError('cat-file s-a oprit')
+                    if header.endswith(' missing') or header.endswith(' ambiguous'):
+                        return None
+                    oid, object_type, size = header.split(' ')
+                    content = None
+                    if read_content:
+                        content = self.process.stdout.read(int(size))
+                        self.process.stdout.read(1)
+                    return oid, object_type, content
+                except (OSError, ValueError):
+                    # Procesul a murit (de ex. repository mutat): repornit o singură dată
+                    self.close()
+            return UNSUPPORTED
+
+    def rev_parse(self, revision):
+        result = self._request('info', f'{revision}^{{commit}}', False)
+        return result if result is None or result is UNSUPPORTED else result[0]
+
+    def read_blob(self, revision, path):
+        result = self._request('contents', f'{revision}:{path}', True)
+        if result is None or result is UNSUPPORTED:
+            return result
+        oid, object_type, content = result
+        return content if object_type == 'blob' else None
+
+    def close(self):
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+            self.process = None
+
+
+class LibraryBackend(SubprocessBackend):
+    """Operațiile de citire în proces, prin pygit2 (opțional)"""
+
+    name = 'library'
+
+    def __init__(self, project_path):
+        super().__init__(project_path)
+        # Un obiect Repository per thread (aplicația web rulează cereri în paralel)
+        self.local = threading.local()
+
+    @staticmethod
+    def available():
+        return pygit2 is not None
+
+    def _repository(self):
+        if getattr(self.local, 'repo', None) is None:
+            self.local.repo = pygit2.Repository(self.project_path)
+        return self.local.repo
+
+    def current_branch(self):
+        repo = self._repository()
+        if repo.head_is_detached:
+            return ''
+        target = repo.references['HEAD'].target
+        return target[len('refs/heads/'):] if target.startswith('refs/heads/') else target
+
+    def rev_parse(self, revision):
+        try:
+            return str(self._repository().revparse_single(revision).peel(pygit2.Commit).id)
+        except (KeyError, ValueError, pygit2.GitError):
+            return None
+
+    def read_blob(self, revision, path):
+        try:
+            blob = self._repository().revparse_single(f'{revision}:{path}')
+        except (KeyError, ValueError, pygit2.GitError):
+            return None
+        return blob.data if isinstance(blob, pygit2.Blob) else None
+
+    def log(self, limit=10, skip=0, revision=None):
+        # Ordinea implicită din 'git log' (cu mai mulți părinți) este verificată de benchmark
+        start = self.rev_parse(revision or 'HEAD')
+        if start is None:
+            return None if revision else []
+
+        commits = []
+        for index, commit in enumerate(self._repository().walk(start, pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME)):
+            if index < skip:
+                continue
+            if len(commits) >= limit:
+                break
+            author = commit.author
+            offset = timezone(timedelta(minutes=author.offset))
+            paragraph = commit.message.split('\n\n', 1)[0]
+            commits.append({
+                'hash': str(commit.id),
+                'short': str(commit.id)[:7],
+                'author': author.name,
+                'email': author.email,
+                'date': datetime.fromtimestamp(author.time, offset).isoformat(),
+                'subject': ' '.join(line.strip() for line in paragraph.strip().splitlines())
+            })
+        return commits
+
+    def branches(self):
+        repo = self._repository()
+        current = self.current_branch()
+        return [{'name': name, 'current': name == current} for name in sorted(repo.branches.local)]
+
+    def close(self):
+        self.local = threading.local()
+
+
+class NativeBackend(SubprocessBackend):
+    """Referințe și obiecte citite direct din .git (git_objects), zero procese"""
+
+    name = 'native'
+
+    def __init__(self, project_path):
+        super().__init__(project_path)
+        self.repo = None
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def available():
+        return True
+
+    def _repository(self):
+        with self.lock:
+            if self.repo is None:
+                self.repo = Repository(git_dir(self.project_path), git_common_dir(self.project_path))
+            return self.repo
+
+    def _guarded(self, function):
+        # Cazurile neacoperite de cititor (partial clone, shallow, sintaxă) rămân la git
+        try:
+            return function(self._repository())
+        except (UnsupportedRepository, UnsupportedIndex, MissingObject, OSError, ValueError):
+            return UNSUPPORTED
+
+    def current_branch(self):
+        def read(repo):
+            target = repo.head_target()
+            if target is None:
+                return ''
+            return target[len('refs/heads/'):] if target.startswith('refs/heads/') else UNSUPPORTED
+        return self._guarded(read)
+
+    def rev_parse(self, revision):
+        return self._guarded(lambda repo: repo.resolve(revision))
+
+    def read_blob(self, revision, path):
+        def read(repo):
+            oid = repo.resolve(revision)
+            found = repo.read_path(oid, path) if oid else None
+            return found[1] if found and found[0] == 'blob' else None
+        return self._guarded(read)
+
+    def log(self, limit=10, skip=0, revision=None):
+        def read(repo):
+            if repo.objects.custom_abbrev:
+                return UNSUPPORTED
+            start = repo.resolve(revision or 'HEAD')
+            if start is None:
+                return None if revision else []
+            loose_names = {}
+            return [{
+                'hash': oid,
+                'short': repo.objects.abbreviate(oid, loose_names),
+                'author': commit['author']['name'],
+                'email': commit['author']['email'],
+                'date': commit['author']['date'],
+                'subject': commit_subject(commit['message'])
+            } for oid, commit in repo.walk(start, limit, skip)]
+        return self._guarded(read)
+
+    def branches(self):
+        def read(repo):
+            current = repo.head_target()
+            return [{'name': name[len('refs/heads/'):], 'current': name == current} for name in repo.branches()]
+        return self._guarded(read)
+
+    def staged(self):
+        return self._guarded(lambda repo: read_index(self.project_path).staged(repo))
+
+    def close(self):
+        with self.lock:
+            if self.repo is not None:
+                self.repo.close()
+                self.repo = None
+
+
+BACKEND_CLASSES = (SubprocessBackend, PersistentBackend, NativeBackend, LibraryBackend)
+
+
+class GitCore:
+    """Operațiile comune, fiecare rulată pe backend-ul ales pentru ea"""
+
+    def __init__(self, project_path):
+        self.project_path = os.path.abspath(project_path)
+        self.backends = {cls.name: cls(self.project_path) for cls in BACKEND_CLASSES if cls.available()}
+        self.choices = self.load_choices()
+
+    # --- Alegerea backend-ului ---
+
+    def _choices_path(self):
+        return os.path.join(state_dir(self.project_path), BACKENDS_FILE)
+
+    def load_choices(self):
+        # state_dir() ar crea .git/ într-un director care nu este încă repository
+        if not os.path.isdir(git_common_dir(self.project_path)):
+            return {}
+        try:
+            with open(self._choices_path(), 'r', encoding='utf-8') as f:
+                choices = json.load(f).get('choices', {})
+        except (OSError, ValueError):
+            return {}
+        # Un backend ales pe altă instalare poate să nu mai fie disponibil
+        return {operation: name for operation, name in choices.items() if name in self.backends}
+
+    def backend_for(self, operation):
+        name = self.choices.get(operation) or PREFERRED_BACKENDS.get(operation, DEFAULT_BACKEND)
+        return self.backends.get(name) or self.backends[DEFAULT_BACKEND]
+
+    def call(self, operation, *args):
+        backend = self.backend_for(operation)
+        try:
+            result = getattr(backend, operation)(*args)
+        except Exception:
+            # O eroare a unui backend opțional nu trebuie să blocheze operația
+            if backend.name == DEFAULT_BACKEND:
+                raise
+            result = UNSUPPORTED
+        if result is UNSUPPORTED:
+            result = getattr(self.backends[DEFAULT_BACKEND], operation)(*args)
+        return result
+
+    # --- Operații ---
+
+    def current_branch(self):
+        """Branch-ul curent ('' pentru HEAD detașat, None dacă nu se poate citi)"""
+        return self.call('current_branch')
+
+    def rev_parse(self, revision='HEAD'):
+        """Hash-ul complet al commit-ului (None dacă revizia nu există)"""
+        return self.call('rev_parse', revision)
+
+    def read_blob(self, revision, path):
+        """Conținutul (bytes) unui fișier dintr-o revizie"""
+        return self.call('read_blob', revision, path)
+
+    def log(self, limit=10, skip=0, revision=None):
+        """Commit-uri: {hash, short, author, email, date, subject}"""
+        return self.call('log', limit, skip, revision)
+
+    def branches(self):
+        """Branch-urile locale: {name, current}"""
+        return self.call('branches')
+
+    def staged(self):
+        """Fișierele pregătite pentru commit: {status, path} (A, M, D, T, U)"""
+        return self.call('staged')
+
+    def status_lite(self):
+        """
+        Status fără fișierele netrasate, fără procese git: {path, code} cu
+        codurile din 'git status --porcelain' (indexul față de HEAD, apoi
+        working tree-ul față de index, din datele stat()). None dacă indexul
+        nu poate fi citit.
+        """
+        staged = self.staged()
+        try:
+            modified = read_index(self.project_path).modified(self.project_path)
+        except (UnsupportedIndex, OSError, ValueError):
+            return None
+        if staged is None:
+            return None
+
+        # Conflictele apar ca 'UU', ca în porcelain
+        codes = {change['path']: [change['status'], 'U' if change['status'] == 'U' else ' '] for change in staged}
+        for change in modified:
+            codes.setdefault(change['path'], [' ', ' '])[1] = change['status']
+        return [{'path': path, 'code': ''.join(code)} for path, code in sorted(codes.items())]
+
+    # --- Benchmark ---
+
+    def _sample_arguments(self):
+        head = self.backends[DEFAULT_BACKEND].rev_parse('HEAD')
+        if head is None:
+            return None
+        result = run_command(['git', 'ls-tree', '-r', '--name-only', '-z', 'HEAD'], self.project_path)
+        paths = [path for path in (result['output'] or '').split('\0') if path]
+        return {
+            'current_branch': (),
+            'rev_parse': ('HEAD',),
+            'read_blob': ('HEAD', paths[0]) if paths else None,
+            'log': (100, 0, None),
+            'branches': (),
+            'staged': ()
+        }
+
+    def benchmark(self, repeat=BENCHMARK_REPEAT):
+        """
+        Măsoară fiecare operație pe fiecare backend (mediana a `repeat`
+        rulări, după o rulare de încălzire) și alege cel mai rapid backend
+        care dă același rezultat ca subprocess.
+        """
+        samples = self._sample_arguments()
+        if samples is None:
+            return {'success': False, 'message': 'Benchmark-ul necesită cel puțin un commit'}
+
+        timings = {}
+        choices = {}
+        for operation in OPERATIONS:
+            arguments = samples[operation]
+            if arguments is None:
+                continue
+            reference = getattr(self.backends[DEFAULT_BACKEND], operation)(*arguments)
+            timings[operation] = {}
+            for name, backend in self.backends.items():
+                method = getattr(backend, operation)
+                if name != DEFAULT_BACKEND and method.__func__ is getattr(SubprocessBackend, operation):
+                    continue    # backend-ul folosește oricum implementarea subprocess
+                try:
+                    if method(*arguments) != reference:
+                        timings[operation][name] = 'rezultat diferit'
+                        continue
+                    durations = []
+                    for _ in range(repeat):
+                        start = time.perf_counter()
+                        method(*arguments)
+                        durations.append((time.perf_counter() - start) * 1000)
+                except Exception as e:
+                    timings[operation][name] = f'eroare: {e}'
+                    continue
+                timings[operation][name] = round(sorted(durations)[len(durations) // 2], 3)
+
+            measured = {name: value for name, value in timings[operation].items() if isinstance(value, float)}
+            choices[operation] = min(measured, key=measured.get) if measured else DEFAULT_BACKEND
+
+        self.choices = choices
+        with open(self._choices_path(), 'w', encoding='utf-8') as f:
+            json.dump({'measured_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                       'choices': choices, 'timings': timings}, f, indent=2, ensure_ascii=False)
+
+        return {
+            'success': True,
+            'message': 'Backend-uri alese: ' + ', '.join(f'{op}={name}' for op, name in choices.items()),
+            'available': list(self.backends),
+            'choices': choices,
+            'timings_ms': timings
+        }
+
+    def get_info(self):
+        return {
+            'available': list(self.backends),
+            'choices': {operation: self.backend_for(operation).name for operation in OPERATIONS}
+        }
+
+    def close(self):
+        for backend in self.backends.values():
+            backend.close()
+
+
+_cores = {}
+_cores_lock = threading.Lock()
+
+
+def get_core(project_path):
+    """Instanța GitCore pentru un repository (procesele persistente sunt reutilizate)"""
+    project_path = os.path.abspath(project_path)
+    with _cores_lock:
+        core = _cores.get(project_path)
+        if core is None:
+            core = _cores[project_path] = GitCore(project_path)
+        return core
+
+
+@atexit.register
+def _close_cores():
+    for core in list(_cores.values()):
+        core.close()
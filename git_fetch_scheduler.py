@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Fetch periodic în fundal și divergența branch-urilor
+Scheduler-ul face fetch de la toate remote-urile la fiecare FETCH_INTERVAL
+secunde (configurabil cu gitmanager.fetchInterval, 0 = oprit). Intervalul
+are o variație aleatoare (jitter), astfel încât mai multe instanțe nu
+contactează serverul în același moment, iar după fiecare eșec se dublează
+(backoff), până la MAX_BACKOFF.
+
+Pentru fiecare branch local, upstream-ul și numărul de commit-uri
+ahead/behind sunt citite dintr-o singură rulare 'git for-each-ref' și
+păstrate în cache până la următorul fetch sau până când se schimbă o
+referință (amprentă doar din stat(), fără procese git).
+"""
+
+import os
+import random
+import threading
+import time
+
+from git_governor import run_process
+from git_remotes import RemoteManager
+from git_state import git_common_dir, git_dir
+
+CONFIG_KEY = 'gitmanager.fetchInterval'
+FETCH_INTERVAL = 15 * 60
+MAX_BACKOFF = 6 * 3600
+JITTER = 0.2                 # ±20% din interval
+CHECK_INTERVAL = 30
+
+# Câmpurile separate prin NUL; %(upstream:track) calculează ahead/behind în același proces
+TRACKING_FORMAT = '%(HEAD)%00%(refname:short)%00%(upstream:short)%00%(upstream:track,nobracket)'
+
+
+def _stat(path):
+    try:
+        info = os.stat(path)
+        return info.st_mtime_ns, info.st_size
+    except OSError:
+        return None
+
+
+def parse_track(track):
+    """'ahead 2, behind 1' / 'gone' / '' → (ahead, behind, gone)"""
+    ahead = behind = 0
+    if track == 'gone':
+        return ahead, behind, True
+    for part in track.split(','):
+        name, _, count = part.strip().partition(' ')
+        if name == 'ahead':
+            ahead = int(count)
+        elif name == 'behind':
+            behind = int(count)
+    return ahead, behind, False
+
+
+def format_divergence(branch):
+    """'  [origin/main ↑2 ↓1]' pentru un branch cu upstream ('' fără upstream)"""
+    if not branch.get('upstream'):
+        return ''
+    if branch.get('gone'):
+        return f"  [{branch['upstream']}: șters]"
+    counts = (f" ↑{branch['ahead']}" if branch['ahead'] else '') + (f" ↓{branch['behind']}" if branch['behind'] else '')
+    return f"  [{branch['upstream']}{counts}]"
+
+
+class BranchTracking:
+    """Upstream-ul și ahead/behind pentru branch-urile locale, în cache până la schimbarea referințelor"""
+
+    def __init__(self):
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def stamp(self, project_path):
+        """
+        Amprenta referințelor: HEAD, packed-refs, FETCH_HEAD și directoarele
+        refs/heads și refs/remotes (o referință scrisă prin redenumirea
+        fișierului .lock schimbă mtime-ul directorului ei).
+        """
+        own_dir, common_dir = git_dir(project_path), git_common_dir(project_path)
+        stamp = [_stat(os.path.join(own_dir, 'HEAD')),
+                 _stat(os.path.join(common_dir, 'packed-refs')),
+                 _stat(os.path.join(common_dir, 'FETCH_HEAD'))]
+        for root in ('heads', 'remotes'):
+            for directory, _, _ in os.walk(os.path.join(common_dir, 'refs', root)):
+                stamp.append((directory, _stat(directory)))
+        return tuple(stamp)
+
+    def read(self, project_path):
+        """Rulează for-each-ref o singură dată; returnează {branch: informații} sau None"""
+        result = run_process(['git', 'for-each-ref', f'--format={TRACKING_FORMAT}', 'refs/heads'], project_path)
+        if result.returncode != 0:
+            return None
+
+        branches = {}
+        for line in result.stdout.splitlines():
+            fields = line.split('\0')
+            if len(fields) != 4:
+                continue
+            head, name, upstream, track = fields
+            ahead, behind, gone = parse_track(track)
+            branches[name] = {
+                'current': head == '*',
+                'upstream': upstream or None,
+                'ahead': ahead,
+                'behind': behind,
+                'gone': gone
+            }
+        return branches
+
+    def get(self, project_path):
+        """Informațiile din cache dacă referințele nu s-au schimbat, altfel recitite"""
+        project_path = os.path.abspath(project_path)
+        stamp = self.stamp(project_path)
+        with self.lock:
+            cached = self.cache.get(project_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+        branches = self.read(project_path)
+        if branches is not None:
+            with self.lock:
+                self.cache[project_path] = (stamp, branches)
+        return branches
+
+    def invalidate(self, project_path=None):
+        with self.lock:
+            if project_path is None:
+                self.cache.clear()
+            else:
+                self.cache.pop(os.path.abspath(project_path), None)
+
+
+class FetchScheduler:
+    """Fetch periodic de la remote-uri, cu jitter și backoff per repository"""
+
+    def __init__(self, get_project_path, tracking=None, check_interval=CHECK_INTERVAL):
+        self.get_project_path = get_project_path
+        self.tracking = tracking or BranchTracking()
+        self.check_interval = check_interval
+        self.repos = {}
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # --- Fir de execuție ---
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='git-fetch-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.wait(self.check_interval):
+            project_path = self.get_project_path()
+            if not os.path.exists(os.path.join(project_path, '.git')):
+                continue
+            try:
+                if self.due(project_path):
+                    self.run(project_path)
+            except Exception:
+                # Un fetch eșuat nu trebuie să oprească niciodată serverul
+                pass
+
+    # --- Planificare ---
+
+    def interval(self, project_path):
+        """Intervalul configurat (secunde); 0 oprește fetch-ul automat"""
+        result = run_process(['git', 'config', '--get', CONFIG_KEY], project_path)
+        try:
+            return max(0, int(result.stdout.strip())) if result.returncode == 0 else FETCH_INTERVAL
+        except ValueError:
+            return FETCH_INTERVAL
+
+    def _repo(self, project_path):
+        # Worktree-urile au aceleași remote-uri: un singur program per repository
+        key = git_common_dir(project_path)
+        with self._lock:
+            if key not in self.repos:
+                self.repos[key] = {'next_fetch': None, 'failures': 0, 'last_fetch': None,
+                                   'last_error': None, 'running': False}
+            return self.repos[key]
+
+    def _delay(self, interval, failures):
+        delay = min(interval * 2 ** failures, MAX_BACKOFF) if failures else interval
+        return delay * random.uniform(1 - JITTER, 1 + JITTER)
+
+    def due(self, project_path):
+        repo = self._repo(project_path)
+        if repo['running']:
+            return False
+        if repo['next_fetch'] is None:
+            # Primul fetch după pornire are și el jitter, ca instanțele pornite împreună să nu coincidă
+            interval = self.interval(project_path)
+            if not interval:
+                return False
+            repo['next_fetch'] = time.time() + random.uniform(0, min(interval, self.check_interval * 4))
+        if time.time() < repo['next_fetch']:
+            return False
+        if not self.interval(project_path):
+            # Fetch-ul automat a fost oprit între timp
+            repo['next_fetch'] = None
+            return False
+        return True
+
+    def run(self, project_path=None):
+        """Fetch acum; programează următorul fetch (cu backoff dacă a eșuat)"""
+        project_path = project_path or self.get_project_path()
+        repo = self._repo(project_path)
+        with self._lock:
+            if repo['running']:
+                return {'success': False, 'message': 'Fetch-ul rulează deja'}
+            repo['running'] = True
+
+        try:
+            interval = self.interval(project_path)
+            remotes = RemoteManager(project_path)
+            if not remotes.remote_names():
+                result = {'success': False, 'message': 'Nu este configurat niciun remote'}
+                # Fără remote nu are rost backoff-ul: se verifică din nou după un interval
+                repo['next_fetch'] = time.time() + self._delay(interval or FETCH_INTERVAL, 0)
+                return result
+
+            result = remotes.fetch_all()
+            repo['last_fetch'] = time.time()
+            if result['success']:
+                repo['failures'], repo['last_error'] = 0, None
+            else:
+                repo['failures'] += 1
+                repo['last_error'] = result['message']
+            self.tracking.invalidate(project_path)
+            repo['next_fetch'] = time.time() + self._delay(interval or FETCH_INTERVAL, repo['failures'])
+            return result
+        finally:
+            repo['running'] = False
+
+    def get_status(self):
+        project_path = self.get_project_path()
+        if not os.path.exists(os.path.join(project_path, '.git')):
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+
+        repo = self._repo(project_path)
+        now = time.time()
+        return {
+            'success': True,
+            'enabled': self.interval(project_path) > 0,
+            'running': repo['running'],
+            'failures': repo['failures'],
+            'last_error': repo['last_error'],
+            'last_fetch_ago': round(now - repo['last_fetch']) if repo['last_fetch'] else None,
+            'next_fetch_in': max(0, round(repo['next_fetch'] - now)) if repo['next_fetch'] else None
+        }
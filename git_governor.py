@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Controlul proceselor git (timeout, concurență, oprire curată)
+Toate comenzile git scurte trec prin același "guvernator":
+
+- fiecare comandă primește un timeout după tipul ei: citire locală
+  (status, log, diff...), scriere locală (commit, checkout...), rețea
+  (push, pull, fetch, clone) sau mentenanță (gc, repack)
+- numărul de procese git simultane este limitat global și per repository;
+  cererile peste limită așteaptă la coadă, în ordinea sosirii
+- la timeout este oprit tot grupul de procese (ssh, git-remote-https,
+  credential helper), mai întâi cu SIGTERM, apoi cu SIGKILL
+- timpii de așteptare la coadă, timeout-urile și procesele oprite sunt
+  păstrați pentru /api/metrics
+
+În modul interactiv (meniul din terminal) procesul rămâne în grupul
+terminalului, pentru ca git să poată cere parola; în rest, procesul
+rulează într-o sesiune proprie, fără stdin și fără prompt-uri.
+"""
+
+import atexit
+import os
+import signal
+import subprocess
+import threading
+import time
+from collections import deque
+
+# Timeout-uri (secunde) pe tip de operație
+TIMEOUTS = {
+    'read': 120,
+    'write': 600,
+    'network': 300,
+    'maintenance': 3600
+}
+
+# Procese git simultane: total și pentru același repository
+MAX_PROCESSES = 16
+MAX_PER_REPO = 4
+
+# Cât poate aștepta o comandă la coadă înainte de a renunța
+QUEUE_TIMEOUT = 60
+
+# După SIGTERM, procesele au atât timp să se oprească singure
+TERMINATE_GRACE = 2
+
+# Ultimii timpi de așteptare păstrați pentru percentile
+WAIT_SAMPLES = 1000
+
+NETWORK_COMMANDS = {'push', 'pull', 'fetch', 'clone', 'ls-remote', 'submodule'}
+READ_COMMANDS = {
+    'status', 'log', 'diff', 'show', 'rev-parse', 'rev-list', 'ls-files', 'ls-tree', 'cat-file',
+    'for-each-ref', 'show-ref', 'symbolic-ref', 'merge-base', 'describe', 'blame', 'shortlog',
+    'count-objects', 'grep', 'check-ignore', 'var', 'version', '--version', 'help'
+}
+# Comenzi care doar citesc când sunt apelate fără argumente de poziție (ex: 'git branch')
+LISTING_COMMANDS = {'branch', 'remote', 'tag', 'worktree', 'stash', 'config', 'sparse-checkout'}
+LISTING_ACTIONS = {'list', 'show', 'get-url', '--get', '--get-all', '--list', '-l'}
+
+# Fără prompt-uri de autentificare în modul neinteractiv
+NON_INTERACTIVE_ENV = {'GIT_TERMINAL_PROMPT': '0', 'GIT_SSH_COMMAND': 'ssh -o BatchMode=yes'}
+
+
+def classify(command):
+    """Tipul operației ('read', 'write', 'network') pentru o comandă git"""
+    args = list(command[1:]) if command and os.path.basename(command[0]).startswith('git') else list(command)
+    # Opțiunile globale (-C dir, -c cheie=valoare) sunt înaintea subcomenzii
+    while args and args[0] in ('-C', '-c'):
+        args = args[2:]
+    while args and args[0].startswith('-') and args[0] != '--version':
+        args = args[1:]
+    if not args:
+        return 'read'
+
+    name, rest = args[0], args[1:]
+    if name in NETWORK_COMMANDS:
+        return 'network'
+    if name in READ_COMMANDS:
+        return 'read'
+    if name in LISTING_COMMANDS:
+        if any(arg in LISTING_ACTIONS for arg in rest):
+            return 'read'
+        positional = [arg for arg in rest if not arg.startswith('-')]
+        # 'git config user.name' citește, 'git config user.name X' scrie
+        if not positional or (name == 'config' and len(positional) == 1):
+            return 'read'
+    return 'write'
+
+
+def _failed(command, text, message, operation):
+    # Rezultat în formatul subprocess.run pentru o comandă care nu a pornit
+    result = subprocess.CompletedProcess(command, -1, '' if text else b'', message if text else message.encode('utf-8'))
+    result.timed_out, result.operation, result.queue_ms, result.duration_ms = False, operation, None, 0
+    return result
+
+
+def _percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class Governor:
+    """Coadă comună pentru procesele git ale aplicației"""
+
+    def __init__(self, max_processes=MAX_PROCESSES, max_per_repo=MAX_PER_REPO, timeouts=None):
+        self.max_processes = max_processes
+        self.max_per_repo = max_per_repo
+        self.timeouts = dict(TIMEOUTS, **(timeouts or {}))
+        self.condition = threading.Condition()
+        self.active = 0
+        self.active_per_repo = {}
+        self.waiting = deque()
+        self.processes = set()
+        self.waits = deque(maxlen=WAIT_SAMPLES)
+        self.counters = {
+            'started': {operation: 0 for operation in TIMEOUTS},
+            'timed_out': {operation: 0 for operation in TIMEOUTS},
+            'rejected': 0,
+            'killed': 0
+        }
+
+    # --- Coada ---
+
+    def _can_start(self, ticket, repo):
+        if self.active >= self.max_processes or self.active_per_repo.get(repo, 0) >= self.max_per_repo:
+            return False
+        # Ordinea sosirii, dar o cerere blocată de limita propriului repository nu le oprește pe celelalte
+        for other, other_repo in self.waiting:
+            if other is ticket:
+                return True
+            if self.active_per_repo.get(other_repo, 0) < self.max_per_repo:
+                return False
+        return True
+
+    def acquire(self, repo, operation='read', timeout=QUEUE_TIMEOUT):
+        """
+        Ocupă un loc pentru repository (și pentru procesele pornite direct de
+        apelant, ex: stream-uri); returnează timpul de așteptare (ms) sau None
+        la expirare. Locul este eliberat cu release().
+        """
+        repo = os.path.abspath(repo or '.')
+        ticket = object()
+        start = time.perf_counter()
+        with self.condition:
+            self.waiting.append((ticket, repo))
+            try:
+                deadline = start + timeout
+                while not self._can_start(ticket, repo):
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        self.counters['rejected'] += 1
+                        return None
+                    self.condition.wait(remaining)
+            finally:
+                self.waiting.remove((ticket, repo))
+                # Cererile din spatele acesteia pot verifica din nou
+                self.condition.notify_all()
+            self.active += 1
+            self.active_per_repo[repo] = self.active_per_repo.get(repo, 0) + 1
+            self.counters['started'][operation] += 1
+            waited = (time.perf_counter() - start) * 1000
+            self.waits.append(waited)
+            return waited
+
+    def release(self, repo):
+        repo = os.path.abspath(repo or '.')
+        with self.condition:
+            self.active -= 1
+            self.active_per_repo[repo] -= 1
+            if not self.active_per_repo[repo]:
+                del self.active_per_repo[repo]
+            self.condition.notify_all()
+
+    # --- Procese ---
+
+    def popen(self, command, cwd, env, interactive, stdin, **kwargs):
+        """Pornește procesul în grupul potrivit și îl înregistrează (apelantul ocupă locul cu acquire)"""
+        options = {}
+        if not interactive:
+            if os.name == 'posix':
+                options['start_new_session'] = True
+            else:
+                options['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
+        process = subprocess.Popen(command, cwd=cwd, env=env, stdin=stdin, **options, **kwargs)
+        process.own_group = not interactive and os.name == 'posix'
+        with self.condition:
+            self.processes.add(process)
+        return process
+
+    def forget(self, process):
+        with self.condition:
+            self.processes.discard(process)
+
+    def record_timeout(self, operation):
+        with self.condition:
+            self.counters['timed_out'][operation] += 1
+
+    def terminate(self, process):
+        """Oprește procesul și copiii lui: SIGTERM, apoi SIGKILL după TERMINATE_GRACE"""
+        if process.poll() is not None:
+            return
+        try:
+            if process.own_group:
+                os.killpg(process.pid, signal.SIGTERM)
+                try:
+                    process.wait(TERMINATE_GRACE)
+                except subprocess.TimeoutExpired:
+                    pass
+                # Copiii pot rula și după ce git s-a oprit
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+        with self.condition:
+            self.counters['killed'] += 1
+
+    def environment(self, interactive, env):
+        if interactive and env is None:
+            return None
+        env = dict(env if env is not None else os.environ)
+        if not interactive:
+            for key, value in NON_INTERACTIVE_ENV.items():
+                env.setdefault(key, value)
+        return env
+
+    def run(self, command, cwd, input_data=None, text=True, operation=None, timeout=None,
+            interactive=False, env=None):
+        """
+        Echivalentul subprocess.run(capture_output=True) cu timeout, coadă
+        și oprirea grupului de procese. Rezultatul are în plus `timed_out`,
+        `operation`, `queue_ms` și `duration_ms`.
+        """
+        operation = operation or classify(command)
+        timeout = timeout or self.timeouts[operation]
+
+        waited = self.acquire(cwd, operation)
+        if waited is None:
+            return _failed(command, text, 'Prea multe procese git în așteptare', operation)
+
+        start = time.perf_counter()
+        try:
+            process = self.popen(
+                command, cwd, self.environment(interactive, env), interactive,
+                subprocess.PIPE if input_data is not None else (None if interactive else subprocess.DEVNULL),
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=text
+            )
+            try:
+                stdout, stderr = process.communicate(input_data, timeout=timeout)
+                timed_out = False
+            except subprocess.TimeoutExpired:
+                self.terminate(process)
+                stdout, stderr = process.communicate()
+                timed_out = True
+                self.record_timeout(operation)
+            except BaseException:
+                # Ctrl+C sau firul oprit: procesul nu trebuie să rămână orfan
+                self.terminate(process)
+                process.wait()
+                raise
+            finally:
+                self.forget(process)
+        finally:
+            self.release(cwd)
+
+        if timed_out:
+            message = f'Timeout după {timeout}s'
+            stderr = message if text else message.encode('utf-8')
+        result = subprocess.CompletedProcess(command, process.returncode if not timed_out else -1, stdout, stderr)
+        result.timed_out = timed_out
+        result.operation = operation
+        result.queue_ms = round(waited, 2)
+        result.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+    def terminate_all(self):
+        """La oprirea aplicației: niciun proces git nu rămâne în fundal"""
+        with self.condition:
+            processes = list(self.processes)
+        for process in processes:
+            self.terminate(process)
+
+    # --- Metrici ---
+
+    def get_metrics(self):
+        with self.condition:
+            waits = list(self.waits)
+            return {
+                'limits': {'max_processes': self.max_processes, 'max_per_repo': self.max_per_repo,
+                           'queue_timeout_s': QUEUE_TIMEOUT, 'timeouts_s': dict(self.timeouts)},
+                'active': self.active,
+                'active_per_repo': dict(self.active_per_repo),
+                'queued': len(self.waiting),
+                'started': dict(self.counters['started']),
+                'timed_out': dict(self.counters['timed_out']),
+                'rejected': self.counters['rejected'],
+                'killed': self.counters['killed'],
+                'queue_wait_ms': {
+                    'samples': len(waits),
+                    'avg': round(sum(waits) / len(waits), 2) if waits else 0.0,
+                    'p50': round(_percentile(waits, 0.5), 2),
+                    'p95': round(_percentile(waits, 0.95), 2),
+                    'max': round(max(waits), 2) if waits else 0.0
+                }
+            }
+
+
+governor = Governor()
+atexit.register(governor.terminate_all)
+
+
+def run_process(command, cwd, input_data=None, text=True, operation=None, timeout=None, interactive=False, env=None):
+    """subprocess.run(capture_output=True) prin guvernatorul comun"""
+    try:
+        return governor.run(command, cwd, input_data, text, operation, timeout, interactive, env)
+    except OSError as e:
+        return _failed(command, text, str(e), operation)
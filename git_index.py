@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Cititor pentru fișierul .git/index (fără procese git)
+Indexul este mapat în memorie (mmap) și parsat direct în Python: versiunile
+2, 3 și 4 (cu comprimarea prefixului căilor), plus extensia TREE (cache-tree).
+Din index se obțin:
+
+- fișierele pregătite pentru commit (echivalentul 'git diff --cached
+  --name-status --no-renames'), comparând indexul cu tree-ul lui HEAD;
+  subdirectoarele a căror intrare cache-tree este validă și identică cu
+  tree-ul din HEAD sunt sărite complet, deci după un commit răspunsul este
+  imediat indiferent de numărul de fișiere
+- fișierele "probabil modificate" în working tree, comparând datele stat()
+  din index cu cele de pe disc (ca git), cu verificarea conținutului doar
+  pentru intrările "racy" sau cu stat diferit și aceeași dimensiune
+
+Indexul parsat este păstrat în memorie cât timp fișierul nu se schimbă.
+Cazurile neacoperite (split index, SHA-256, extensii obligatorii
+necunoscute) ridică UnsupportedIndex, iar apelantul folosește git.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import stat
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+from git_objects import OID_SIZE, parse_tree
+from git_state import git_common_dir, git_dir
+
+INDEX_MAGIC = b'DIRC'
+SUPPORTED_VERSIONS = (2, 3, 4)
+
+# ctime, mtime (secunde + nanosecunde), dev, ino, mod, uid, gid, dimensiune, hash, flag-uri
+ENTRY_HEADER = struct.Struct('>10I20sH')
+ENTRY_FLAGS = struct.Struct('>H')
+FLAGS_OFFSET = ENTRY_HEADER.size - ENTRY_FLAGS.size
+EXTENDED_FLAGS = struct.Struct('>H')
+EXTENSION_HEADER = struct.Struct('>4sI')
+
+FLAG_EXTENDED = 0x4000
+FLAG_STAGE_SHIFT = 12
+NAME_MASK = 0x0fff
+EXTENDED_SKIP_WORKTREE = 0x4000
+EXTENDED_INTENT_TO_ADD = 0x2000
+
+GITLINK_MODE = 0o160000
+SPARSE_DIR_MODE = 0o040000
+HASH_CHUNK = 1024 * 1024
+
+IndexEntry = namedtuple('IndexEntry', 'path mode oid stage extended ctime_ns mtime_ns ino size')
+
+
+class UnsupportedIndex(Exception):
+    """Index pe care cititorul nu îl poate interpreta (se folosește git)"""
+
+
+def _varint(data, position):
+    # Codificarea din versiunea 4 (aceeași ca pentru OFS_DELTA)
+    byte = data[position]
+    value = byte & 0x7f
+    while byte & 0x80:
+        position += 1
+        byte = data[position]
+        value = ((value + 1) << 7) | (byte & 0x7f)
+    return value, position + 1
+
+
+def _decode(name):
+    return name.decode('utf-8', errors='surrogateescape')
+
+
+class GitIndex:
+    """
+    Intrările unui fișier index, sortate după cale (ca în git). La citire se
+    decodifică doar căile și pozițiile intrărilor; restul câmpurilor sunt
+    citite din index la cerere (entry()).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.version = None
+        self.data = b''
+        self.paths = []
+        self.offsets = array('Q')
+        self.cache_tree = None
+        self.mtime_ns = 0
+
+        try:
+            with open(path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                self.mtime_ns = st.st_mtime_ns
+                if st.st_size == 0:
+                    return
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            # Repository nou: indexul apare la primul 'git add'
+            return
+
+        try:
+            self._parse(data)
+        except Exception:
+            data.close()
+            raise
+        if os.name == 'posix':
+            # git înlocuiește indexul prin redenumire: maparea veche rămâne validă
+            self.data = data
+        else:
+            # Pe Windows un fișier mapat nu poate fi înlocuit, deci git ar eșua
+            self.data = data[:]
+            data.close()
+
+    def _parse(self, data):
+        if len(data) < 12 + OID_SIZE or data[:4] != INDEX_MAGIC:
+            raise UnsupportedIndex('Semnătură index invalidă')
+        self.version, count = struct.unpack_from('>II', data, 4)
+        if self.version not in SUPPORTED_VERSIONS:
+            raise UnsupportedIndex(f'Versiune index necunoscută: {self.version}')
+
+        offset = self._parse_entries(data, count)
+        end = len(data) - OID_SIZE
+        while offset + EXTENSION_HEADER.size <= end:
+            signature, size = EXTENSION_HEADER.unpack_from(data, offset)
+            body = offset + EXTENSION_HEADER.size
+            if signature == b'TREE':
+                self.cache_tree = self._parse_cache_tree(data[body:body + size])
+            elif signature == b'link':
+                raise UnsupportedIndex('Split index')
+            elif not (65 <= signature[0] <= 90) and signature != b'sdir':
+                # Extensiile cu literă mică sunt obligatorii: fără ele indexul ar fi citit greșit
+                raise UnsupportedIndex(f'Extensie index necunoscută: {signature!r}')
+            offset = body + size
+
+    def _parse_entries(self, data, count):
+        paths = []
+        offsets = array('Q')
+        append_path = paths.append
+        append_offset = offsets.append
+        unpack_flags = ENTRY_FLAGS.unpack_from
+        find = data.find
+        version = self.version
+        previous = b''
+        offset = 12
+
+        for _ in range(count):
+            flags = unpack_flags(data, offset + FLAGS_OFFSET)[0]
+            append_offset(offset)
+            position = offset + ENTRY_HEADER.size
+            if flags & FLAG_EXTENDED:
+                if version < 3:
+                    raise UnsupportedIndex('Flag-uri extinse într-un index v2')
+                position += EXTENDED_FLAGS.size
+
+            if version == 4:
+                # Calea = calea anterioară fără ultimii `strip` octeți + sufixul
+                strip, position = _varint(data, position)
+                end = find(b'\0', position)
+                name = previous[:len(previous) - strip] + data[position:end]
+                previous = name
+                offset = end + 1
+            else:
+                length = flags & NAME_MASK
+                end = position + length if length < NAME_MASK else find(b'\0', position + NAME_MASK)
+                name = data[position:end]
+                # Intrarea este completată cu 1-8 octeți NUL până la un multiplu de 8
+                offset += (end - offset + 8) & ~7
+            append_path(_decode(name))
+
+        self.paths = paths
+        self.offsets = offsets
+        return offset
+
+    @staticmethod
+    def _parse_cache_tree(data):
+        """Nodurile cache-tree: {'entry_count', 'oid', 'children'} (entry_count -1 = invalid)"""
+        position = 0
+
+        def read_node():
+            nonlocal position
+            null = data.index(b'\0', position)
+            name = _decode(data[position:null])
+            newline = data.index(b'\n', null)
+            entry_count, subtrees = (int(value) for value in data[null + 1:newline].split(b' '))
+            position = newline + 1
+            oid = None
+            if entry_count >= 0:
+                oid = data[position:position + OID_SIZE].hex()
+                position += OID_SIZE
+            children = {}
+            for _ in range(subtrees):
+                child_name, child = read_node()
+                children[child_name] = child
+            return name, {'entry_count': entry_count, 'oid': oid, 'children': children}
+
+        return read_node()[1] if data else None
+
+    def entry(self, position):
+        """Intrarea cu numărul dat, decodificată complet"""
+        offset = self.offsets[position]
+        (ctime_s, ctime_ns, mtime_s, mtime_ns, _, ino, mode, _, _, size,
+         oid, flags) = ENTRY_HEADER.unpack_from(self.data, offset)
+        extended = 0
+        if flags & FLAG_EXTENDED:
+            extended = EXTENDED_FLAGS.unpack_from(self.data, offset + ENTRY_HEADER.size)[0]
+        return IndexEntry(self.paths[position], mode, oid, (flags >> FLAG_STAGE_SHIFT) & 3, extended,
+                          ctime_s * 1_000_000_000 + ctime_ns, mtime_s * 1_000_000_000 + mtime_ns,
+                          ino, size)
+
+    def __iter__(self):
+        return (self.entry(position) for position in range(len(self.paths)))
+
+    def __len__(self):
+        return len(self.paths)
+
+    # --- Fișiere pregătite pentru commit ---
+
+    def staged(self, repo):
+        """
+        Diferențele index - HEAD: [{status, path}] cu stările A, M, D, T
+        și U (conflict), sortate ca în git. `repo` este un
+        git_objects.Repository pentru același repository.
+        """
+        head = repo.resolve('HEAD')
+        tree_oid = repo.commit(head)['tree'] if head else None
+        changes = []
+        self._diff_tree(repo, '', tree_oid, 0, len(self.paths), self.cache_tree, changes)
+        changes.sort(key=lambda change: change['path'])
+        return changes
+
+    def _directory_end(self, directory, start, end, node):
+        # Intervalul de intrări al unui director: din cache-tree dacă este valid, altfel căutare binară
+        if node is not None and node['entry_count'] > 0:
+            candidate = start + node['entry_count']
+            if (candidate <= end and self.paths[candidate - 1].startswith(directory)
+                    and (candidate == end or not self.paths[candidate].startswith(directory))):
+                return candidate
+        # Căile din director sunt între 'dir/' și 'dir0' ('0' urmează după '/')
+        return bisect_left(self.paths, directory[:-1] + '0', start, end)
+
+    def _diff_tree(self, repo, prefix, tree_oid, start, end, node, changes):
+        if tree_oid is not None and node is not None and node['entry_count'] >= 0 and node['oid'] == tree_oid:
+            return    # subdirector neschimbat de la ultimul commit
+
+        head_entries = {}
+        if tree_oid is not None:
+            head_entries = {name: (int(mode, 8), oid) for mode, name, oid in parse_tree(repo.objects.read(tree_oid)[1])}
+        children = node['children'] if node is not None else {}
+        paths = self.paths
+
+        position = start
+        while position < end:
+            rest = paths[position][len(prefix):]
+            slash = rest.find('/')
+
+            if slash == len(rest) - 1:
+                # Intrare de director dintr-un sparse index: neschimbată doar dacă tree-ul este identic
+                entry = self.entry(position)
+                head = head_entries.pop(rest[:-1], None)
+                if entry.mode != SPARSE_DIR_MODE or head is None or head[1] != entry.oid.hex():
+                    raise UnsupportedIndex('Sparse index modificat')
+                position += 1
+                continue
+
+            if slash >= 0:
+                name = rest[:slash]
+                directory = prefix + name + '/'
+                next_position = self._directory_end(directory, position, end, children.get(name))
+                head = head_entries.pop(name, None)
+                head_tree = None
+                if head is not None:
+                    if stat.S_ISDIR(head[0]):
+                        head_tree = head[1]
+                    else:
+                        changes.append({'status': 'D', 'path': prefix + name})
+                self._diff_tree(repo, directory, head_tree, position, next_position, children.get(name), changes)
+                position = next_position
+                continue
+
+            entry = self.entry(position)
+            next_position = position + 1
+            while next_position < end and paths[next_position] == paths[position]:
+                next_position += 1
+            head = head_entries.pop(rest, None)
+            if head is not None and stat.S_ISDIR(head[0]):
+                self._deleted(repo, entry.path + '/', head[1], changes)
+                head = None
+
+            if next_position - position > 1 or entry.stage:
+                changes.append({'status': 'U', 'path': entry.path})
+            elif entry.extended & EXTENDED_INTENT_TO_ADD:
+                # 'git add -N': apare ca fișier nou doar în diferențele față de working tree
+                if head is not None:
+                    changes.append({'status': 'D', 'path': entry.path})
+            elif head is None:
+                changes.append({'status': 'A', 'path': entry.path})
+            elif head[1] != entry.oid.hex() or head[0] != entry.mode:
+                same_type = stat.S_IFMT(head[0]) == stat.S_IFMT(entry.mode)
+                changes.append({'status': 'M' if same_type else 'T', 'path': entry.path})
+            position = next_position
+
+        for name, (mode, oid) in head_entries.items():
+            if stat.S_ISDIR(mode):
+                self._deleted(repo, prefix + name + '/', oid, changes)
+            else:
+                changes.append({'status': 'D', 'path': prefix + name})
+
+    def _deleted(self, repo, prefix, tree_oid, changes):
+        for mode, name, oid in parse_tree(repo.objects.read(tree_oid)[1]):
+            if mode.startswith('4'):
+                self._deleted(repo, prefix + name + '/', oid, changes)
+            else:
+                changes.append({'status': 'D', 'path': prefix + name})
+
+    # --- Fișiere modificate în working tree ---
+
+    def modified(self, worktree, verify=True):
+        """
+        Fișierele urmărite care probabil diferă de index: [{status, path}] cu
+        M (modificat), D (șters) sau A ('git add -N'). Intrările cu stat
+        identic și mai vechi decât indexul sunt considerate neschimbate fără
+        a fi citite; cu verify=True, celelalte intrări cu aceeași dimensiune
+        sunt confirmate prin hash-ul conținutului. Fișierele netrasate nu
+        sunt incluse.
+        """
+        check_mode = os.name == 'posix'
+        changes = []
+        for entry in self:
+            if (entry.stage or entry.extended & EXTENDED_SKIP_WORKTREE
+                    or entry.mode in (GITLINK_MODE, SPARSE_DIR_MODE)):
+                continue
+            if entry.extended & EXTENDED_INTENT_TO_ADD:
+                changes.append({'status': 'A', 'path': entry.path})
+                continue
+
+            path = os.path.join(worktree, entry.path)
+            try:
+                st = os.lstat(path)
+            except (FileNotFoundError, NotADirectoryError):
+                changes.append({'status': 'D', 'path': entry.path})
+                continue
+
+            if stat.S_IFMT(st.st_mode) != stat.S_IFMT(entry.mode) or (
+                    check_mode and stat.S_ISREG(st.st_mode) and (st.st_mode & 0o100) != (entry.mode & 0o100)):
+                changes.append({'status': 'M', 'path': entry.path})
+                continue
+
+            size = st.st_size & 0xffffffff
+            same_stat = (size == entry.size and st.st_mtime_ns == entry.mtime_ns
+                         and st.st_ctime_ns == entry.ctime_ns
+                         and (not entry.ino or (st.st_ino & 0xffffffff) == entry.ino))
+            # "Racy": fișierul s-a putut schimba în aceeași clipă în care a fost scris indexul
+            if same_stat and entry.mtime_ns < self.mtime_ns:
+                continue
+            # Dimensiunea 0 în index poate fi o intrare "racy" marcată de git: decide conținutul
+            if size != entry.size and entry.size != 0:
+                changes.append({'status': 'M', 'path': entry.path})
+                continue
+            if verify and self._content_matches(path, st, entry):
+                continue
+            changes.append({'status': 'M', 'path': entry.path})
+        return changes
+
+    @staticmethod
+    def _content_matches(path, st, entry):
+        try:
+            if stat.S_ISLNK(st.st_mode):
+                data = os.fsencode(os.readlink(path))
+                digest = hashlib.sha1(b'blob %d\0' % len(data) + data)
+            else:
+                digest = hashlib.sha1(b'blob %d\0' % st.st_size)
+                with open(path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(HASH_CHUNK), b''):
+                        digest.update(chunk)
+        except OSError:
+            return False
+        return digest.digest() == entry.oid
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def read_index(project_path):
+    """Indexul worktree-ului, reparsat doar când fișierul s-a schimbat"""
+    path = os.path.join(git_dir(project_path), 'index')
+    try:
+        st = os.stat(path)
+        stamp = (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+    except FileNotFoundError:
+        stamp = None
+
+    with _indexes_lock:
+        cached = _indexes.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    try:
+        with open(os.path.join(git_common_dir(project_path), 'config'), 'rb') as f:
+            config = f.read().decode('utf-8', errors='replace')
+    except OSError:
+        config = ''
+    if re.search(r'objectformat\s*=\s*sha256', config, re.IGNORECASE):
+        raise UnsupportedIndex('Repository SHA-256')
+
+    index = GitIndex(path)
+    with _indexes_lock:
+        _indexes[path] = (stamp, index)
+    return index
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Mentenanță automată în fundal
+Când serverul nu are cereri active de ceva timp, scheduler-ul compactează
+repository-ul (gc, repack, commit-graph, multi-pack-index, prune-packed)
+și măsoară 'git status' / 'git log' înainte și după fiecare rulare.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+
+from git_bloat import BloatAnalyzer
+from git_governor import run_process
+from git_state import git_common_dir, state_dir
+
+# Fișiere de lock create de git în timpul operațiilor de scriere
+GIT_LOCK_FILES = ('index.lock', 'HEAD.lock', 'packed-refs.lock', 'config.lock', 'shallow.lock', 'gc.pid')
+
+# Praguri după care un task devine necesar (similare cu gc.auto / gc.autoPackLimit)
+LOOSE_OBJECTS_LIMIT = 6700
+PACK_LIMIT = 50
+
+HISTORY_LIMIT = 50
+MEASURE_RUNS = 3
+
+
+def measured_operations():
+    """Operațiile a căror durată este urmărită (aceleași ca în get_status / get_commit_history)"""
+    return {
+        'status': ['git', 'status', '--porcelain'],
+        'log': ['git', 'log', '--oneline', '--graph', '--decorate', '-200']
+    }
+
+
+class MaintenanceScheduler:
+    """Rulează mentenanța repository-ului în perioadele fără activitate"""
+
+    def __init__(self, get_project_path, idle_seconds=300, min_interval=6 * 3600, check_interval=60):
+        self.get_project_path = get_project_path
+        self.idle_seconds = idle_seconds
+        self.min_interval = min_interval
+        self.check_interval = check_interval
+
+        self.last_activity = time.monotonic()
+        self.active_requests = 0
+        self.last_run = None
+        self.running = False
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    # --- Activitate ---
+
+    def request_started(self, write=False):
+        """
+        Marchează începutul unei cereri. Doar operațiile de scriere resetează
+        perioada de inactivitate; citirile periodice (auto-refresh) nu.
+        """
+        with self._lock:
+            self.active_requests += 1
+            if write:
+                self.last_activity = time.monotonic()
+
+    def request_finished(self, write=False):
+        with self._lock:
+            self.active_requests = max(0, self.active_requests - 1)
+            if write:
+                self.last_activity = time.monotonic()
+
+    def is_idle(self):
+        with self._lock:
+            return (self.active_requests == 0 and
+                    time.monotonic() - self.last_activity >= self.idle_seconds)
+
+    # --- Fir de execuție ---
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='git-maintenance', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _loop(self):
+        while not self._stop.wait(self.check_interval):
+            if self.running or not self.is_idle():
+                continue
+            if self.last_run is not None and time.monotonic() - self.last_run < self.min_interval:
+                continue
+            try:
+                self.run()
+            except Exception:
+                # Mentenanța nu trebuie să oprească niciodată serverul
+                pass
+
+    def run_in_background(self, force=False):
+        """Pornește imediat o rulare (din API), fără a bloca cererea"""
+        if self.running:
+            return {'success': False, 'message': 'Mentenanța rulează deja'}
+        thread = threading.Thread(target=self.run, kwargs={'force': force, 'manual': True}, daemon=True)
+        thread.start()
+        return {'success': True, 'message': 'Mentenanță pornită în fundal'}
+
+    # --- Mentenanță ---
+
+    def locked_files(self, project_path):
+        """Lock-urile git existente (altă operație este în curs)"""
+        git_dir = git_common_dir(project_path)
+        return [name for name in GIT_LOCK_FILES if os.path.exists(os.path.join(git_dir, name))]
+
+    def plan_tasks(self, pack, force=False):
+        """Alege task-urile necesare pe baza statisticilor de pachete"""
+        tasks = []
+
+        if force or pack['loose_objects'] >= LOOSE_OBJECTS_LIMIT or pack['pack_count'] >= PACK_LIMIT:
+            tasks.append(('gc', ['git', 'gc', '--quiet']))
+        elif pack['pack_count'] > 1 or pack['loose_objects'] > 0:
+            tasks.append(('repack', ['git', 'repack', '-d', '-l', '--geometric=2']))
+
+        if force or pack['prune_packable']:
+            tasks.append(('prune-packed', ['git', 'prune-packed']))
+
+        tasks.append(('commit-graph', ['git', 'commit-graph', 'write', '--reachable', '--split']))
+        tasks.append(('multi-pack-index', ['git', 'multi-pack-index', 'write']))
+        return tasks
+
+    def measure(self, project_path):
+        """Cea mai bună durată (ms) din câteva rulări pentru fiecare operație urmărită"""
+        timings = {}
+        for name, command in measured_operations().items():
+            best = None
+            for _ in range(MEASURE_RUNS):
+                # Durata procesului, fără așteptarea la coada guvernatorului
+                elapsed = run_process(command, project_path, text=False).duration_ms
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = round(best, 2)
+        return timings
+
+    def run(self, force=False, manual=False):
+        """
+        Execută o rulare completă și o salvează în istoric.
+
+        force rulează toate task-urile (inclusiv gc). O rulare automată
+        (manual=False) se oprește dacă utilizatorul revine între task-uri.
+        """
+        project_path = self.get_project_path()
+        if not os.path.exists(os.path.join(project_path, '.git')):
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+
+        with self._lock:
+            if self.running:
+                return {'success': False, 'message': 'Mentenanța rulează deja'}
+            self.running = True
+
+        # Intervalul minim începe doar după o rulare în care cel puțin un task a rulat efectiv;
+        # o rulare oprită de un lock sau de activitate este reîncercată la următoarea verificare
+        ran = False
+        try:
+            locks = self.locked_files(project_path)
+            if locks:
+                return {'success': False, 'message': f'Repository blocat de o altă operație: {", ".join(locks)}'}
+
+            activity_mark = self.last_activity
+            analyzer = BloatAnalyzer(project_path)
+            pack_before = analyzer.pack_statistics()
+            started = time.perf_counter()
+            entry = {
+                'started_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'before': self.measure(project_path),
+                'tasks': []
+            }
+
+            for name, command in self.plan_tasks(pack_before, force):
+                locks = self.locked_files(project_path)
+                if locks:
+                    entry['tasks'].append({'name': name, 'success': False, 'skipped': True,
+                                           'error': f'Lock activ: {", ".join(locks)}'})
+                    continue
+                # Dacă utilizatorul a revenit, restul task-urilor așteaptă următoarea rulare
+                if not manual and self.last_activity != activity_mark:
+                    entry['tasks'].append({'name': name, 'success': False, 'skipped': True,
+                                           'error': 'Activitate detectată'})
+                    continue
+
+                task_start = time.perf_counter()
+                ran = True
+                result = run_process(command, project_path, operation='maintenance')
+                error = None
+                if result.returncode != 0:
+                    error = result.stderr.strip() or f'Cod de ieșire {result.returncode}'
+                entry['tasks'].append({
+                    'name': name,
+                    'success': result.returncode == 0,
+                    'duration_ms': round((time.perf_counter() - task_start) * 1000, 2),
+                    'error': error
+                })
+
+            entry['after'] = self.measure(project_path)
+            entry['duration_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            pack_after = analyzer.pack_statistics()
+            entry['pack_before'] = {key: pack_before[key] for key in ('loose_objects', 'pack_count', 'pack_size')}
+            entry['pack_after'] = {key: pack_after[key] for key in ('loose_objects', 'pack_count', 'pack_size')}
+            entry['improvement'] = {
+                name: round(entry['before'][name] - entry['after'][name], 2) for name in entry['before']
+            }
+
+            self.save_entry(project_path, entry)
+            return {'success': True, 'message': 'Mentenanță finalizată', 'run': entry}
+        finally:
+            if ran:
+                self.last_run = time.monotonic()
+            self.running = False
+
+    # --- Istoric ---
+
+    def history_path(self, project_path):
+        return os.path.join(state_dir(project_path), 'maintenance.json')
+
+    def load_history(self, project_path):
+        try:
+            with open(self.history_path(project_path), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def save_entry(self, project_path, entry):
+        history = self.load_history(project_path)
+        history.append(entry)
+        with open(self.history_path(project_path), 'w', encoding='utf-8') as f:
+            json.dump(history[-HISTORY_LIMIT:], f, indent=2, ensure_ascii=False)
+
+    def get_status(self):
+        project_path = self.get_project_path()
+        if not os.path.exists(os.path.join(project_path, '.git')):
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+
+        return {
+            'success': True,
+            'running': self.running,
+            'idle': self.is_idle(),
+            'history': self.load_history(project_path)
+        }
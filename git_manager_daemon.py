@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Daemon rezident cu cache-uri calde
+Un proces de fundal (opțional) păstrează, pentru fiecare repository folosit,
+rezultatele comenzilor de citire frecvente (status, branch-uri, istoric,
+versiunea git). CLI-ul și aplicația web îl întreabă printr-un socket Unix
+local și primesc imediat răspunsul din cache; daemon-ul îl reîmprospătează
+în fundal. Dacă daemon-ul nu rulează, clienții execută comenzile direct.
+
+Validarea cache-ului:
+- branch-uri / istoric: amprenta stat() a HEAD, refs, packed-refs, logs/HEAD
+- status: aceeași amprentă + index și fișierul sparse-checkout; în plus,
+  un răspuns mai vechi de câteva secunde este returnat ca "stale" și
+  recalculat în fundal (modificările din working tree nu au amprentă ieftină)
+- un răspuns mai vechi de MAX_STALE_FACTOR × vârsta maximă nu mai este
+  servit: este recalculat imediat, iar repository-urile nefolosite de
+  ACTIVE_SECONDS sunt scoase din cache
+
+Pornire: python git_manager_daemon.py start|stop|status
+"""
+
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from git_governor import run_process
+from git_sparse import SparseCheckoutManager
+from git_state import git_common_dir, git_dir
+
+SOCKET_ENV = 'GIT_MANAGER_SOCKET'
+CLIENT_TIMEOUT = 5
+IDLE_TIMEOUT = 30 * 60          # daemon-ul se oprește după 30 de minute fără cereri
+ACTIVE_SECONDS = 5 * 60         # repository-urile folosite recent sunt ținute calde
+REFRESH_INTERVAL = 2
+REFRESH_WORKERS = 4
+HISTORY_WINDOW = 1000           # commit-uri păstrate în cache pentru 'history'
+MAX_RESPONSE_BYTES = 64 * 1024 * 1024
+
+STAT_NAMES = {'hit': 'hits', 'stale': 'stale', 'miss': 'misses'}
+
+# Vârsta maximă (secunde) a unui răspuns servit ca proaspăt
+MAX_AGE = {
+    'git_info': 300,
+    'status': 3,
+    'branch': 60,
+    'branches': 60,
+    'history': 60
+}
+# Peste MAX_STALE_FACTOR × MAX_AGE, răspunsul din cache este recalculat înainte de a fi returnat
+MAX_STALE_FACTOR = 5
+
+
+def default_socket_path():
+    """Socket per utilizator, într-un director accesibil doar lui"""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    base = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, 'getuid') else os.environ.get('USERNAME', 'user')
+    return os.path.join(base, f'git-manager-{uid}', 'daemon.sock')
+
+
+def _stat(path):
+    try:
+        info = os.stat(path)
+        return info.st_mtime_ns, info.st_size
+    except OSError:
+        return None
+
+
+class RepoCache:
+    """Rezultatele din cache pentru un repository (cheie = interogare + parametri)"""
+
+    def __init__(self, path):
+        # path = None: interogările globale (versiunea git), fără repository
+        self.path = path
+        self.git_dir = git_dir(path) if path else None
+        self.common_dir = git_common_dir(path) if path else None
+        self.entries = {}
+        self.last_used = time.time()
+        self.lock = threading.Lock()
+
+    def stamp(self, name):
+        """Amprenta ieftină (doar stat()) a stării de care depinde interogarea"""
+        refs = (
+            _stat(os.path.join(self.git_dir, 'HEAD')),
+            _stat(os.path.join(self.git_dir, 'logs', 'HEAD')),
+            _stat(os.path.join(self.common_dir, 'packed-refs'))
+        )
+        # Și subdirectoarele (feature/x): o referință actualizată schimbă doar mtime-ul directorului ei
+        refs += tuple((directory, _stat(directory))
+                      for directory, _, _ in os.walk(os.path.join(self.common_dir, 'refs', 'heads')))
+        if name != 'status':
+            return refs
+        return refs + (
+            _stat(os.path.join(self.git_dir, 'index')),
+            _stat(os.path.join(self.git_dir, 'info', 'sparse-checkout'))
+        )
+
+
+class ManagerDaemon:
+    """Serverul: cache-uri per repository și reîmprospătare în fundal"""
+
+    def __init__(self, socket_path=None, idle_timeout=IDLE_TIMEOUT, refresh_interval=REFRESH_INTERVAL):
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.refresh_interval = refresh_interval
+        self.repos = {}
+        self.repos_lock = threading.Lock()
+        self.refreshing = set()
+        self.pool = ThreadPoolExecutor(max_workers=REFRESH_WORKERS)
+        self.last_request = time.time()
+        self.started_at = time.time()
+        self.stats = {'requests': 0, 'hits': 0, 'stale': 0, 'misses': 0}
+        self.server = None
+
+    # --- Comenzile git din spatele fiecărei interogări ---
+
+    def _command(self, repo, name, params):
+        if name == 'status':
+            pathspecs = SparseCheckoutManager(repo.path).pathspecs()
+            return (['git', 'status', '--porcelain'] + (['-z'] if params.get('nul') else []) +
+                    (['--'] + pathspecs if pathspecs else []))
+        if name == 'branch':
+            return ['git', 'branch', '--show-current']
+        if name == 'branches':
+            return ['git', 'branch'] + ([f'--format={params["format"]}'] if params.get('format') else [])
+        if name == 'history':
+            return ['git', 'log', f'--format={params["format"]}', '-z', f'-{HISTORY_WINDOW}']
+        raise ValueError(f'Interogare necunoscută: {name}')
+
+    def _run(self, command, cwd=None):
+        result = run_process(command, cwd)
+        if result.returncode != 0:
+            return {'success': False, 'output': None, 'error': result.stderr or f'Cod de ieșire {result.returncode}'}
+        return {'success': True, 'output': result.stdout, 'error': None}
+
+    def _git_info(self):
+        """Echivalentul GitManager.check_git_installation (versiune + identitate globală)"""
+        version = self._run(['git', '--version'])
+        if not version['success']:
+            return {'success': False, 'output': None, 'error': version['error']}
+        info = {'version': version['output'].strip()}
+        for key in ('name', 'email'):
+            result = self._run(['git', 'config', '--global', f'user.{key}'])
+            info[key] = result['output'].strip() if result['success'] else None
+        return {'success': True, 'output': info, 'error': None}
+
+    def _compute(self, repo, name, params):
+        if name == 'git_info':
+            return self._git_info()
+        return self._run(self._command(repo, name, params), repo.path)
+
+    # --- Cache ---
+
+    def _repo(self, path):
+        with self.repos_lock:
+            repo = self.repos.get(path)
+            if repo is None:
+                repo = self.repos[path] = RepoCache(path)
+            repo.last_used = time.time()
+            return repo
+
+    def _refresh(self, repo, name, params, key):
+        stamp = repo.stamp(name) if repo.path else None
+        result = self._compute(repo, name, params)
+        with repo.lock:
+            repo.entries[key] = {'result': result, 'stamp': stamp, 'computed_at': time.time(),
+                                 'name': name, 'params': params}
+        return result
+
+    def _refresh_in_background(self, repo, name, params, key):
+        token = (repo.path, key)
+        with self.repos_lock:
+            if token in self.refreshing:
+                return
+            self.refreshing.add(token)
+
+        def job():
+            try:
+                self._refresh(repo, name, params, key)
+            finally:
+                with self.repos_lock:
+                    self.refreshing.discard(token)
+
+        self.pool.submit(job)
+
+    def query(self, path, name, params, fresh=False):
+        if name not in MAX_AGE:
+            raise ValueError(f'Interogare necunoscută: {name}')
+        if name != 'git_info':
+            path = os.path.realpath(path or '')
+            if not os.path.isdir(path):
+                raise ValueError(f'Director inexistent: {path}')
+        else:
+            path = None
+
+        repo = self._repo(path)
+        cache_params = {key: value for key, value in params.items() if key in ('nul', 'format')}
+        key = json.dumps([name, cache_params], sort_keys=True)
+        with repo.lock:
+            entry = repo.entries.get(key)
+
+        state = 'miss'
+        if entry and not fresh and (repo.path is None or entry['stamp'] == repo.stamp(name)):
+            age = time.time() - entry['computed_at']
+            if age <= MAX_AGE[name]:
+                state = 'hit'
+            elif age <= MAX_AGE[name] * MAX_STALE_FACTOR:
+                # Răspuns imediat, iar următorul va fi din nou proaspăt
+                state = 'stale'
+                self._refresh_in_background(repo, name, cache_params, key)
+            # Altfel e prea vechi (repository nefolosit o vreme): recalculat acum, ca un miss
+        if state != 'miss':
+            result = entry['result']
+        else:
+            result = self._refresh(repo, name, cache_params, key)
+            age = 0
+        self.stats[STAT_NAMES[state]] += 1
+
+        if name == 'history':
+            result = self._history_slice(repo, result, params)
+        return dict(result, cached=state != 'miss', stale=state == 'stale', age_ms=round(age * 1000))
+
+    def _history_slice(self, repo, result, params):
+        """Istoricul este păstrat pentru ultimele HISTORY_WINDOW commit-uri și servit pe bucăți"""
+        limit, skip = int(params.get('limit', 10)), int(params.get('skip', 0))
+        if limit + skip > HISTORY_WINDOW:
+            command = ['git', 'log', f'--format={params["format"]}', '-z', f'-{limit}', f'--skip={skip}']
+            return self._run(command, repo.path)
+        if not result['success']:
+            return result
+        records = [record for record in result['output'].split('\0') if record.strip()]
+        return dict(result, output='\0'.join(records[skip:skip + limit]))
+
+    def invalidate(self, path=None):
+        with self.repos_lock:
+            if path is None:
+                self.repos.clear()
+            else:
+                self.repos.pop(os.path.realpath(path), None)
+
+    def _refresher(self):
+        """Ține calde cache-urile repository-urilor folosite recent"""
+        while True:
+            time.sleep(self.refresh_interval)
+            now = time.time()
+            if now - self.last_request > self.idle_timeout:
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+            with self.repos_lock:
+                # Repository-urile nefolosite sunt scoase din cache, nu doar lăsate să se învechească
+                for path in [path for path, repo in self.repos.items()
+                             if path and now - repo.last_used > ACTIVE_SECONDS]:
+                    del self.repos[path]
+                repos = [repo for path, repo in self.repos.items() if path]
+            for repo in repos:
+                with repo.lock:
+                    entries = [(key, entry) for key, entry in repo.entries.items()]
+                for key, entry in entries:
+                    # Recalculat înainte să expire, deci clientul primește de regulă un răspuns proaspăt
+                    expires_soon = now - entry['computed_at'] + self.refresh_interval > MAX_AGE[entry['name']]
+                    if expires_soon or entry['stamp'] != repo.stamp(entry['name']):
+                        self._refresh_in_background(repo, entry['name'], entry['params'], key)
+
+    # --- Protocol: o cerere JSON pe linie, un răspuns JSON pe linie ---
+
+    def handle(self, request):
+        self.last_request = time.time()
+        self.stats['requests'] += 1
+        op = request.get('op')
+        if op == 'ping':
+            return {'ok': True, 'pid': os.getpid(), 'uptime': round(time.time() - self.started_at)}
+        if op == 'query':
+            return {'ok': True, 'result': self.query(request.get('path'), request.get('name'),
+                                                     request.get('params') or {}, bool(request.get('fresh')))}
+        if op == 'invalidate':
+            self.invalidate(request.get('path'))
+            return {'ok': True}
+        if op == 'stats':
+            return {'ok': True, 'pid': os.getpid(), 'uptime': round(time.time() - self.started_at),
+                    'repositories': [path for path in self.repos if path], **self.stats}
+        if op == 'shutdown':
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return {'ok': True}
+        return {'ok': False, 'error': f'Operație necunoscută: {op}'}
+
+    def serve(self):
+        directory = os.path.dirname(self.socket_path)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if DaemonClient(self.socket_path).ping():
+            raise RuntimeError(f'Daemon-ul rulează deja ({self.socket_path})')
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)     # socket rămas de la un daemon oprit forțat
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        response = daemon.handle(json.loads(line))
+                    except Exception as e:
+                        response = {'ok': False, 'error': str(e)}
+                    self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                    self.wfile.flush()
+
+        self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, Handler)
+        self.server.daemon_threads = True
+        os.chmod(self.socket_path, 0o600)
+        threading.Thread(target=self._refresher, name='git-manager-refresher', daemon=True).start()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.server.server_close()
+            self.pool.shutdown(wait=False)
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+class DaemonClient:
+    """
+    Client pentru daemon. Toate metodele returnează None dacă daemon-ul nu
+    rulează (sau nu răspunde), iar apelantul execută comanda direct.
+    """
+
+    def __init__(self, socket_path=None, timeout=CLIENT_TIMEOUT):
+        self.socket_path = socket_path or default_socket_path()
+        self.timeout = timeout
+
+    def request(self, payload):
+        if not hasattr(socket, 'AF_UNIX') or not os.path.exists(self.socket_path):
+            return None
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+                connection.settimeout(self.timeout)
+                connection.connect(self.socket_path)
+                connection.sendall(json.dumps(payload).encode('utf-8') + b'\n')
+                data = b''
+                while not data.endswith(b'\n') and len(data) < MAX_RESPONSE_BYTES:
+                    chunk = connection.recv(65536)
+                    if not chunk:
+                        break
+                    data += chunk
+            response = json.loads(data)
+        except (OSError, ValueError):
+            return None
+        return response if response.get('ok') else None
+
+    def ping(self):
+        return self.request({'op': 'ping'})
+
+    def query_request(self, path, name, fresh=False, **params):
+        return {'op': 'query', 'path': os.path.abspath(path) if path else None,
+                'name': name, 'params': params, 'fresh': fresh}
+
+    def query(self, path, name, fresh=False, **params):
+        """Rezultatul unei interogări: {'success', 'output', 'error', 'cached', 'stale', 'age_ms'}"""
+        response = self.request(self.query_request(path, name, fresh, **params))
+        return response['result'] if response else None
+
+    def git_info(self):
+        result = self.query(None, 'git_info')
+        return result['output'] if result and result['success'] else None
+
+    def invalidate(self, path=None):
+        return self.request({'op': 'invalidate', 'path': os.path.abspath(path) if path else None})
+
+    def stats(self):
+        return self.request({'op': 'stats'})
+
+    def shutdown(self):
+        return self.request({'op': 'shutdown'})
+
+
+def start_daemon(socket_path=None, wait=3.0):
+    """Pornește daemon-ul ca proces detașat și așteaptă să răspundă"""
+    client = DaemonClient(socket_path)
+    if client.ping():
+        return {'success': True, 'message': 'Daemon-ul rulează deja', 'socket': client.socket_path}
+    if not hasattr(socket, 'AF_UNIX'):
+        return {'success': False, 'message': 'Daemon-ul necesită socket-uri Unix'}
+
+    env = dict(os.environ, **{SOCKET_ENV: client.socket_path})
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), 'run'],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+        start_new_session=True
+    )
+    deadline = time.time() + wait
+    while time.time() < deadline:
+        if client.ping():
+            return {'success': True, 'message': 'Daemon pornit', 'socket': client.socket_path}
+        time.sleep(0.05)
+    return {'success': False, 'message': 'Daemon-ul nu a pornit'}
+
+
+def stop_daemon(socket_path=None):
+    client = DaemonClient(socket_path)
+    if not client.shutdown():
+        return {'success': True, 'message': 'Daemon-ul nu rulează'}
+    return {'success': True, 'message': 'Daemon oprit'}
+
+
+def daemon_status(socket_path=None):
+    stats = DaemonClient(socket_path).stats()
+    if not stats:
+        return {'success': True, 'running': False, 'message': 'Daemon-ul nu rulează'}
+    stats.pop('ok')
+    return {'success': True, 'running': True, 'message': f"Daemon activ (pid {stats['pid']})", **stats}
+
+
+if __name__ == '__main__':
+    action = sys.argv[1] if len(sys.argv) > 1 else 'status'
+    if action == 'run':
+        ManagerDaemon().serve()
+    elif action in ('start', 'stop', 'status'):
+        result = {'start': start_daemon, 'stop': stop_daemon, 'status': daemon_status}[action]()
+        print(("✅ " if result['success'] else "❌ ") + result['message'])
+        sys.exit(0 if result['success'] else 1)
+    else:
+        print("Folosire: python git_manager_daemon.py start|stop|status|run")
+        sys.exit(2)
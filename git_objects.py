@@ -0,0 +1,673 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Cititor de obiecte git în Python pur (fără procese git)
+Fișierele .idx/.pack sunt mapate în memorie (mmap): un obiect este găsit prin
+tabelul fanout + căutare binară în lista de hash-uri, apoi este decomprimat
+direct din pachet. Obiectele delta (OFS_DELTA / REF_DELTA) sunt reconstruite
+din bazele lor, iar bazele folosite recent sunt păstrate într-un cache LRU.
+Obiectele "loose" sunt citite din objects/xx/.
+
+Cititorul este doar pentru citire și acoperă cazurile obișnuite. Pentru cele
+neacoperite (SHA-256, grafts/shallow, replace refs, obiecte lipsă într-un
+partial clone) ridică UnsupportedRepository / MissingObject, iar apelantul
+folosește git.
+"""
+
+import heapq
+import mmap
+import os
+import re
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+OBJECT_TYPES = {1: 'commit', 2: 'tree', 3: 'blob', 4: 'tag'}
+OFS_DELTA = 6
+REF_DELTA = 7
+
+IDX_MAGIC = b'\377tOc'
+PACK_MAGIC = b'PACK'
+OID_SIZE = 20
+INFLATE_CHUNK = 64 * 1024
+DELTA_CACHE_BYTES = 32 * 1024 * 1024
+MAX_DELTA_CHAIN = 10000
+COMMIT_CACHE_SIZE = 20000
+
+HEX_OID = re.compile(r'^[0-9a-f]{4,40}$')
+REVISION_SUFFIX = re.compile(r'^(.*?)((?:~\d*|\^\d*|\^\{commit\})*)$')
+
+
+class MissingObject(KeyError):
+    """Obiectul nu există local (de ex. blob nedescărcat într-un partial clone)"""
+
+
+class UnsupportedRepository(Exception):
+    """Repository sau sintaxă pe care cititorul nu le tratează; se folosește git"""
+
+
+def _read_file(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+class PackIndex:
+    """Fișier .idx versiunea 2, mapat în memorie"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:4] != IDX_MAGIC or struct.unpack('>I', self.map[4:8])[0] != 2:
+            raise UnsupportedRepository(f'Format .idx nesuportat: {path}')
+        self.fanout = struct.unpack('>256I', self.map[8:8 + 1024])
+        self.count = self.fanout[255]
+        self.oids_offset = 8 + 1024
+        self.offsets_offset = self.oids_offset + self.count * (OID_SIZE + 4)
+        self.large_offsets_offset = self.offsets_offset + self.count * 4
+
+    def _oid_at(self, index):
+        start = self.oids_offset + index * OID_SIZE
+        return self.map[start:start + OID_SIZE]
+
+    def _offset_at(self, index):
+        start = self.offsets_offset + index * 4
+        offset = struct.unpack('>I', self.map[start:start + 4])[0]
+        if offset & 0x80000000:
+            # Pachete > 2 GiB: offset-ul real este în tabelul de 8 octeți
+            start = self.large_offsets_offset + (offset & 0x7fffffff) * 8
+            offset = struct.unpack('>Q', self.map[start:start + 8])[0]
+        return offset
+
+    def _range(self, first_byte):
+        return (self.fanout[first_byte - 1] if first_byte else 0), self.fanout[first_byte]
+
+    def find(self, oid):
+        """Offset-ul obiectului în pachet (None dacă nu este în acest pachet)"""
+        low, high = self._range(oid[0])
+        while low < high:
+            middle = (low + high) // 2
+            current = self._oid_at(middle)
+            if current < oid:
+                low = middle + 1
+            elif current > oid:
+                high = middle
+            else:
+                return self._offset_at(middle)
+        return None
+
+    def find_prefix(self, prefix_hex):
+        """Hash-urile complete care încep cu prefixul dat (pentru hash-uri abreviate)"""
+        padded = bytes.fromhex(prefix_hex[:len(prefix_hex) // 2 * 2])
+        low, high = self._range(int(prefix_hex[:2], 16))
+        while low < high:
+            middle = (low + high) // 2
+            if self._oid_at(middle) < padded:
+                low = middle + 1
+            else:
+                high = middle
+        matches = []
+        for index in range(low, self.fanout[int(prefix_hex[:2], 16)]):
+            oid = self._oid_at(index).hex()
+            if not oid.startswith(prefix_hex):
+                break
+            matches.append(oid)
+        return matches
+
+    def close(self):
+        self.map.close()
+
+
+class Pack:
+    """Fișierul .pack corespunzător unui .idx"""
+
+    def __init__(self, idx_path):
+        self.index = PackIndex(idx_path)
+        self.path = idx_path[:-len('.idx')] + '.pack'
+        with open(self.path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:4] != PACK_MAGIC:
+            raise UnsupportedRepository(f'Pachet invalid: {self.path}')
+
+    def header(self, offset):
+        """(tip, mărime decomprimată, offset-ul datelor) din antetul varint al obiectului"""
+        byte = self.map[offset]
+        object_type = (byte >> 4) & 7
+        size = byte & 15
+        shift = 4
+        offset += 1
+        while byte & 0x80:
+            byte = self.map[offset]
+            size |= (byte & 0x7f) << shift
+            shift += 7
+            offset += 1
+        return object_type, size, offset
+
+    def inflate(self, offset, size):
+        """Decomprimă un stream zlib din pachet (lungimea comprimată nu este stocată)"""
+        decompressor = zlib.decompressobj()
+        chunks = []
+        view = memoryview(self.map)
+        try:
+            while not decompressor.eof:
+                chunk = view[offset:offset + INFLATE_CHUNK]
+                if not chunk:
+                    raise UnsupportedRepository(f'Pachet trunchiat: {self.path}')
+                chunks.append(decompressor.decompress(chunk))
+                offset += len(chunk)
+        finally:
+            view.release()
+        data = b''.join(chunks)
+        if len(data) != size:
+            raise UnsupportedRepository(f'Obiect corupt în {self.path}')
+        return data
+
+    def ofs_delta_base(self, offset):
+        """Offset-ul bazei pentru OFS_DELTA (codare varint cu +1 la fiecare continuare)"""
+        byte = self.map[offset]
+        distance = byte & 0x7f
+        offset += 1
+        while byte & 0x80:
+            byte = self.map[offset]
+            distance = ((distance + 1) << 7) | (byte & 0x7f)
+            offset += 1
+        return distance, offset
+
+    def close(self):
+        self.map.close()
+        self.index.close()
+
+
+def _delta_varint(delta, position):
+    value = shift = 0
+    while True:
+        byte = delta[position]
+        position += 1
+        value |= (byte & 0x7f) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, position
+
+
+def apply_delta(base, delta):
+    """Reconstruiește obiectul din bază + instrucțiunile copy/insert ale delta-ului"""
+    source_size, position = _delta_varint(delta, 0)
+    target_size, position = _delta_varint(delta, position)
+    if source_size != len(base):
+        raise UnsupportedRepository('Delta aplicat pe o bază greșită')
+
+    result = bytearray()
+    length = len(delta)
+    while position < length:
+        opcode = delta[position]
+        position += 1
+        if opcode & 0x80:
+            copy_offset = copy_size = 0
+            for bit in range(4):
+                if opcode & (1 << bit):
+                    copy_offset |= delta[position] << (bit * 8)
+                    position += 1
+            for bit in range(3):
+                if opcode & (0x10 << bit):
+                    copy_size |= delta[position] << (bit * 8)
+                    position += 1
+            result += base[copy_offset:copy_offset + (copy_size or 0x10000)]
+        elif opcode:
+            result += delta[position:position + opcode]
+            position += opcode
+        else:
+            raise UnsupportedRepository('Instrucțiune delta invalidă')
+
+    if len(result) != target_size:
+        raise UnsupportedRepository('Delta cu mărime greșită')
+    return bytes(result)
+
+
+class ObjectStore:
+    """Toate obiectele unui repository: pachete (mmap) + loose + alternates"""
+
+    def __init__(self, common_dir, delta_cache_bytes=DELTA_CACHE_BYTES):
+        self.common_dir = common_dir
+        self.object_dirs = self._object_dirs(os.path.join(common_dir, 'objects'))
+        self.packs = {}
+        self.lock = threading.RLock()
+        self.delta_cache = OrderedDict()
+        self.delta_cache_bytes = delta_cache_bytes
+        self.delta_cache_size = 0
+        self._check_supported()
+        self.refresh_packs()
+
+    def _object_dirs(self, objects_dir):
+        dirs = [objects_dir]
+        alternates = _read_file(os.path.join(objects_dir, 'info', 'alternates'))
+        for line in (alternates or b'').decode('utf-8', errors='replace').split('\n'):
+            line = line.strip()
+            if line and not line.startswith('#'):
+                dirs.append(os.path.normpath(os.path.join(objects_dir, line)))
+        return dirs
+
+    def _check_supported(self):
+        config = (_read_file(os.path.join(self.common_dir, 'config')) or b'').decode('utf-8', errors='replace')
+        if re.search(r'objectformat\s*=\s*sha256', config, re.IGNORECASE):
+            raise UnsupportedRepository('Repository SHA-256')
+        # core.abbrev schimbă lungimea '%h'
+        self.custom_abbrev = bool(re.search(r'^\s*abbrev\s*=', config, re.IGNORECASE | re.MULTILINE))
+
+    def refresh_packs(self):
+        """Încarcă pachetele noi (după gc/fetch) și le eliberează pe cele șterse"""
+        with self.lock:
+            found = set()
+            for objects_dir in self.object_dirs:
+                pack_dir = os.path.join(objects_dir, 'pack')
+                try:
+                    names = os.listdir(pack_dir)
+                except OSError:
+                    continue
+                for name in names:
+                    if name.endswith('.idx') and os.path.exists(os.path.join(pack_dir, name[:-4] + '.pack')):
+                        found.add(os.path.join(pack_dir, name))
+            for path in list(self.packs):
+                if path not in found:
+                    self.packs.pop(path).close()
+            for path in found - set(self.packs):
+                self.packs[path] = Pack(path)
+
+    # --- Cache pentru bazele delta ---
+
+    def _cache_get(self, key):
+        entry = self.delta_cache.get(key)
+        if entry is not None:
+            self.delta_cache.move_to_end(key)
+        return entry
+
+    def _cache_put(self, key, object_type, data):
+        if len(data) > self.delta_cache_bytes // 4:
+            return
+        self.delta_cache[key] = (object_type, data)
+        self.delta_cache_size += len(data)
+        while self.delta_cache_size > self.delta_cache_bytes:
+            _, (_, evicted) = self.delta_cache.popitem(last=False)
+            self.delta_cache_size -= len(evicted)
+
+    # --- Citire ---
+
+    def _read_packed(self, pack, offset):
+        """Obiectul de la offset, cu lanțul de delta rezolvat iterativ"""
+        chain = []
+        current_pack, current_offset = pack, offset
+        base_key = None
+        while True:
+            cached = self._cache_get((current_pack.path, current_offset))
+            if cached is not None:
+                object_type, data = cached
+                break
+            object_type, size, data_offset = current_pack.header(current_offset)
+            if object_type == OFS_DELTA:
+                distance, data_offset = current_pack.ofs_delta_base(data_offset)
+                chain.append((current_pack, current_offset, current_pack.inflate(data_offset, size)))
+                current_offset -= distance
+            elif object_type == REF_DELTA:
+                base_oid = current_pack.map[data_offset:data_offset + OID_SIZE]
+                chain.append((current_pack, current_offset, current_pack.inflate(data_offset + OID_SIZE, size)))
+                location = self._locate(base_oid)
+                if location is None:
+                    # Baza poate fi un obiect loose (pachete "thin" completate local)
+                    object_type, data = self._read_loose(base_oid)
+                    break
+                current_pack, current_offset = location
+            elif object_type in OBJECT_TYPES:
+                data = current_pack.inflate(data_offset, size)
+                object_type = OBJECT_TYPES[object_type]
+                base_key = (current_pack.path, current_offset)
+                break
+            else:
+                raise UnsupportedRepository(f'Tip de obiect necunoscut: {object_type}')
+            if len(chain) > MAX_DELTA_CHAIN:
+                raise UnsupportedRepository('Lanț delta prea lung')
+
+        if chain and base_key is not None:
+            self._cache_put(base_key, object_type, data)
+        for delta_pack, delta_offset, delta in reversed(chain):
+            data = apply_delta(data, delta)
+            self._cache_put((delta_pack.path, delta_offset), object_type, data)
+        return object_type, data
+
+    def _loose_path(self, objects_dir, oid):
+        hex_oid = oid.hex()
+        return os.path.join(objects_dir, hex_oid[:2], hex_oid[2:])
+
+    def _read_loose(self, oid):
+        for objects_dir in self.object_dirs:
+            raw = _read_file(self._loose_path(objects_dir, oid))
+            if raw is None:
+                continue
+            data = zlib.decompress(raw)
+            header, _, body = data.partition(b'\0')
+            object_type, size = header.decode('ascii').split(' ')
+            if int(size) != len(body):
+                raise UnsupportedRepository(f'Obiect loose corupt: {oid.hex()}')
+            return object_type, body
+        raise MissingObject(oid.hex())
+
+    def _locate(self, oid):
+        for pack in self.packs.values():
+            offset = pack.index.find(oid)
+            if offset is not None:
+                return pack, offset
+        return None
+
+    def read(self, oid_hex):
+        """(tip, conținut) pentru un hash complet"""
+        oid = bytes.fromhex(oid_hex)
+        with self.lock:
+            for attempt in range(2):
+                location = self._locate(oid)
+                if location is not None:
+                    return self._read_packed(*location)
+                try:
+                    return self._read_loose(oid)
+                except MissingObject:
+                    if attempt:
+                        raise
+                    # Un gc/repack rulat între timp a mutat obiectul într-un pachet nou
+                    self.refresh_packs()
+
+    def expand(self, prefix_hex):
+        """Hash-ul complet pentru un hash abreviat (None dacă lipsește sau este ambiguu)"""
+        if len(prefix_hex) == 40:
+            return prefix_hex
+        matches = set()
+        with self.lock:
+            for pack in self.packs.values():
+                matches.update(pack.index.find_prefix(prefix_hex))
+        for objects_dir in self.object_dirs:
+            try:
+                names = os.listdir(os.path.join(objects_dir, prefix_hex[:2]))
+            except OSError:
+                continue
+            matches.update(prefix_hex[:2] + name for name in names if (prefix_hex[:2] + name).startswith(prefix_hex))
+        return matches.pop() if len(matches) == 1 else None
+
+    def abbreviate(self, oid_hex, loose_names=None):
+        """
+        Hash-ul abreviat ca în '%h': lungimea automată din numărul de obiecte
+        (minim 7), extinsă până când prefixul este unic. loose_names poate fi
+        un dicționar refolosit între apeluri pentru listările objects/xx/.
+        """
+        with self.lock:
+            count = sum(pack.index.count for pack in self.packs.values())
+            length = max(7, (count.bit_length() + 1) // 2)
+            if loose_names is None:
+                loose_names = {}
+            directory = oid_hex[:2]
+            if directory not in loose_names:
+                names = []
+                for objects_dir in self.object_dirs:
+                    try:
+                        names += os.listdir(os.path.join(objects_dir, directory))
+                    except OSError:
+                        pass
+                loose_names[directory] = [directory + name for name in names]
+            while length < 40:
+                prefix = oid_hex[:length]
+                matches = {oid for oid in loose_names[directory] if oid.startswith(prefix)}
+                for pack in self.packs.values():
+                    matches.update(pack.index.find_prefix(prefix))
+                if matches <= {oid_hex}:
+                    return prefix
+                length += 1
+            return oid_hex
+
+    def close(self):
+        with self.lock:
+            for pack in self.packs.values():
+                pack.close()
+            self.packs = {}
+
+
+# --- Parsarea obiectelor ---
+
+def parse_signature(value):
+    """'Nume <email> 1700000000 +0200' -> dict cu data în fusul orar al autorului"""
+    match = re.match(r'^(.*) <(.*)> (\d+) ([+-])(\d{2})(\d{2})$', value)
+    if not match:
+        raise UnsupportedRepository(f'Semnătură invalidă: {value}')
+    name, email, timestamp, sign, hours, minutes = match.groups()
+    offset = timedelta(hours=int(hours), minutes=int(minutes)) * (-1 if sign == '-' else 1)
+    return {
+        'name': name,
+        'email': email,
+        'time': int(timestamp),
+        'date': datetime.fromtimestamp(int(timestamp), timezone(offset)).isoformat()
+    }
+
+
+def parse_commit(data):
+    """Antetele unui commit (tree, parents, author, committer) și mesajul"""
+    headers, _, message = data.partition(b'\n\n')
+    commit = {'tree': None, 'parents': [], 'author': None, 'committer': None, 'encoding': None}
+    for line in headers.split(b'\n'):
+        if line.startswith(b' '):
+            continue    # continuarea unui antet pe mai multe linii (gpgsig, mergetag)
+        key, _, value = line.partition(b' ')
+        if key == b'tree':
+            commit['tree'] = value.decode('ascii')
+        elif key == b'parent':
+            commit['parents'].append(value.decode('ascii'))
+        elif key in (b'author', b'committer'):
+            commit[key.decode('ascii')] = parse_signature(value.decode('utf-8', errors='replace'))
+        elif key == b'encoding':
+            commit['encoding'] = value.decode('ascii', errors='replace')
+    if commit['encoding'] and commit['encoding'].lower() not in ('utf-8', 'utf8'):
+        raise UnsupportedRepository(f'Encoding nesuportat: {commit["encoding"]}')
+    commit['message'] = message.decode('utf-8', errors='replace')
+    return commit
+
+
+def commit_subject(message):
+    """Echivalentul '%s': primul paragraf, cu liniile unite prin spațiu"""
+    lines = []
+    for line in message.split('\n'):
+        if not line.strip():
+            if lines:
+                break
+            continue
+        lines.append(line.strip())
+    return ' '.join(lines)
+
+
+def parse_tree(data):
+    """Intrările unui tree: (mod, nume, hash)"""
+    entries = []
+    position = 0
+    while position < len(data):
+        space = data.index(b' ', position)
+        null = data.index(b'\0', space)
+        mode = data[position:space].decode('ascii')
+        name = data[space + 1:null].decode('utf-8', errors='surrogateescape')
+        entries.append((mode, name, data[null + 1:null + 1 + OID_SIZE].hex()))
+        position = null + 1 + OID_SIZE
+    return entries
+
+
+class Repository:
+    """Referințe + obiecte, citite direct din directorul .git"""
+
+    def __init__(self, git_dir, common_dir=None):
+        self.git_dir = git_dir
+        self.common_dir = common_dir or git_dir
+        for marker in ('shallow', os.path.join('info', 'grafts'), os.path.join('refs', 'replace')):
+            if os.path.exists(os.path.join(self.common_dir, marker)):
+                raise UnsupportedRepository(f'Istoric modificat ({marker})')
+        self.objects = ObjectStore(self.common_dir)
+        # Commit-urile nu se schimbă niciodată: cele parsate sunt refolosite între apeluri
+        self.commits = OrderedDict()
+        self.commits_lock = threading.Lock()
+
+    # --- Referințe ---
+
+    def packed_refs(self):
+        refs = {}
+        data = _read_file(os.path.join(self.common_dir, 'packed-refs'))
+        for line in (data or b'').decode('utf-8', errors='surrogateescape').split('\n'):
+            if line and not line.startswith(('#', '^')):
+                oid, _, name = line.partition(' ')
+                refs[name] = oid
+        return refs
+
+    def _loose_ref(self, name):
+        # HEAD și alte pseudo-referințe sunt per worktree; refs/ este comun
+        base = self.common_dir if name.startswith('refs/') else self.git_dir
+        data = _read_file(os.path.join(base, *name.split('/')))
+        return data.decode('utf-8', errors='surrogateescape').strip() if data is not None else None
+
+    def read_ref(self, name, depth=0):
+        """Hash-ul referinței (urmărind referințele simbolice) sau None"""
+        if depth > 5:
+            return None
+        value = self._loose_ref(name)
+        if value is None:
+            return self.packed_refs().get(name)
+        if value.startswith('ref: '):
+            return self.read_ref(value[len('ref: '):], depth + 1)
+        return value
+
+    def head_target(self):
+        """Referința spre care arată HEAD ('refs/heads/main') sau None dacă HEAD este detașat"""
+        value = self._loose_ref('HEAD') or ''
+        return value[len('ref: '):] if value.startswith('ref: ') else None
+
+    def branches(self):
+        names = {name for name in self.packed_refs() if name.startswith('refs/heads/')}
+        heads_dir = os.path.join(self.common_dir, 'refs', 'heads')
+        for root, _, files in os.walk(heads_dir):
+            for name in files:
+                if not name.endswith('.lock'):
+                    relative = os.path.relpath(os.path.join(root, name), heads_dir).replace(os.sep, '/')
+                    names.add('refs/heads/' + relative)
+        # Ordinea din 'git for-each-ref' (sortare după numele complet, pe octeți)
+        return sorted((name for name in names if self.read_ref(name)), key=lambda name: name.encode('utf-8'))
+
+    # --- Revizii ---
+
+    def peel_to_commit(self, oid):
+        for _ in range(10):
+            object_type, data = self.objects.read(oid)
+            if object_type == 'commit':
+                return oid
+            if object_type != 'tag':
+                return None
+            oid = data.split(b'\n', 1)[0].split(b' ')[1].decode('ascii')
+        return None
+
+    def resolve_name(self, name):
+        """Regulile din gitrevisions: refs exacte, tags, heads, remotes, apoi hash"""
+        if name in ('HEAD', 'FETCH_HEAD', 'ORIG_HEAD', 'MERGE_HEAD') or name.startswith('refs/'):
+            oid = self.read_ref(name)
+            if oid is not None or name.startswith('refs/'):
+                return oid
+        for candidate in (f'refs/{name}', f'refs/tags/{name}', f'refs/heads/{name}',
+                          f'refs/remotes/{name}', f'refs/remotes/{name}/HEAD'):
+            oid = self.read_ref(candidate)
+            if oid is not None:
+                return oid
+        if HEX_OID.match(name):
+            return self.objects.expand(name)
+        return None
+
+    def resolve(self, revision):
+        """Hash-ul commit-ului pentru 'nume', 'nume~N', 'nume^N', '...^{commit}'"""
+        plain = (revision or '').replace('^{commit}', '')
+        if not plain or any(token in plain for token in (':', '..', '@', '{', '}', ' ')):
+            raise UnsupportedRepository(f'Sintaxă nesuportată: {revision}')
+        base, suffix = REVISION_SUFFIX.match(revision).groups()
+        oid = self.resolve_name(base)
+        if oid is None:
+            return None
+        oid = self.peel_to_commit(oid)
+        for operator, count in re.findall(r'(~|\^)(\d*)', suffix.replace('^{commit}', '')):
+            if oid is None:
+                return None
+            steps = int(count) if count else 1
+            commit = self.commit(oid)
+            if operator == '~':
+                for _ in range(steps):
+                    if not commit['parents']:
+                        return None
+                    oid = commit['parents'][0]
+                    commit = self.commit(oid)
+            elif steps == 0:
+                continue
+            else:
+                oid = commit['parents'][steps - 1] if len(commit['parents']) >= steps else None
+        return oid
+
+    # --- Conținut ---
+
+    def commit(self, oid):
+        with self.commits_lock:
+            commit = self.commits.get(oid)
+            if commit is not None:
+                self.commits.move_to_end(oid)
+                return commit
+
+        object_type, data = self.objects.read(oid)
+        if object_type != 'commit':
+            raise UnsupportedRepository(f'{oid} nu este un commit')
+        commit = parse_commit(data)
+        with self.commits_lock:
+            self.commits[oid] = commit
+            if len(self.commits) > COMMIT_CACHE_SIZE:
+                self.commits.popitem(last=False)
+        return commit
+
+    def read_path(self, commit_oid, path):
+        """(tip, conținut) pentru calea dată din tree-ul unui commit (None dacă lipsește)"""
+        oid = self.commit(commit_oid)['tree']
+        object_type = 'tree'
+        for part in [part for part in path.strip('/').split('/') if part]:
+            if object_type != 'tree':
+                return None
+            entries = parse_tree(self.objects.read(oid)[1])
+            match = next((entry for entry in entries if entry[1] == part), None)
+            if match is None:
+                return None
+            mode, _, oid = match
+            if mode == '160000':
+                return 'commit', None    # submodul: commit-ul nu este în acest repository
+            object_type = 'tree' if mode.startswith('4') else 'blob'
+        return self.objects.read(oid)
+
+    def walk(self, start_oid, limit=None, skip=0):
+        """
+        Commit-urile în ordinea implicită din 'git log': coadă de prioritate
+        după data commit-ului, iar la egalitate în ordinea inserării.
+        """
+        counter = 0
+        seen = {start_oid}
+        queue = [(0, counter, start_oid, None)]
+        produced = 0
+        while queue:
+            _, _, oid, commit = heapq.heappop(queue)
+            if commit is None:
+                commit = self.commit(oid)
+            if produced >= skip:
+                yield oid, commit
+            produced += 1
+            if limit is not None and produced >= skip + limit:
+                return
+            for parent in commit['parents']:
+                if parent in seen:
+                    continue
+                seen.add(parent)
+                parent_commit = self.commit(parent)
+                counter += 1
+                heapq.heappush(queue, (-parent_commit['committer']['time'], counter, parent, parent_commit))
+
+    def close(self):
+        self.objects.close()
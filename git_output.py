@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Captura output-ului mare cu memorie limitată
+Output-ul unei comenzi git (diff, log, status pe un repository uriaș) este
+citit în bucăți: doar primii HEAD_BYTES octeți rămân în memorie, iar restul
+este scris într-un fișier temporar. Din captură se pot obține:
+
+- un preview (începutul output-ului) pentru răspunsul JSON
+- orice interval de octeți (servit cu cereri HTTP Range)
+- un flux incremental de bucăți sau de înregistrări (linii / separate prin
+  NUL), astfel încât parserele nu primesc niciodată un singur string uriaș
+
+Capturile aplicației web sunt păstrate OUTPUT_TTL secunde, apoi fișierele
+temporare sunt șterse.
+"""
+
+import os
+import secrets
+import subprocess
+import tempfile
+import threading
+import time
+import weakref
+
+from git_governor import classify, governor
+
+HEAD_BYTES = 256 * 1024
+CHUNK_SIZE = 64 * 1024
+STDERR_LIMIT = 64 * 1024
+OUTPUT_TTL = 15 * 60
+MAX_STORED_OUTPUTS = 50
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class CapturedOutput:
+    """Output-ul unei comenzi: începutul în memorie, totul pe disc după HEAD_BYTES"""
+
+    def __init__(self, head_limit=HEAD_BYTES):
+        self.id = secrets.token_hex(8)
+        self.head_limit = head_limit
+        self.head = bytearray()
+        self.size = 0
+        self.path = None
+        self.created = time.time()
+        self.returncode = None
+        self.error = None
+        self.timed_out = False
+        self.duration_ms = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    @property
+    def spilled(self):
+        """True dacă output-ul a depășit limita din memorie (restul este pe disc)"""
+        return self.path is not None
+
+    @property
+    def success(self):
+        return self.returncode == 0 and not self.timed_out
+
+    def write(self, chunk):
+        self.size += len(chunk)
+        if self._file is None and len(self.head) + len(chunk) <= self.head_limit:
+            self.head += chunk
+            return
+        if self._file is None:
+            fd, self.path = tempfile.mkstemp(prefix='git-manager-output-')
+            self._file = os.fdopen(fd, 'w+b')
+            # Fișierul este șters și dacă apelantul uită de captură
+            self._finalizer = weakref.finalize(self, _remove, self.path)
+            self._file.write(self.head)
+            self.head += chunk[:self.head_limit - len(self.head)]
+        self._file.write(chunk)
+
+    def finish(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def read_range(self, start=0, end=None):
+        """Octeții [start, end) ai output-ului complet"""
+        end = self.size if end is None else min(end, self.size)
+        if start >= end:
+            return b''
+        if not self.spilled or end <= len(self.head):
+            return bytes(self.head[start:end])
+        with self._lock:
+            if self._file is None:
+                return b''    # captura a expirat între timp
+            self._file.seek(start)
+            return self._file.read(end - start)
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Output-ul complet, în bucăți de cel mult chunk_size octeți"""
+        position = 0
+        while position < self.size:
+            chunk = self.read_range(position, position + chunk_size)
+            if not chunk:
+                break
+            position += len(chunk)
+            yield chunk
+
+    def iter_records(self, separator=b'\n'):
+        """Înregistrările output-ului (fără separator), citite incremental"""
+        pending = b''
+        for chunk in self.iter_chunks():
+            pending += chunk
+            records = pending.split(separator)
+            pending = records.pop()
+            yield from records
+        if pending:
+            yield pending
+
+    def iter_lines(self):
+        for record in self.iter_records(b'\n'):
+            yield record.decode('utf-8', errors='replace')
+
+    def preview(self):
+        """Începutul output-ului ca text (tot output-ul dacă nu a depășit limita)"""
+        return self.head.decode('utf-8', errors='replace')
+
+    def summary(self):
+        return {
+            'id': self.id,
+            'size': self.size,
+            'truncated': self.spilled,
+            'preview': self.preview()
+        }
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._finalizer()
+
+
+def run_captured(command, cwd, operation=None, timeout=None, head_limit=HEAD_BYTES):
+    """
+    Rulează o comandă prin guvernator și citește stdout în bucăți într-un
+    CapturedOutput (stderr este păstrat până la STDERR_LIMIT octeți).
+    """
+    operation = operation or classify(command)
+    timeout = timeout or governor.timeouts[operation]
+    output = CapturedOutput(head_limit)
+
+    if governor.acquire(cwd, operation) is None:
+        output.returncode, output.error = -1, 'Prea multe procese git în așteptare'
+        return output
+
+    start = time.perf_counter()
+    try:
+        try:
+            process = governor.popen(command, cwd, governor.environment(False, None), False, subprocess.DEVNULL,
+                                     stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            output.returncode, output.error = -1, str(e)
+            return output
+
+        stderr = bytearray()
+
+        def read_stderr():
+            for chunk in iter(lambda: process.stderr.read(CHUNK_SIZE), b''):
+                stderr.extend(chunk[:max(0, STDERR_LIMIT - len(stderr))])
+
+        def expire():
+            output.timed_out = True
+            governor.record_timeout(operation)
+            governor.terminate(process)
+
+        stderr_reader = threading.Thread(target=read_stderr, name='git-output-stderr', daemon=True)
+        stderr_reader.start()
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            fd = process.stdout.fileno()
+            while True:
+                chunk = os.read(fd, CHUNK_SIZE)
+                if not chunk:
+                    break
+                output.write(chunk)
+            output.returncode = process.wait()
+        except BaseException:
+            governor.terminate(process)
+            process.wait()
+            raise
+        finally:
+            timer.cancel()
+            stderr_reader.join()
+            process.stdout.close()
+            process.stderr.close()
+            governor.forget(process)
+    finally:
+        governor.release(cwd)
+
+    output.finish()
+    output.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+    if output.timed_out:
+        output.error = f'Timeout după {timeout}s'
+    elif output.returncode != 0:
+        output.error = bytes(stderr).decode('utf-8', errors='replace') or f'Cod de ieșire {output.returncode}'
+    return output
+
+
+class OutputStore:
+    """Capturile servite ulterior prin /api/output/<id> (cu Range)"""
+
+    def __init__(self, ttl=OUTPUT_TTL, max_outputs=MAX_STORED_OUTPUTS):
+        self.ttl = ttl
+        self.max_outputs = max_outputs
+        self.outputs = {}
+        self.lock = threading.Lock()
+
+    def _expire(self):
+        now = time.time()
+        for key in [key for key, output in self.outputs.items() if now - output.created > self.ttl]:
+            self.outputs.pop(key).close()
+
+    def add(self, output):
+        with self.lock:
+            self._expire()
+            # Prea multe capturi: cele mai vechi sunt eliminate primele (dicționarul păstrează ordinea)
+            while len(self.outputs) >= self.max_outputs:
+                self.outputs.pop(next(iter(self.outputs))).close()
+            self.outputs[output.id] = output
+        return output.id
+
+    def get(self, output_id):
+        with self.lock:
+            self._expire()
+            return self.outputs.get(output_id)
+
+    def renew(self, output_id):
+        """Prelungește o captură încă păstrată (refolosită de un rezultat neschimbat)"""
+        with self.lock:
+            self._expire()
+            output = self.outputs.pop(output_id, None)
+            if output is not None:
+                output.created = time.time()
+                self.outputs[output_id] = output
+            return output
+
+
+outputs = OutputStore()
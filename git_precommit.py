@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Verificări pre-commit paralele, cu cache după conținut
+Înainte de commit (și de backup-ul rapid) fișierele din staging area sunt
+verificate: dimensiune maximă, secrete (chei private, token-uri, parole în
+clar), markere de conflict rămase, sintaxă (.py, .json) și, opțional,
+linter-e externe configurate de utilizator.
+
+- conținutul pregătit pentru commit este citit dintr-un singur proces
+  'git cat-file --batch', fără a atinge working tree-ul
+- verificările rulează în paralel într-un pool de procese
+- rezultatul fiecărei verificări este păstrat după oid-ul blob-ului, deci un
+  fișier nemodificat nu mai este verificat niciodată a doua oară
+
+Configurare (opțională):
+    git config gitmanager.precommitChecks "size,secrets,conflicts,syntax"
+    git config gitmanager.precommitMaxSize 5242880
+    git config --add gitmanager.precommitCommand "*.py flake8 -"
+
+O comandă externă primește conținutul fișierului pe stdin; un cod de ieșire
+diferit de 0 este raportat ca problemă (primele linii din output). Verificări
+noi se adaugă cu register_check(); funcția trebuie să fie definită la nivel de
+modul, pentru a putea rula în procesele din pool.
+"""
+
+import fnmatch
+import json
+import os
+import re
+import shlex
+import subprocess
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from git_governor import governor, run_process
+from git_state import state_dir
+
+CHECKS_KEY = 'gitmanager.precommitChecks'
+MAX_SIZE_KEY = 'gitmanager.precommitMaxSize'
+COMMAND_KEY = 'gitmanager.precommitCommand'
+
+DEFAULT_CHECKS = ('size', 'secrets', 'conflicts', 'syntax')
+MAX_FILE_SIZE = 10 * 1024 * 1024
+
+# Sub acest număr de fișiere de verificat, pornirea pool-ului costă mai mult decât verificarea
+PARALLEL_MIN_FILES = 8
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# Rezultate păstrate în cache (cele mai vechi sunt eliminate primele)
+CACHE_VERSION = 1
+MAX_CACHE_ENTRIES = 100000
+
+COMMAND_TIMEOUT = 60
+COMMAND_OUTPUT_LINES = 10
+
+# Primii octeți în care un NUL marchează un fișier binar (ca în git)
+BINARY_SNIFF = 8000
+
+SECRET_PATTERNS = [
+    ('cheie privată', re.compile(rb'-----BEGIN (?:RSA |EC |DSA |OPENSSH |PGP |ENCRYPTED )?PRIVATE KEY')),
+    ('cheie AWS', re.compile(rb'\b(?:AKIA|ASIA)[0-9A-Z]{16}\b')),
+    ('token GitHub', re.compile(rb'\bgh[pousr]_[A-Za-z0-9]{36,}\b')),
+    ('token Slack', re.compile(rb'\bxox[abposr]-[A-Za-z0-9-]{10,}')),
+    ('cheie Google API', re.compile(rb'\bAIza[0-9A-Za-z_-]{35}\b')),
+    ('parolă în clar', re.compile(rb'(?i)\b(?:password|passwd|secret|api[_-]?key)\s*[:=]\s*["\'][^"\'\s]{8,}["\']')),
+]
+CONFLICT_MARKER = re.compile(rb'^(?:<{7}|>{7})(?: |$)', re.M)
+
+
+def _line(data, offset):
+    return data.count(b'\n', 0, offset) + 1
+
+
+def _is_binary(data):
+    return b'\0' in data[:BINARY_SNIFF]
+
+
+def check_secrets(path, data):
+    if _is_binary(data):
+        return []
+    problems = []
+    for name, pattern in SECRET_PATTERNS:
+        match = pattern.search(data)
+        if match:
+            problems.append(f'posibil secret ({name}) la linia {_line(data, match.start())}')
+    return problems
+
+
+def check_conflicts(path, data):
+    if _is_binary(data):
+        return []
+    match = CONFLICT_MARKER.search(data)
+    return [f'marker de conflict la linia {_line(data, match.start())}'] if match else []
+
+
+def check_syntax(path, data):
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        if extension == '.py':
+            compile(data, path, 'exec', dont_inherit=True)
+        elif extension == '.json':
+            json.loads(data)
+    except SyntaxError as e:
+        return [f'eroare de sintaxă la linia {e.lineno}: {e.msg}']
+    except ValueError as e:
+        return [f'conținut invalid: {e}']
+    return []
+
+
+def check_command(path, data, command, cwd=None):
+    """Linter extern: conținutul pe stdin, problemele în output (rulat din proiect, pentru configurația lui)"""
+    try:
+        result = subprocess.run(shlex.split(command), input=data, capture_output=True, timeout=COMMAND_TIMEOUT,
+                                cwd=cwd)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return [f'{command}: {e}']
+    if result.returncode == 0:
+        return []
+    output = (result.stdout + result.stderr).decode('utf-8', errors='replace').strip().splitlines()
+    return [f'{command}: {line}' for line in output[:COMMAND_OUTPUT_LINES]] or [f'{command}: cod de ieșire {result.returncode}']
+
+
+# Verificările de conținut: nume -> (funcție, extensiile la care se aplică sau None pentru toate)
+CHECKS = {
+    'secrets': (check_secrets, None),
+    'conflicts': (check_conflicts, None),
+    'syntax': (check_syntax, ('.py', '.json')),
+}
+
+
+def register_check(name, function, extensions=None):
+    """Adaugă o verificare function(path, data) -> [mesaje]; activată prin gitmanager.precommitChecks"""
+    CHECKS[name] = (function, tuple(extensions) if extensions else None)
+
+
+def run_checks(path, data, check_ids, cwd=None):
+    """Rulează verificările cerute pentru un fișier (în pool); returnează {check_id: [mesaje]}"""
+    results = {}
+    for check_id in check_ids:
+        name, _, argument = check_id.partition(':')
+        if name == 'command':
+            results[check_id] = check_command(path, data, argument, cwd)
+        else:
+            results[check_id] = CHECKS[name][0](path, data)
+    return results
+
+
+class PrecommitPipeline:
+    """Verificările pre-commit pentru conținutul din staging area"""
+
+    def __init__(self, project_path, checks=None, max_size=None, env=None):
+        self.project_path = project_path
+        # env cu GIT_INDEX_FILE: verifică un index temporar (backup-ul snapshot) în loc de staging area
+        self.env = env
+        self.checks = list(checks) if checks is not None else self.configured_checks()
+        self.max_size = max_size or self.configured_max_size()
+        self.commands = self.configured_commands()
+        self.cache_path = os.path.join(state_dir(project_path), 'precommit_cache.json')
+
+    def _git(self, args, input_data=None):
+        return run_process(['git'] + args, self.project_path, input_data, text=False, env=self.env)
+
+    def _config(self, key, all_values=False):
+        result = self._git(['config', '--get-all' if all_values else '--get', key])
+        if result.returncode != 0:
+            return [] if all_values else None
+        values = result.stdout.decode('utf-8', errors='replace').splitlines()
+        return values if all_values else (values[0].strip() if values else None)
+
+    def configured_checks(self):
+        value = self._config(CHECKS_KEY)
+        if value is None:
+            return list(DEFAULT_CHECKS)
+        return [name.strip() for name in value.split(',') if name.strip()]
+
+    def configured_max_size(self):
+        value = self._config(MAX_SIZE_KEY)
+        return int(value) if value and value.isdigit() else MAX_FILE_SIZE
+
+    def configured_commands(self):
+        """[(glob, comandă)] din gitmanager.precommitCommand ("<glob> <comandă>")"""
+        commands = []
+        for value in self._config(COMMAND_KEY, all_values=True):
+            pattern, _, command = value.strip().partition(' ')
+            if command.strip():
+                commands.append((pattern, command.strip()))
+        return commands
+
+    # --- Conținutul din staging ---
+
+    def staged_blobs(self):
+        """[(cale, oid)] pentru fișierele adăugate sau modificate în staging area"""
+        head = self._git(['rev-parse', '--verify', '-q', 'HEAD'])
+        if head.returncode == 0:
+            result = self._git(['diff-index', '--cached', '--no-renames', '-z', '--diff-filter=d', 'HEAD'])
+            fields = result.stdout.decode('utf-8', errors='surrogateescape').split('\0')
+            blobs = []
+            # Perechi ":<mod vechi> <mod nou> <oid vechi> <oid nou> <status>", cale
+            for meta, path in zip(fields[0::2], fields[1::2]):
+                parts = meta.split()
+                if len(parts) == 5 and parts[1] in ('100644', '100755'):
+                    blobs.append((path, parts[3]))
+            return blobs
+
+        # Primul commit: tot indexul este nou
+        result = self._git(['ls-files', '-s', '-z'])
+        blobs = []
+        for entry in result.stdout.decode('utf-8', errors='surrogateescape').split('\0'):
+            if entry:
+                meta, path = entry.split('\t', 1)
+                mode, oid, _ = meta.split()
+                if mode in ('100644', '100755'):
+                    blobs.append((path, oid))
+        return blobs
+
+    def read_blobs(self, oids):
+        """
+        Generator (oid, mărime, conținut) dintr-un singur 'git cat-file --batch'.
+        Pentru blob-urile peste limita de mărime, conținutul este None (nu este citit în memorie).
+        """
+        if governor.acquire(self.project_path, 'read') is None:
+            raise OSError('Prea multe procese git în așteptare')
+        try:
+            process = governor.popen(['git', 'cat-file', '--batch'], self.project_path,
+                                     governor.environment(False, None), False, subprocess.PIPE,
+                                     stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            # Oid-urile sunt scrise dintr-un fir separat, ca pipe-urile să nu se blocheze reciproc
+            def feed():
+                try:
+                    process.stdin.write(''.join(oid + '\n' for oid in oids).encode('ascii'))
+                    process.stdin.close()
+                except OSError:
+                    pass
+
+            writer = threading.Thread(target=feed, name='precommit-cat-file', daemon=True)
+            writer.start()
+            try:
+                for _ in oids:
+                    header = process.stdout.readline().split()
+                    if len(header) != 3:
+                        continue    # obiect lipsă
+                    oid, size = header[0].decode('ascii'), int(header[2])
+                    if size > self.max_size:
+                        remaining = size + 1
+                        while remaining:
+                            remaining -= len(process.stdout.read(min(remaining, 1024 * 1024)))
+                        yield oid, size, None
+                    else:
+                        data = process.stdout.read(size)
+                        process.stdout.read(1)
+                        yield oid, size, data
+                process.wait()
+            finally:
+                if process.poll() is None:
+                    governor.terminate(process)
+                    process.wait()
+                writer.join()
+                process.stdout.close()
+                governor.forget(process)
+        finally:
+            governor.release(self.project_path)
+
+    # --- Cache ---
+
+    def load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if cache.get('version') == CACHE_VERSION:
+                return cache['results']
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def save_cache(self, results):
+        # Cele mai vechi rezultate (ordinea inserării) sunt eliminate primele
+        keys = list(results)
+        for key in keys[:max(0, len(keys) - MAX_CACHE_ENTRIES)]:
+            del results[key]
+        tmp_path = self.cache_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'results': results}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    # --- Rulare ---
+
+    def check_ids(self, path):
+        """Verificările de conținut care se aplică fișierului (id-ul intră în cheia din cache)"""
+        extension = os.path.splitext(path)[1].lower()
+        ids = []
+        for name in self.checks:
+            if name not in CHECKS:
+                continue
+            extensions = CHECKS[name][1]
+            if extensions is None:
+                ids.append(name)
+            elif extension in extensions:
+                ids.append(f'{name}:{extension}')
+        ids += [f'command:{command}' for pattern, command in self.commands if fnmatch.fnmatch(path, pattern)]
+        return ids
+
+    def run(self):
+        """
+        Verifică fișierele din staging area. Rezultat: success (fără
+        probleme), problems [{path, check, message}], checked (fișiere),
+        cached (fișiere cu toate rezultatele din cache).
+        """
+        start = time.perf_counter()
+        blobs = self.staged_blobs()
+        cache = self.load_cache()
+        size_id = f'size:{self.max_size}'
+
+        problems = []
+        pending = {}        # oid -> [(cale, verificările fără rezultat în cache)]
+        cached = 0
+        for path, oid in blobs:
+            check_ids = self.check_ids(path)
+            if 'size' in self.checks:
+                check_ids.insert(0, size_id)
+            missing = []
+            for check_id in check_ids:
+                messages = cache.get(f'{oid} {check_id}')
+                if messages is None:
+                    missing.append(check_id)
+                    continue
+                problems += [{'path': path, 'check': check_id.split(':')[0], 'message': m} for m in messages]
+            if missing:
+                pending.setdefault(oid, []).append((path, missing))
+            else:
+                cached += 1
+
+        def record(path, oid, results):
+            for check_id, messages in results.items():
+                cache[f'{oid} {check_id}'] = messages
+                problems.extend({'path': path, 'check': check_id.split(':')[0], 'message': m} for m in messages)
+
+        if pending:
+            jobs = sum(len(paths) for paths in pending.values())
+            pool = ProcessPoolExecutor(max_workers=MAX_WORKERS) if jobs >= PARALLEL_MIN_FILES else None
+            futures = []
+            try:
+                # Blob-urile sunt trimise în pool pe măsură ce sunt citite din cat-file
+                for oid, size, data in self.read_blobs(list(pending)):
+                    for path, missing in pending[oid]:
+                        if size_id in missing:
+                            missing = [check_id for check_id in missing if check_id != size_id]
+                            too_large = [f'{size} octeți, peste limita de {self.max_size}'] if size > self.max_size else []
+                            record(path, oid, {size_id: too_large})
+                        if data is None or not missing:
+                            continue
+                        if pool is not None:
+                            futures.append((path, oid, pool.submit(run_checks, path, data, missing, self.project_path)))
+                        else:
+                            record(path, oid, run_checks(path, data, missing, self.project_path))
+                for path, oid, future in futures:
+                    record(path, oid, future.result())
+            except OSError as e:
+                return {'success': False, 'message': f'Eroare la citirea fișierelor din staging: {e}', 'problems': problems}
+            finally:
+                if pool is not None:
+                    pool.shutdown(cancel_futures=True)
+            try:
+                self.save_cache(cache)
+            except OSError:
+                pass
+
+        problems.sort(key=lambda problem: problem['path'])
+        duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        if problems:
+            message = f'Verificările pre-commit au găsit {len(problems)} probleme'
+        else:
+            message = f'Verificări pre-commit trecute ({len(blobs)} fișiere)'
+        return {'success': not problems, 'message': message, 'problems': problems,
+                'checked': len(blobs), 'cached': cached, 'duration_ms': duration_ms}
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Lucrul cu mai multe remote-uri
+Push-ul și fetch-ul sunt trimise în paralel către toate remote-urile
+configurate, fiecare cu propriul timeout și propriul rezultat. Remote-urile
+pot fi și repository-uri bare locale (ex: /mnt/backup/proiect.git).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from git_governor import run_process
+
+DEFAULT_TIMEOUT = 120
+MAX_PARALLEL = 8
+
+
+def upstream_remote(names):
+    """Remote-ul folosit la primul push (-u): origin dacă există, altfel primul configurat"""
+    if not names:
+        return None
+    return 'origin' if 'origin' in names else names[0]
+
+
+def run_with_timeout(command, cwd, timeout):
+    """
+    Rulează o comandă de rețea prin guvernator: grup de procese propriu,
+    astfel încât la timeout să fie oprite și procesele copil (ssh,
+    git-remote-https).
+    """
+    result = run_process(command, cwd, operation='network', timeout=timeout)
+    return {
+        'success': result.returncode == 0 and not result.timed_out,
+        'output': result.stdout,
+        'error': result.stderr.strip() or None,
+        'timed_out': result.timed_out,
+        'duration_ms': result.duration_ms
+    }
+
+
+class RemoteManager:
+    """Configurare, push și fetch pentru toate remote-urile unui repository"""
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+
+    def _git(self, args):
+        return run_process(['git'] + args, self.project_path)
+
+    def list_remotes(self):
+        result = self._git(['remote', '-v'])
+        remotes = {}
+        for line in result.stdout.strip().split('\n'):
+            parts = line.split()
+            if len(parts) < 3:
+                continue
+            name, url, kind = parts[0], parts[1], parts[2].strip('()')
+            remote = remotes.setdefault(name, {'name': name, 'fetch_url': None, 'push_url': None})
+            remote[f'{kind}_url'] = url
+        return list(remotes.values())
+
+    def remote_names(self):
+        return [remote['name'] for remote in self.list_remotes()]
+
+    def push_target(self):
+        """Remote-ul pentru primul push (None dacă nu există niciun remote)"""
+        return upstream_remote(self.remote_names())
+
+    def add_or_update(self, name, url):
+        """Adaugă un remote nou sau schimbă URL-ul unuia existent (fără a le șterge pe celelalte)"""
+        if name in self.remote_names():
+            result = self._git(['remote', 'set-url', name, url])
+            message = f'URL-ul remote-ului {name} a fost actualizat'
+        else:
+            result = self._git(['remote', 'add', name, url])
+            message = f'Remote-ul {name} a fost adăugat'
+
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare: {result.stderr.strip()}'}
+        return {'success': True, 'message': message}
+
+    def remove(self, name):
+        result = self._git(['remote', 'remove', name])
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare: {result.stderr.strip()}'}
+        return {'success': True, 'message': f'Remote-ul {name} a fost șters'}
+
+    def _fan_out(self, commands, timeout):
+        """Rulează câte o comandă per remote, în paralel; rezultatele păstrează ordinea"""
+        if not commands:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL, len(commands))) as pool:
+            futures = [
+                (name, pool.submit(run_with_timeout, command, self.project_path, timeout))
+                for name, command in commands
+            ]
+            return [{'remote': name, **future.result()} for name, future in futures]
+
+    def push_all(self, branch, remotes=None, set_upstream=False, timeout=DEFAULT_TIMEOUT):
+        """Push pe branch-ul dat către toate remote-urile (sau doar cele cerute), în paralel"""
+        names = remotes or self.remote_names()
+        upstream = upstream_remote(names)
+        commands = []
+        for name in names:
+            command = ['git', 'push', '--porcelain']
+            # Upstream-ul se setează o singură dată, pe origin (sau primul remote)
+            if set_upstream and name == upstream:
+                command.append('-u')
+            commands.append((name, command + [name, branch]))
+
+        results = self._fan_out(commands, timeout)
+        return self._summary(results, 'push')
+
+    def fetch_all(self, remotes=None, timeout=DEFAULT_TIMEOUT, jobs=MAX_PARALLEL):
+        """
+        Fetch de la toate remote-urile într-un singur proces
+        ('git fetch --multiple --jobs'). Dacă acesta eșuează, remote-urile
+        sunt reluate individual, în paralel, pentru a afla care a eșuat.
+        """
+        names = remotes or self.remote_names()
+        if not names:
+            return {'success': False, 'message': 'Nu este configurat niciun remote', 'results': []}
+
+        combined = run_with_timeout(
+            ['git', 'fetch', '--prune', '--multiple', f'--jobs={jobs}'] + names,
+            self.project_path,
+            timeout
+        )
+        if combined['success']:
+            results = [{'remote': name, 'success': True, 'error': None, 'timed_out': False,
+                        'duration_ms': combined['duration_ms']} for name in names]
+            return self._summary(results, 'fetch')
+
+        commands = [(name, ['git', 'fetch', '--prune', name]) for name in names]
+        return self._summary(self._fan_out(commands, timeout), 'fetch')
+
+    def _summary(self, results, operation):
+        ok = [result['remote'] for result in results if result['success']]
+        failed = [result['remote'] for result in results if not result['success']]
+        for result in results:
+            result.pop('output', None)
+
+        if not results:
+            message = 'Nu este configurat niciun remote'
+        elif not failed:
+            message = f'{operation.capitalize()} reușit pe {len(ok)} remote-uri: {", ".join(ok)}'
+        else:
+            message = f'{operation.capitalize()} eșuat pe: {", ".join(failed)}'
+            if ok:
+                message += f' (reușit pe: {", ".join(ok)})'
+
+        return {'success': bool(results) and not failed, 'message': message, 'results': results}
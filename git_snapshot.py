@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Backup prin comenzi plumbing, fără a atinge index-ul
+Backup-ul clasic ('git add .' + 'git commit') modifică staging area
+utilizatorului și ține index.lock pe toată durata operației. Snapshot-ul
+folosește în schimb un index temporar (GIT_INDEX_FILE), copiat din cel real:
+
+1. index-ul real este copiat (datele stat() și cache-tree rămân valabile,
+   deci fișierele și directoarele neschimbate nu sunt recitite)
+2. 'git add -A' actualizează doar copia
+3. write-tree / commit-tree creează commit-ul de backup
+4. update-ref mută refs/backups/<branch> (doar dacă nu s-a schimbat între timp)
+
+Staging area, HEAD și branch-ul curent rămân neschimbate, deci backup-ul
+poate rula în paralel cu lucrul utilizatorului. Commit-urile de backup
+formează un lanț separat: primul părinte este backup-ul anterior, iar
+HEAD-ul curent este adăugat ca părinte când s-a schimbat.
+"""
+
+import os
+import shutil
+import tempfile
+
+from git_governor import run_process
+from git_remotes import RemoteManager
+from git_sparse import SparseCheckoutManager
+from git_state import git_dir, worktree_state_dir
+
+REF_PREFIX = 'refs/backups/'
+MODE_KEY = 'gitmanager.backupMode'    # 'snapshot' = backup-ul rapid folosește acest mod implicit
+DETACHED_NAME = 'detached'
+
+
+class SnapshotBackup:
+    """Commit-uri de backup în refs/backups/<branch>, create cu un index temporar"""
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+
+    def _git(self, args, input_data=None, env=None):
+        return run_process(['git'] + args, self.project_path, input_data, text=False, env=env)
+
+    def _output(self, result):
+        return result.stdout.decode('utf-8', errors='surrogateescape').strip()
+
+    def _error(self, result):
+        return result.stderr.decode('utf-8', errors='replace').strip() or f'Cod de ieșire {result.returncode}'
+
+    def is_default(self):
+        """True dacă gitmanager.backupMode este 'snapshot'"""
+        result = self._git(['config', '--get', MODE_KEY])
+        return result.returncode == 0 and self._output(result).lower() == 'snapshot'
+
+    def branch(self):
+        result = self._git(['symbolic-ref', '--short', '-q', 'HEAD'])
+        return self._output(result) if result.returncode == 0 else DETACHED_NAME
+
+    def ref_name(self, branch=None):
+        return REF_PREFIX + (branch or self.branch())
+
+    def _rev(self, revision):
+        result = self._git(['rev-parse', '--verify', '-q', revision])
+        return self._output(result) if result.returncode == 0 else None
+
+    # --- Index temporar ---
+
+    def temporary_index(self):
+        """Copie a index-ului real, în directorul git al worktree-ului (aceeași partiție)"""
+        fd, path = tempfile.mkstemp(prefix='backup-index-', dir=worktree_state_dir(self.project_path))
+        os.close(fd)
+        real_index = os.path.join(git_dir(self.project_path), 'index')
+        try:
+            # Git înlocuiește index-ul prin redenumire, deci copia este mereu consistentă;
+            # mtime-ul păstrat evită ca toate intrările să pară "racily clean" (și să fie recitite)
+            shutil.copy2(real_index, path)
+        except FileNotFoundError:
+            # Repository fără index (fără niciun 'git add'): git pornește de la un index gol
+            os.remove(path)
+        return path
+
+    def stage(self, env, paths=None):
+        """'git add -A' în index-ul temporar (limitat la căile date sau la cone-ul sparse)"""
+        pathspecs = [f':(top,literal){path}' for path in paths] if paths is not None else \
+            SparseCheckoutManager(self.project_path).pathspecs()
+        args, input_data = ['add', '-A'], None
+        if pathspecs is not None:
+            args += ['--pathspec-from-file=-', '--pathspec-file-nul']
+            input_data = b''.join(pathspec.encode('utf-8', errors='surrogateescape') + b'\0'
+                                  for pathspec in pathspecs)
+        return self._git(args, input_data, env)
+
+    # --- Backup ---
+
+    def create(self, message, paths=None, check=None):
+        """
+        Creează un commit de backup din working tree. paths limitează
+        'git add' la căile date (implicit tot working tree-ul); check(env) poate
+        rula verificări pe index-ul temporar și oprește backup-ul returnând
+        un rezultat cu success=False.
+        """
+        branch = self.branch()
+        ref = self.ref_name(branch)
+        previous = self._rev(ref)
+        head = self._rev('HEAD')
+
+        index_path = self.temporary_index()
+        env = dict(os.environ, GIT_INDEX_FILE=index_path)
+        try:
+            result = self.stage(env, paths)
+            if result.returncode != 0:
+                return {'success': False, 'message': f'Eroare la adăugare: {self._error(result)}'}
+
+            if check is not None:
+                checks = check(env)
+                if not checks['success']:
+                    return checks
+
+            result = self._git(['write-tree'], env=env)
+            if result.returncode != 0:
+                return {'success': False, 'message': f'Eroare la write-tree: {self._error(result)}'}
+            tree = self._output(result)
+        finally:
+            try:
+                os.remove(index_path)
+            except OSError:
+                pass
+
+        # Nimic nou față de ultimul backup (sau față de HEAD, dacă nu există încă backup)
+        base = previous or head
+        if base and self._rev(f'{base}^{{tree}}') == tree:
+            return {'success': True, 'message': 'Nu există modificări de salvat', 'committed': False,
+                    'ref': ref, 'commit': base}
+
+        # HEAD devine părinte doar dacă nu este deja în lanțul de backup (utilizatorul a făcut commit între timp)
+        parents = [previous] if previous else []
+        if head and (not previous or self._git(['merge-base', '--is-ancestor', head, previous]).returncode != 0):
+            parents.append(head)
+        args = ['commit-tree', tree, '-m', message]
+        for parent in parents:
+            args += ['-p', parent]
+        result = self._git(args)
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare la commit-tree: {self._error(result)}'}
+        commit = self._output(result)
+
+        # Valoarea veche protejează împotriva unui backup paralel pe același branch
+        result = self._git(['update-ref', '-m', message, ref, commit, previous or '0' * len(commit)])
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare la update-ref: {self._error(result)}'}
+
+        return {
+            'success': True,
+            'message': f'Snapshot salvat în {ref} ({commit[:8]})',
+            'committed': True,
+            'ref': ref,
+            'commit': commit,
+            'tree': tree,
+            'parents': parents
+        }
+
+    def push(self, ref, remotes=None):
+        """Trimite ref-ul de backup pe remote-uri (același nume); lanțul crește doar prin fast-forward"""
+        return RemoteManager(self.project_path).push_all(f'{ref}:{ref}', remotes)
+
+    def list_backups(self):
+        """Backup-urile existente: un ref per branch, cu ultimul commit"""
+        result = self._git(['for-each-ref', '--sort=-committerdate',
+                            '--format=%(refname)%00%(objectname)%00%(committerdate:iso)%00%(subject)', REF_PREFIX])
+        backups = []
+        for line in self._output(result).splitlines():
+            fields = line.split('\0')
+            if len(fields) == 4:
+                backups.append({'ref': fields[0], 'branch': fields[0][len(REF_PREFIX):], 'commit': fields[1],
+                                'date': fields[2], 'subject': fields[3]})
+        return backups
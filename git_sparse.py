@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Sparse checkout și partial clone pentru monorepo-uri
+Un partial clone (--filter=blob:none) descarcă fișierele doar la nevoie, iar
+sparse-checkout în modul "cone" păstrează în working tree doar directoarele
+alese. Status-ul, structura proiectului și backup-ul sunt limitate la aceste
+directoare, deci costul fiecărei operații depinde doar de setul de lucru.
+"""
+
+import os
+import re
+import threading
+
+from git_governor import run_process
+from git_state import git_common_dir, git_dir
+
+PARTIAL_CLONE_FILTER = 'blob:none'
+
+_TRUE = {'true', 'yes', 'on', '1', ''}
+
+# Starea sparse-checkout per worktree, recitită doar când config-ul sau
+# info/sparse-checkout se schimbă (pathspecs() rulează la fiecare status)
+_states = {}
+_states_lock = threading.Lock()
+
+
+def _stat(path):
+    try:
+        info = os.stat(path)
+        return info.st_ino, info.st_mtime_ns, info.st_size
+    except OSError:
+        return None
+
+
+def _read(path):
+    try:
+        with open(path, 'rb') as f:
+            return f.read().decode('utf-8', errors='replace')
+    except OSError:
+        return ''
+
+
+def _core_settings(*texts):
+    """
+    Cheile din secțiunea [core] ale fișierelor de config (ultima valoare
+    câștigă). Parser minimal: include-urile și config-ul global sunt ignorate,
+    sparse-checkout se configurează întotdeauna local.
+    """
+    settings = {}
+    for text in texts:
+        section = None
+        for line in text.splitlines():
+            line = line.strip()
+            match = re.match(r'\[\s*([A-Za-z0-9.-]+)(\s+"[^"]*")?\s*\](.*)', line)
+            if match:
+                section = None if match.group(2) else match.group(1).lower()
+                line = match.group(3).strip()
+            if section != 'core' or not line or line[0] in '#;':
+                continue
+            key, _, value = line.partition('=')
+            value = re.split(r'\s[#;]', value, maxsplit=1)[0].strip().strip('"')
+            settings[key.strip().lower()] = value.lower()
+    return settings
+
+
+def _cone_directories(patterns):
+    """
+    Directoarele din fișierul de pattern-uri în modul cone, ca în
+    `git sparse-checkout list`: '/a/' urmat de '!/a/*/' este doar un părinte,
+    celelalte intrări '/dir/' sunt incluse recursiv.
+    """
+    parents = {line[2:-3] for line in patterns if line.startswith('!/') and line.endswith('/*/')}
+    directories = []
+    for line in patterns:
+        if line.startswith('/') and line.endswith('/') and line != '/':
+            directory = re.sub(r'\\(.)', r'\1', line[1:-1])
+            if line[1:-1] not in parents:
+                directories.append(directory)
+    return directories
+
+
+class SparseCheckoutManager:
+    """Gestionează setul de directoare (cone) din working tree"""
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+
+    def _git(self, args, cwd=None, input_text=None):
+        return run_process(['git'] + args, cwd or self.project_path, input_text)
+
+    def _result(self, result, message):
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare: {result.stderr.strip()}'}
+        return {'success': True, 'message': message, 'directories': self.directories()}
+
+    @staticmethod
+    def _normalize(directories):
+        return sorted({directory.strip().strip('/') for directory in directories if directory.strip().strip('/')})
+
+    # --- Stare ---
+
+    def _state(self):
+        """(activ, directoare) citite direct din .git, fără procese git"""
+        own_dir = git_dir(self.project_path)
+        paths = (os.path.join(git_common_dir(self.project_path), 'config'),
+                 os.path.join(own_dir, 'config.worktree'),
+                 os.path.join(own_dir, 'info', 'sparse-checkout'))
+        stamp = tuple(_stat(path) for path in paths)
+
+        with _states_lock:
+            cached = _states.get(own_dir)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+        settings = _core_settings(_read(paths[0]), _read(paths[1]))
+        enabled = settings.get('sparsecheckout', 'false') in _TRUE
+        directories = []
+        if enabled:
+            patterns = [line.strip() for line in _read(paths[2]).splitlines() if line.strip()]
+            cone = settings.get('sparsecheckoutcone', 'false') in _TRUE
+            if cone and patterns[:2] == ['/*', '!/*/']:
+                directories = _cone_directories(patterns)
+            else:
+                directories = [line for line in patterns if not line.startswith('#')]
+
+        state = (enabled, directories)
+        with _states_lock:
+            _states[own_dir] = (stamp, state)
+        return state
+
+    def is_enabled(self):
+        return self._state()[0]
+
+    def is_partial_clone(self):
+        result = self._git(['config', '--get-regexp', r'^remote\..*\.promisor$'])
+        return 'true' in result.stdout
+
+    def directories(self):
+        """Directoarele din cone (lista este goală dacă sparse-checkout nu este activ)"""
+        return list(self._state()[1])
+
+    def get_info(self):
+        enabled = self.is_enabled()
+        return {
+            'success': True,
+            'enabled': enabled,
+            'partial_clone': self.is_partial_clone(),
+            'directories': self.directories() if enabled else []
+        }
+
+    def pathspecs(self):
+        """
+        Pathspec-uri care limitează status/add la cone: fișierele din rădăcină
+        plus directoarele alese. None dacă sparse-checkout nu este activ.
+        """
+        enabled, directories = self._state()
+        if not enabled:
+            return None
+        return [':(top,glob)*'] + [f':(top,literal){directory}' for directory in directories]
+
+    @staticmethod
+    def in_cone(rel_path, directories):
+        """
+        True dacă un director relativ trebuie afișat (este în cone sau părinte
+        al acestuia). directories = None înseamnă working tree complet.
+        """
+        if directories is None:
+            return True
+        rel_path = rel_path.strip('/')
+        return any(
+            rel_path == directory or rel_path.startswith(directory + '/') or directory.startswith(rel_path + '/')
+            for directory in directories
+        )
+
+    # --- Configurare ---
+
+    def clone(self, url, destination, directories=None):
+        """Clonează ca partial clone, cu sparse-checkout în modul cone"""
+        destination = os.path.abspath(os.path.expanduser(destination))
+        if os.path.exists(destination) and os.listdir(destination):
+            return {'success': False, 'message': 'Directorul destinație nu este gol'}
+
+        result = self._git(
+            ['clone', f'--filter={PARTIAL_CLONE_FILTER}', '--sparse', url, destination],
+            cwd=os.path.dirname(destination) or None
+        )
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare la clonare: {result.stderr.strip()}'}
+
+        clone = SparseCheckoutManager(destination)
+        result = clone._git(['sparse-checkout', 'set', '--cone', '--sparse-index', '--stdin'],
+                            input_text='\n'.join(self._normalize(directories or [])) + '\n')
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare la sparse-checkout: {result.stderr.strip()}'}
+
+        return {
+            'success': True,
+            'message': f'Repository clonat în {destination} (partial clone + sparse-checkout)',
+            'destination': destination,
+            'directories': clone.directories()
+        }
+
+    def convert(self, directories, remote='origin'):
+        """
+        Transformă un clone existent: remote-ul devine promisor (blob-urile
+        lipsă se descarcă la cerere) și working tree-ul este redus la cone.
+        """
+        if remote in self._git(['remote']).stdout.split():
+            for key, value in (
+                ('core.repositoryformatversion', '1'),
+                ('extensions.partialClone', remote),
+                (f'remote.{remote}.promisor', 'true'),
+                (f'remote.{remote}.partialclonefilter', PARTIAL_CLONE_FILTER),
+            ):
+                result = self._git(['config', key, value])
+                if result.returncode != 0:
+                    return {'success': False, 'message': f'Eroare: {result.stderr.strip()}'}
+
+        result = self._git(['sparse-checkout', 'set', '--cone', '--sparse-index', '--stdin'],
+                           input_text='\n'.join(self._normalize(directories)) + '\n')
+        return self._result(result, 'Sparse-checkout activat')
+
+    def add(self, directories):
+        directories = self._normalize(directories)
+        if not directories:
+            return {'success': False, 'message': 'Nu a fost specificat niciun director'}
+        if not self.is_enabled():
+            return self.convert(directories)
+
+        result = self._git(['sparse-checkout', 'add', '--stdin'], input_text='\n'.join(directories) + '\n')
+        return self._result(result, f'Adăugat în sparse-checkout: {", ".join(directories)}')
+
+    def remove(self, directories):
+        directories = set(self._normalize(directories))
+        current = self.directories()
+        remaining = [directory for directory in current if directory not in directories]
+        if len(remaining) == len(current):
+            return {'success': False, 'message': 'Directoarele nu fac parte din sparse-checkout'}
+
+        result = self._git(['sparse-checkout', 'set', '--stdin'], input_text='\n'.join(remaining) + '\n')
+        return self._result(result, f'Eliminat din sparse-checkout: {", ".join(sorted(directories))}')
+
+    def disable(self):
+        result = self._git(['sparse-checkout', 'disable'])
+        return self._result(result, 'Sparse-checkout dezactivat (working tree complet)')
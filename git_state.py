@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Director de stare locală
+Fiecare subsistem (analytics, mentenanță, backup) își păstrează datele
+în .git/git_manager/, astfel încât nimic nu ajunge în working tree.
+"""
+
+import os
+import subprocess
+
+STATE_DIR_NAME = 'git_manager'
+
+_common_dirs = {}
+
+
+def git_common_dir(project_path):
+    """Returnează directorul .git comun (același pentru toate worktree-urile)"""
+    project_path = os.path.abspath(project_path)
+    if project_path in _common_dirs:
+        return _common_dirs[project_path]
+
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--git-common-dir'],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=project_path
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        # Nu memorăm eșecul: repository-ul poate fi inițializat ulterior
+        return os.path.join(project_path, '.git')
+
+    common_dir = os.path.normpath(os.path.join(project_path, result.stdout.strip()))
+    _common_dirs[project_path] = common_dir
+    return common_dir
+
+
+def state_dir(project_path):
+    """Returnează (și creează la nevoie) directorul de stare al managerului"""
+    path = os.path.join(git_common_dir(project_path), STATE_DIR_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+_git_dirs = {}
+
+
+def git_dir(project_path):
+    """
+    Returnează directorul git propriu worktree-ului (index, HEAD). Pentru
+    worktree-ul principal este același cu git_common_dir().
+    """
+    project_path = os.path.abspath(project_path)
+    if project_path in _git_dirs:
+        return _git_dirs[project_path]
+
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--git-dir'],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=project_path
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return os.path.join(project_path, '.git')
+
+    path = os.path.normpath(os.path.join(project_path, result.stdout.strip()))
+    _git_dirs[project_path] = path
+    return path
+
+
+def worktree_state_dir(project_path):
+    """Director de stare separat pentru fiecare worktree (date legate de working tree)"""
+    path = os.path.join(git_dir(project_path), STATE_DIR_NAME)
+    os.makedirs(path, exist_ok=True)
+    return path
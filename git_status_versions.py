@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Versiuni ale status-ului pentru actualizări incrementale
+Pentru fiecare repository se păstrează ultimele STATUS_HISTORY status-uri,
+fiecare cu un număr de versiune care crește doar când ceva s-a schimbat.
+Un client care trimite versiunea pe care o are deja (/api/status?since=N)
+primește doar fișierele adăugate, eliminate sau schimbate față de ea; dacă
+versiunea nu mai este păstrată (sau serverul a repornit), primește status-ul
+complet. Câmpurile volatile (id-ul output-ului complet) nu schimbă versiunea.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+# Versiuni păstrate per repository (clienții mai vechi primesc status-ul complet)
+STATUS_HISTORY = 20
+
+# Câmpuri care nu intră în comparație: fișierele au delta proprie, iar
+# output-ul complet poate primi alt id fără ca status-ul să se schimbe
+UNVERSIONED_FIELDS = ('files', 'output')
+
+
+class StatusVersions:
+    """Snapshot-uri versionate ale status-ului, per repository"""
+
+    def __init__(self, history=STATUS_HISTORY):
+        self.history = history
+        self.repos = {}
+        self.lock = threading.Lock()
+
+    def update(self, key, status):
+        """Înregistrează status-ul; returnează versiunea (nouă doar dacă status-ul diferă)"""
+        files = {entry['name']: entry for entry in status.get('files') or []}
+        fields = {name: value for name, value in status.items() if name not in UNVERSIONED_FIELDS}
+        with self.lock:
+            repo = self.repos.get(key)
+            if repo is None:
+                # Pornind de la ora curentă, versiunile unui server repornit nu se confundă cu cele vechi
+                repo = self.repos[key] = {'version': int(time.time() * 1000), 'snapshots': OrderedDict()}
+            elif repo['snapshots'][repo['version']] == (files, fields):
+                return repo['version']
+            else:
+                repo['version'] += 1
+
+            snapshots = repo['snapshots']
+            snapshots[repo['version']] = (files, fields)
+            while len(snapshots) > self.history:
+                snapshots.popitem(last=False)
+            return repo['version']
+
+    def delta(self, key, since, version):
+        """Diferențele de fișiere dintre două versiuni păstrate, sau None"""
+        with self.lock:
+            snapshots = self.repos.get(key, {}).get('snapshots', {})
+            if since not in snapshots or version not in snapshots:
+                return None
+            old, new = snapshots[since][0], snapshots[version][0]
+
+        return {
+            'added': [entry for name, entry in new.items() if name not in old],
+            'removed': [name for name in old if name not in new],
+            'changed': [entry for name, entry in new.items() if name in old and old[name] != entry]
+        }
+
+    def respond(self, key, status, since=None):
+        """
+        Răspunsul pentru client: status-ul complet (full=True) sau, dacă
+        clientul are deja versiunea `since`, status-ul fără lista de fișiere
+        și cu files_delta (added / removed / changed).
+        """
+        version = self.update(key, status)
+        delta = self.delta(key, since, version) if since is not None else None
+        if delta is None:
+            return {**status, 'version': version, 'full': True}
+
+        fields = {name: value for name, value in status.items() if name != 'files'}
+        return {**fields, 'version': version, 'full': False, 'files_delta': delta}
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Output în timp real pentru comenzile git lungi
+Procesul git scrie stdout și stderr în același pipe; un thread le citește
+linie cu linie într-o coadă limitată. Când clientul citește mai încet decât
+scrie git, coada se umple, thread-ul se oprește din citit și git așteaptă
+(backpressure), deci memoria serverului rămâne limitată indiferent de
+cantitatea de output.
+"""
+
+import os
+import queue
+import re
+import subprocess
+import threading
+import time
+
+from git_governor import classify, governor
+
+MAX_BUFFERED_LINES = 1000
+MAX_LINE_LENGTH = 4096
+HEARTBEAT_SECONDS = 5
+DEFAULT_TIMEOUT = 600
+
+# git rescrie liniile de progres cu '\r' ("Writing objects:  45% ...")
+LINE_BREAK = re.compile(rb'\r\n|\r|\n')
+
+_END = object()
+
+
+class GitStream:
+    """Iterator de evenimente (start, line, heartbeat, end) pentru o comandă git"""
+
+    def __init__(self, command, cwd, timeout=DEFAULT_TIMEOUT, max_buffered_lines=MAX_BUFFERED_LINES):
+        self.command = command
+        self.cwd = cwd
+        self.timeout = timeout
+        self.lines = queue.Queue(maxsize=max_buffered_lines)
+        self.process = None
+        self.lines_total = 0
+        self._stopped = threading.Event()
+
+    def _put(self, item):
+        """Așteaptă loc în coadă; renunță dacă iteratorul a fost închis"""
+        while not self._stopped.is_set():
+            try:
+                self.lines.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def _reader(self):
+        """Citește pipe-ul în bucăți și pune liniile în coadă (put blochează când coada e plină)"""
+        pending = b''
+        fd = self.process.stdout.fileno()
+        try:
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                pending += chunk
+                parts = LINE_BREAK.split(pending)
+                separators = LINE_BREAK.findall(pending)
+                pending = parts.pop()
+                for text, separator in zip(parts, separators):
+                    self._put((text[:MAX_LINE_LENGTH], separator == b'\r'))
+                # O linie fără sfârșit nu poate crește la nesfârșit
+                if len(pending) > MAX_LINE_LENGTH:
+                    self._put((pending[:MAX_LINE_LENGTH], False))
+                    pending = b''
+                if self._stopped.is_set():
+                    break
+            if pending:
+                self._put((pending[:MAX_LINE_LENGTH], False))
+        except OSError:
+            pass
+        finally:
+            self.process.stdout.close()
+            self._put(_END)
+
+    def kill(self):
+        if self.process is not None:
+            governor.terminate(self.process)
+
+    def __iter__(self):
+        # Stream-urile ocupă un loc în coada comună, ca orice alt proces git
+        if governor.acquire(self.cwd, classify(self.command)) is None:
+            yield {'type': 'end', 'success': False, 'returncode': None,
+                   'error': 'Prea multe procese git în așteptare'}
+            return
+        try:
+            yield from self._events()
+        finally:
+            governor.release(self.cwd)
+
+    def _events(self):
+        start = time.perf_counter()
+        try:
+            # Procesul este înregistrat la guvernator: terminate_all() îl oprește la închiderea aplicației
+            self.process = governor.popen(self.command, self.cwd, governor.environment(False, None), False,
+                                          subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        except OSError as e:
+            yield {'type': 'end', 'success': False, 'returncode': None, 'error': str(e)}
+            return
+
+        reader = threading.Thread(target=self._reader, name='git-stream-reader', daemon=True)
+        reader.start()
+        timed_out = False
+        try:
+            yield {'type': 'start', 'command': ' '.join(self.command)}
+            while True:
+                remaining = self.timeout - (time.perf_counter() - start)
+                if remaining <= 0:
+                    timed_out = True
+                    governor.record_timeout(classify(self.command))
+                    self.kill()
+                    break
+                try:
+                    item = self.lines.get(timeout=min(HEARTBEAT_SECONDS, remaining))
+                except queue.Empty:
+                    # Menține conexiunea și detectează clientul deconectat
+                    yield {'type': 'heartbeat'}
+                    continue
+                if item is _END:
+                    break
+                text, progress = item
+                self.lines_total += 1
+                yield {'type': 'line', 'text': text.decode('utf-8', errors='replace'), 'progress': progress}
+
+            returncode = self.process.wait()
+            yield {
+                'type': 'end',
+                'success': returncode == 0 and not timed_out,
+                'returncode': returncode,
+                'error': f'Timeout după {self.timeout}s' if timed_out else None,
+                'lines': self.lines_total,
+                'duration_ms': round((time.perf_counter() - start) * 1000, 2)
+            }
+        finally:
+            # Generatorul este închis și când clientul se deconectează
+            self._stopped.set()
+            self.kill()
+            self.process.wait()
+            governor.forget(self.process)
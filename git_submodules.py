@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Status și backup pentru submodule
+Fiecare submodul este un repository separat: status-ul lui este citit în
+paralel (număr limitat de procese), iar la backup submodulele sunt salvate
+înaintea repository-ului părinte, de la cele mai adânci spre rădăcină, astfel
+încât părintele să înregistreze commit-urile noi ale submodulelor.
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from git_governor import run_process
+from git_remotes import DEFAULT_TIMEOUT, run_with_timeout
+
+DEFAULT_JOBS = min(8, os.cpu_count() or 4)
+
+# ' ' = la zi, '-' = neinițializat, '+' = alt commit decât cel din părinte, 'U' = conflict
+SUBMODULE_LINE = re.compile(r'^([ +\-U])([0-9a-f]+) (.+?)(?: \((.*)\))?$')
+SUBMODULE_STATES = {' ': 'ok', '-': 'uninitialized', '+': 'out_of_sync', 'U': 'conflict'}
+
+
+class SubmoduleManager:
+    """Submodulele (inclusiv cele imbricate) ale unui repository"""
+
+    def __init__(self, project_path, jobs=DEFAULT_JOBS):
+        self.project_path = project_path
+        self.jobs = max(1, jobs)
+
+    def _git(self, args, cwd=None):
+        return run_process(['git'] + args, cwd or self.project_path)
+
+    def _abs(self, rel_path):
+        return os.path.join(self.project_path, *rel_path.split('/'))
+
+    def has_submodules(self):
+        return os.path.exists(os.path.join(self.project_path, '.gitmodules'))
+
+    def list_submodules(self):
+        """Toate submodulele, recursiv, cu adâncimea și părintele fiecăruia"""
+        if not self.has_submodules():
+            return []
+
+        result = self._git(['submodule', 'status', '--recursive'])
+        submodules = []
+        for line in result.stdout.split('\n'):
+            match = SUBMODULE_LINE.match(line)
+            if not match:
+                continue
+            flag, commit, path, describe = match.groups()
+            submodules.append({
+                'path': path,
+                'commit': commit[:7],
+                'describe': describe,
+                'state': SUBMODULE_STATES[flag]
+            })
+
+        paths = [submodule['path'] for submodule in submodules]
+        for submodule in submodules:
+            parents = [path for path in paths if submodule['path'].startswith(path + '/')]
+            submodule['parent'] = max(parents, key=len) if parents else None
+            submodule['depth'] = len(parents)
+        return submodules
+
+    def _run_parallel(self, function, items):
+        """Aplică function pe fiecare element, pe un pool limitat la self.jobs"""
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(items))) as pool:
+            return list(pool.map(function, items))
+
+    # --- Status ---
+
+    def _inspect(self, submodule):
+        entry = dict(submodule)
+        entry.update({'branch': None, 'ahead': 0, 'behind': 0, 'changes': 0, 'dirty': False})
+        if submodule['state'] == 'uninitialized':
+            return entry
+
+        result = self._git(['status', '--porcelain=v2', '--branch'], cwd=self._abs(submodule['path']))
+        if result.returncode != 0:
+            entry['error'] = result.stderr.strip()
+            return entry
+
+        for line in result.stdout.split('\n'):
+            if line.startswith('# branch.head '):
+                head = line[len('# branch.head '):]
+                entry['branch'] = None if head == '(detached)' else head
+            elif line.startswith('# branch.ab '):
+                ahead, behind = line[len('# branch.ab '):].split()
+                entry['ahead'], entry['behind'] = int(ahead), -int(behind)
+            elif line and not line.startswith('#'):
+                entry['changes'] += 1
+
+        entry['dirty'] = entry['changes'] > 0
+        return entry
+
+    def status(self):
+        """Starea fiecărui submodul, citită în paralel"""
+        return self._run_parallel(self._inspect, self.list_submodules())
+
+    # --- Backup ---
+
+    def _backup_one(self, submodule, message, push, timeout):
+        entry = {'path': submodule['path'], 'committed': False, 'pushed': False, 'error': None}
+        if not submodule['dirty']:
+            entry['skipped'] = 'curat'
+            return entry
+        # Un commit pe HEAD detașat s-ar pierde la următorul 'submodule update'
+        if not submodule['branch']:
+            entry['error'] = 'HEAD detașat - creează un branch în submodul pentru backup'
+            return entry
+
+        cwd = self._abs(submodule['path'])
+        result = self._git(['add', '-A'], cwd=cwd)
+        if result.returncode != 0:
+            entry['error'] = f'Eroare la adăugare: {result.stderr.strip()}'
+            return entry
+        if self._git(['diff', '--cached', '--quiet'], cwd=cwd).returncode == 0:
+            entry['skipped'] = 'nimic de salvat'
+            return entry
+
+        result = self._git(['commit', '-m', message], cwd=cwd)
+        if result.returncode != 0:
+            entry['error'] = f'Eroare la commit: {result.stderr.strip()}'
+            return entry
+        entry['committed'] = True
+
+        if push and self._git(['rev-parse', '--abbrev-ref', '@{u}'], cwd=cwd).returncode == 0:
+            push_result = run_with_timeout(['git', 'push'], cwd, timeout)
+            entry['pushed'] = push_result['success']
+            if not push_result['success']:
+                entry['error'] = f'Eroare la push: {push_result["error"]}'
+        return entry
+
+    def backup(self, message, push=False, timeout=DEFAULT_TIMEOUT, statuses=None):
+        """
+        Salvează submodulele modificate: nivelurile sunt procesate de la cel
+        mai adânc spre rădăcină (părintele după copii), iar submodulele de pe
+        același nivel în paralel. Repository-ul principal rămâne pentru apelant.
+        statuses poate refolosi rezultatul unui status() anterior.
+        """
+        submodules = [dict(submodule) for submodule in statuses] if statuses is not None else self.status()
+        results = []
+        for depth in sorted({submodule['depth'] for submodule in submodules}, reverse=True):
+            level = [submodule for submodule in submodules if submodule['depth'] == depth]
+            # Un submodul intermediar devine "murdar" după commit-urile copiilor lui
+            committed = {result['path'] for result in results if result['committed']}
+            for submodule in level:
+                if any(path.startswith(submodule['path'] + '/') for path in committed):
+                    submodule['dirty'] = True
+            results += self._run_parallel(lambda item: self._backup_one(item, message, push, timeout), level)
+
+        committed = [result['path'] for result in results if result['committed']]
+        failed = [result['path'] for result in results if result['error']]
+        if failed:
+            summary = f'Submodule cu erori: {", ".join(failed)}'
+        elif committed:
+            summary = f'Submodule salvate: {", ".join(committed)}'
+        else:
+            summary = 'Submodulele nu au modificări'
+
+        return {
+            'success': not failed,
+            'message': summary,
+            'committed': committed,
+            'results': results
+        }
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Analiza fișierelor neurmărite și sugestii pentru .gitignore
+Output-ul de build și directoarele copiate în proiect (node_modules, dist,
+vendor...) sunt parcurse de git la fiecare status și 'git add .'. Analiza:
+
+- grupează fișierele neurmărite pe directoare complet neurmărite și pe
+  tipare (extensii / nume) răspândite printre fișierele urmărite
+- măsoară timpul real al 'git status' și al parcurgerii fișierelor
+  neurmărite, apoi îl împarte între grupuri după numărul de intrări
+- propune reguli .gitignore ordonate după timpul estimat câștigat; o regulă
+  nu este propusă dacă ar ascunde fișiere de același fel deja urmărite
+
+Regulile acceptate sunt adăugate la .gitignore, iar timpul este măsurat din
+nou pentru comparație.
+"""
+
+import os
+import statistics
+
+from git_governor import run_process
+from git_output import run_captured
+
+# Directoare generate sau copiate care nu ar trebui să fie în Git
+GENERATED_DIRS = {
+    'node_modules', 'bower_components', 'vendor', 'build', 'dist', 'out', 'target', 'bin', 'obj',
+    '__pycache__', '.pytest_cache', '.mypy_cache', '.ruff_cache', '.tox', '.nox', '.venv', 'venv', 'env',
+    '.gradle', '.next', '.nuxt', '.cache', '.parcel-cache', 'coverage', 'htmlcov', '.idea', '.vscode',
+    '.eggs', '.terraform', 'Pods', 'DerivedData'
+}
+GENERATED_EXTENSIONS = {
+    '.pyc', '.pyo', '.o', '.obj', '.a', '.so', '.dll', '.dylib', '.exe', '.class', '.jar', '.log',
+    '.tmp', '.swp', '.swo', '.bak', '.cache', '.pid', '.egg-info'
+}
+GENERATED_FILES = {'.DS_Store', 'Thumbs.db', 'desktop.ini'}
+
+# Peste aceste praguri, un grup este propus chiar dacă numele nu este cunoscut
+LARGE_DIRECTORY_FILES = 200
+COMMON_EXTENSION_FILES = 50
+
+MEASURE_RUNS = 3
+SAMPLE_PATHS = 5
+GITIGNORE_HEADER = '# Adăugat de Git Manager (analiza fișierelor neurmărite)'
+
+
+class UntrackedAnalyzer:
+    """Grupează fișierele neurmărite și propune reguli .gitignore"""
+
+    def __init__(self, project_path):
+        self.project_path = project_path
+
+    def _git(self, args):
+        return run_process(['git'] + args, self.project_path, text=False)
+
+    def _records(self, args):
+        # Listele pot avea milioane de intrări: sunt citite incremental, cu memorie limitată
+        capture = run_captured(['git'] + args, self.project_path)
+        try:
+            if not capture.success:
+                return
+            for record in capture.iter_records(b'\0'):
+                if record:
+                    yield record.decode('utf-8', errors='surrogateescape')
+        finally:
+            capture.close()
+
+    # --- Măsurare ---
+
+    def measure(self, runs=MEASURE_RUNS):
+        """
+        Mediana a câteva rulări (ms): 'git status --porcelain' (ca în
+        aplicație) și parcurgerea completă a fișierelor neurmărite (costul
+        'git add .' și 'git status -uall').
+        """
+        status = [self._git(['status', '--porcelain']).duration_ms for _ in range(runs)]
+        scan = [self._git(['ls-files', '-z', '--others', '--exclude-standard']).duration_ms for _ in range(runs)]
+        return {'status_ms': round(statistics.median(status), 2), 'untracked_scan_ms': round(statistics.median(scan), 2)}
+
+    # --- Grupare ---
+
+    def tracked_names(self):
+        """Numele de directoare și extensiile folosite de fișierele urmărite"""
+        directories, extensions, files = set(), set(), set()
+        for path in self._records(['ls-files', '-z']):
+            parts = path.split('/')
+            directories.update(parts[:-1])
+            files.add(parts[-1])
+            extensions.add(os.path.splitext(parts[-1])[1].lower())
+        return directories, extensions, files
+
+    def clusters(self):
+        """Directoarele complet neurmărite și fișierele neurmărite răspândite (grupate pe extensie / nume)"""
+        untracked_dirs = {entry.rstrip('/') for entry in
+                          self._records(['ls-files', '-z', '--others', '--exclude-standard',
+                                                        '--directory', '--no-empty-directory'])
+                          if entry.endswith('/')}
+        directories = {path: {'files': 0, 'directories': set(), 'size': 0} for path in untracked_dirs}
+        scattered = {}
+
+        for path in self._records(['ls-files', '-z', '--others', '--exclude-standard']):
+            try:
+                size = os.lstat(os.path.join(self.project_path, path)).st_size
+            except OSError:
+                size = 0
+            parts = path.split('/')
+            owner = next((depth for depth in range(1, len(parts)) if '/'.join(parts[:depth]) in directories), None)
+            if owner is not None:
+                # Un director generat din interiorul unui director neurmărit (app/node_modules) are grupul lui
+                nested = next((depth for depth in range(owner, len(parts)) if parts[depth - 1] in GENERATED_DIRS), owner)
+                owner = '/'.join(parts[:nested])
+                if owner not in directories:
+                    directories[owner] = {'files': 0, 'directories': set(), 'size': 0}
+                cluster = directories[owner]
+                cluster['files'] += 1
+                cluster['size'] += size
+                cluster['directories'].add('/'.join(parts[:-1]))
+                continue
+
+            name = parts[-1]
+            key = ('file', name) if name in GENERATED_FILES else ('extension', os.path.splitext(name)[1].lower())
+            cluster = scattered.setdefault(key, {'files': 0, 'directories': set(), 'size': 0, 'paths': []})
+            cluster['files'] += 1
+            cluster['size'] += size
+            if len(cluster['paths']) < SAMPLE_PATHS:
+                cluster['paths'].append(path)
+        return directories, scattered
+
+    def analyze(self, timing=None):
+        """Sugestiile de reguli .gitignore, ordonate după timpul estimat câștigat"""
+        timing = timing or self.measure()
+        directories, scattered = self.clusters()
+        tracked_dirs, tracked_extensions, tracked_files = self.tracked_names()
+
+        suggestions = []
+        # Directoare: același nume în mai multe locuri devine o singură regulă 'nume/'
+        by_name = {}
+        for path, cluster in directories.items():
+            by_name.setdefault(path.rsplit('/', 1)[-1], []).append((path, cluster))
+        for name, group in by_name.items():
+            known = name in GENERATED_DIRS
+            if (known or len(group) > 1) and name not in tracked_dirs:
+                suggestions.append(self._suggestion(f'{name}/', 'directory', group,
+                                                    'director generat' if known else f'apare în {len(group)} locuri'))
+                continue
+            for path, cluster in group:
+                if cluster['files'] >= LARGE_DIRECTORY_FILES:
+                    suggestions.append(self._suggestion(f'/{path}/', 'directory', [(path, cluster)],
+                                                        f"{cluster['files']} fișiere neurmărite"))
+
+        # Fișiere răspândite printre cele urmărite
+        for (kind, value), cluster in scattered.items():
+            if kind == 'file':
+                if value not in tracked_files:
+                    suggestions.append(self._suggestion(value, 'pattern', [(None, cluster)], 'fișier de sistem'))
+            elif value and value not in tracked_extensions and (
+                    value in GENERATED_EXTENSIONS or cluster['files'] >= COMMON_EXTENSION_FILES):
+                reason = 'fișiere generate' if value in GENERATED_EXTENSIONS else f"{cluster['files']} fișiere {value}"
+                suggestions.append(self._suggestion(f'*{value}', 'pattern', [(None, cluster)], reason))
+
+        # Costul parcurgerii este împărțit după numărul de intrări (fișiere + directoare) din fiecare grup
+        total = sum(c['files'] + len(c['directories']) for c in directories.values()) + \
+            sum(c['files'] for c in scattered.values())
+        for suggestion in suggestions:
+            suggestion['cost_ms'] = round(timing['untracked_scan_ms'] * suggestion['entries'] / total, 2) if total else 0.0
+        suggestions.sort(key=lambda s: (s['cost_ms'], s['files']), reverse=True)
+        untracked = sum(c['files'] for c in directories.values()) + sum(c['files'] for c in scattered.values())
+        return {
+            'success': True,
+            'message': f'{untracked} fișiere neurmărite, {len(suggestions)} reguli propuse',
+            'timing': timing,
+            'untracked_files': untracked,
+            'suggestions': suggestions
+        }
+
+    def _suggestion(self, rule, kind, group, reason):
+        files = sum(cluster['files'] for _, cluster in group)
+        subdirectories = sum(len(cluster['directories']) for _, cluster in group)
+        paths = [path + '/' for path, _ in group if path is not None] or \
+            [path for _, cluster in group for path in cluster.get('paths', [])]
+        return {
+            'rule': rule,
+            'kind': kind,
+            'reason': reason,
+            'files': files,
+            'entries': files + subdirectories,
+            'size': sum(cluster['size'] for _, cluster in group),
+            'paths': paths[:SAMPLE_PATHS]
+        }
+
+    # --- Aplicare ---
+
+    def existing_rules(self):
+        try:
+            with open(os.path.join(self.project_path, '.gitignore'), 'r', encoding='utf-8') as f:
+                return {line.strip() for line in f}
+        except OSError:
+            return set()
+
+    def apply(self, rules):
+        """Adaugă regulile la .gitignore și măsoară din nou timpul status-ului"""
+        rules = [rule.strip() for rule in rules if rule and rule.strip()]
+        if not rules:
+            return {'success': False, 'message': 'Nu a fost aleasă nicio regulă'}
+
+        before = self.measure()
+        existing = self.existing_rules()
+        new_rules = [rule for rule in dict.fromkeys(rules) if rule not in existing]
+        path = os.path.join(self.project_path, '.gitignore')
+        if new_rules:
+            try:
+                with open(path, 'a+', encoding='utf-8') as f:
+                    f.seek(0)
+                    content = f.read()
+                    prefix = '' if not content or content.endswith('\n') else '\n'
+                    f.write(prefix + ('\n' if content else '') + GITIGNORE_HEADER + '\n' + ''.join(r + '\n' for r in new_rules))
+            except OSError as e:
+                return {'success': False, 'message': f'Nu am putut scrie .gitignore: {e}'}
+        after = self.measure()
+
+        saved = before['status_ms'] - after['status_ms']
+        return {
+            'success': True,
+            'message': f'{len(new_rules)} reguli adăugate în .gitignore' if new_rules else 'Regulile există deja în .gitignore',
+            'added': new_rules,
+            'before': before,
+            'after': after,
+            'saved_ms': round(saved, 2)
+        }
@@ -5,13 +5,44 @@ Git Manager Web App - Flask Backend
 Interfață web pentru gestionarea Git cu design de terminal Linux
 """
 
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, render_template, request, jsonify, session, Response, stream_with_context, send_file
 import os
+import copy
 import subprocess
 import json
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import secrets
+import itertools
+
+from git_analytics import RepoAnalytics
+from git_assets import AssetPipeline
+from git_bloat import BloatAnalyzer
+from git_change_detect import ChangeDetector
+from git_core import get_core, run_command
+from git_governor import governor
+from git_output import CHUNK_SIZE, outputs, run_captured
+from git_precommit import PrecommitPipeline
+from git_bundle_backup import BundleBackup
+from git_remotes import RemoteManager, upstream_remote
+from git_snapshot import SnapshotBackup
+from git_sparse import SparseCheckoutManager
+from git_status_versions import StatusVersions
+from git_stream import GitStream
+from git_submodules import SubmoduleManager
+from git_untracked import UntrackedAnalyzer
+from git_worktrees import WorktreeManager
+from git_maintenance import MaintenanceScheduler
+from git_fetch_scheduler import BranchTracking, FetchScheduler
+from git_manager_daemon import DaemonClient
+
+# Status entries returned inline; the complete porcelain output stays available via /api/output/<id>
+STATUS_FILES_LIMIT = 5000
+
+# Batch API limits (/api/batch)
+BATCH_MAX_OPERATIONS = 10
+BATCH_MAX_WORKERS = 4
 
 # Import GitManager class din scriptul original
 import sys
@@ -20,8 +51,21 @@ sys.path.append('.')
 class GitManagerWeb:
     def __init__(self):
         self.project_path = os.getcwd()
+        # Continue in the worktree chosen during the previous session
+        if self.check_git_repo():
+            self.project_path = WorktreeManager(self.project_path).active_path() or self.project_path
+        # Warm caches from git_manager_daemon.py, used only while the daemon is running
+        self.daemon = DaemonClient()
+        # Versioned status snapshots: clients that send ?since=<version> receive only the changed files
+        self.status_versions = StatusVersions()
+        # Full output of the last truncated status, reused while its content is unchanged
+        self.status_capture = None
+        # Upstream + ahead/behind per branch, re-read only after a fetch or a ref change
+        self.branch_tracking = BranchTracking()
         
     def check_git_installation(self):
+        if self.daemon.git_info():
+            return True, "Git este instalat"
         try:
             subprocess.run(['git', '--version'], capture_output=True, check=True)
             return True, "Git este instalat"
@@ -29,30 +73,34 @@ class GitManagerWeb:
             return False, "Git nu este instalat"
     
     def check_git_repo(self):
-        return os.path.exists('.git')
+        return os.path.exists(os.path.join(self.project_path, '.git'))
+    
+    def status_pathspecs(self):
+        # With sparse-checkout enabled, status/add only look inside the cone
+        pathspecs = SparseCheckoutManager(self.project_path).pathspecs()
+        return ['--'] + pathspecs if pathspecs else []
     
     def run_git_command(self, command):
-        try:
-            result = subprocess.run(
-                command, 
-                capture_output=True, 
-                text=True, 
-                check=True,
-                cwd=self.project_path
-            )
-            return {
-                'success': True,
-                'output': result.stdout,
-                'error': None
-            }
-        except subprocess.CalledProcessError as e:
-            return {
-                'success': False,
-                'output': None,
-                'error': e.stderr if e.stderr else str(e)
-            }
+        # Shared with the CLI (git_core): {'success', 'output', 'error'}
+        return run_command(command, self.project_path)
+    
+    @property
+    def core(self):
+        # Read operations on the fastest backend measured for this repository
+        return get_core(self.project_path)
     
-    def get_status(self):
+    def cached_git_command(self, name, command, **params):
+        # Same result format as run_git_command, answered by the daemon when available
+        result = self.daemon.query(self.project_path, name, **params)
+        if result is None:
+            return self.run_git_command(command() if callable(command) else command)
+        return {'success': result['success'], 'output': result['output'], 'error': result['error']}
+    
+    def versioned_status(self, status, since=None, lite=False):
+        # The lite view lists a different set of files, so it is versioned separately
+        return self.status_versions.respond((self.project_path, lite), status, since)
+    
+    def get_status(self, lite=False):
         if not self.check_git_repo():
             return {
                 'initialized': False,
@@ -61,45 +109,104 @@ class GitManagerWeb:
                 'message': 'Repository nu este inițializat'
             }
         
-        # Get status
-        status_result = self.run_git_command(['git', 'status', '--porcelain'])
-        files = []
-        
-        if status_result['success'] and status_result['output']:
-            for line in status_result['output'].strip().split('\n'):
-                if line.strip():
-                    status = line[:2]
-                    filename = line[3:]
-                    
-                    file_status = 'unknown'
-                    icon = '📄'
-                    
-                    if status == '??':
-                        file_status = 'untracked'
-                        icon = '🆕'
-                    elif status[0] == 'M':
-                        file_status = 'modified_staged'
-                        icon = '✅'
-                    elif status[1] == 'M':
-                        file_status = 'modified'
-                        icon = '📝'
-                    elif status[0] == 'A':
-                        file_status = 'added'
-                        icon = '➕'
-                    elif status[0] == 'D':
-                        file_status = 'deleted'
-                        icon = '❌'
-                    
-                    files.append({
-                        'name': filename,
-                        'status': file_status,
-                        'icon': icon
-                    })
+        # Get status (lite: tracked files only, read in-process from .git/index)
+        entries = self.core.status_lite() if lite else None
+        capture = None
+        if entries is not None:
+            files = self.parse_status_output(''.join(f"{entry['code']} {entry['path']}\n" for entry in entries))
+        else:
+            cached = self.daemon.query(self.project_path, 'status')
+            if cached is not None:
+                files = self.parse_status_output(cached['output']) if cached['success'] else []
+            else:
+                # Huge outputs are read in chunks and spilled to disk instead of one giant string
+                capture = run_captured(['git', 'status', '--porcelain'] + self.status_pathspecs(), self.project_path)
+                files = self.parse_status_lines(capture.iter_lines()) if capture.success else iter(())
         
         # Get current branch
-        branch_result = self.run_git_command(['git', 'branch', '--show-current'])
-        current_branch = branch_result['output'].strip() if branch_result['success'] else 'main'
+        cached = self.daemon.query(self.project_path, 'branch')
+        if cached is not None:
+            current_branch = cached['output'].strip() if cached['success'] else None
+        else:
+            current_branch = self.core.current_branch()
+        if current_branch is None:
+            current_branch = 'main'
+        
+        status = self.limited_status(files, current_branch, capture)
+        if entries is not None:
+            status['lite'] = True
+            return status
         
+        # Nested repositories are inspected in parallel and reported separately
+        status.update(self.get_submodule_status())
+        
+        return status
+    
+    # Output parsing shared with the asyncio backend (git_web_async.py)
+    
+    def parse_status_output(self, output):
+        if not output:
+            return []
+        # Only trailing newlines are stripped: the first status column may be a space
+        return list(self.parse_status_lines(output.rstrip('\n').split('\n')))
+    
+    def parse_status_lines(self, lines):
+        # Incremental: lines may come straight from a CapturedOutput
+        for line in lines:
+            if line.strip():
+                status = line[:2]
+                filename = line[3:]
+                
+                file_status = 'unknown'
+                icon = '📄'
+                
+                if status == '??':
+                    file_status = 'untracked'
+                    icon = '🆕'
+                elif status[0] == 'M':
+                    file_status = 'modified_staged'
+                    icon = '✅'
+                elif status[1] == 'M':
+                    file_status = 'modified'
+                    icon = '📝'
+                elif status[0] == 'A':
+                    file_status = 'added'
+                    icon = '➕'
+                elif status[0] == 'D':
+                    file_status = 'deleted'
+                    icon = '❌'
+                
+                yield {
+                    'name': filename,
+                    'status': file_status,
+                    'icon': icon
+                }
+    
+    def limited_status(self, files, current_branch, capture=None):
+        # At most STATUS_FILES_LIMIT entries inline; a truncated status links the full output
+        files = list(itertools.islice(files, STATUS_FILES_LIMIT + 1))
+        status = self.build_status(files[:STATUS_FILES_LIMIT], current_branch)
+        if len(files) > STATUS_FILES_LIMIT:
+            status['files_truncated'] = True
+            if capture is not None:
+                capture = self.keep_status_capture(capture)
+                status['output'] = {'id': capture.id, 'size': capture.size}
+        elif capture is not None:
+            capture.close()
+        return status
+    
+    def keep_status_capture(self, capture):
+        # Auto-refresh must not spill and register a new capture while nothing changed
+        previous = self.status_capture
+        if (previous is not None and previous.size == capture.size and outputs.renew(previous.id)
+                and all(old == new for old, new in zip(previous.iter_chunks(), capture.iter_chunks()))):
+            capture.close()
+            return previous
+        outputs.add(capture)
+        self.status_capture = capture
+        return capture
+    
+    def build_status(self, files, current_branch):
         return {
             'initialized': True,
             'files': files,
@@ -107,6 +214,50 @@ class GitManagerWeb:
             'message': 'Repository inițializat' if files else 'Working tree curat'
         }
     
+    def get_submodule_status(self):
+        submodules = SubmoduleManager(self.project_path)
+        if not submodules.has_submodules():
+            return {}
+        
+        entries = submodules.status()
+        return {'submodules': entries, 'dirty_submodules': [s['path'] for s in entries if s['dirty']]}
+    
+    def parse_history_output(self, output):
+        commits = []
+        if output:
+            for line in output.strip().split('\n'):
+                commits.append(line)
+        return commits
+    
+    def branch_worktrees(self):
+        return {w['branch']: w['path'] for w in WorktreeManager(self.project_path).list_worktrees() if w['branch']}
+    
+    def parse_branches_output(self, output, worktrees):
+        branches = []
+        current = None
+        
+        for line in output.strip().split('\n'):
+            if line.strip():
+                if line.startswith('*'):
+                    branch_name = line[2:].strip()
+                    current = branch_name
+                    branches.append({'name': branch_name, 'current': True})
+                else:
+                    # '+' marks a branch checked out in another worktree
+                    branch_name = line.strip().lstrip('+').strip()
+                    branches.append({'name': branch_name, 'current': False})
+                branches[-1]['worktree'] = worktrees.get(branch_name)
+        
+        return branches, current
+    
+    def add_branch_tracking(self, branches):
+        # Divergence from the upstream, cached until the next fetch or ref change
+        tracking = self.branch_tracking.get(self.project_path) or {}
+        for branch in branches:
+            info = tracking.get(branch['name'], {})
+            branch.update({key: info.get(key) for key in ('upstream', 'ahead', 'behind', 'gone')})
+        return branches
+    
     def initialize_repo(self):
         if self.check_git_repo():
             return {'success': False, 'message': 'Repository deja inițializat'}
@@ -157,7 +308,7 @@ dist/
 build/
 """
         try:
-            with open('.gitignore', 'w', encoding='utf-8') as f:
+            with open(os.path.join(self.project_path, '.gitignore'), 'w', encoding='utf-8') as f:
                 f.write(gitignore_content)
             return True
         except:
@@ -182,10 +333,16 @@ build/
         else:
             return {'success': False, 'message': f'Eroare: {result["error"]}'}
     
-    def commit_changes(self, message):
+    def commit_changes(self, message, skip_checks=False):
         if not message.strip():
             return {'success': False, 'message': 'Mesajul nu poate fi gol'}
         
+        # Pre-commit checks on the staged content (results cached by blob oid)
+        if not skip_checks:
+            checks = PrecommitPipeline(self.project_path).run()
+            if not checks['success']:
+                return checks
+        
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
         full_message = f"{message} [{timestamp}]"
         
@@ -205,51 +362,69 @@ build/
         else:
             return {'success': False, 'message': f'Eroare: {result["error"]}'}
     
-    def get_commit_history(self, limit=10):
+    def get_commit_history(self, limit=10, skip=0, revision=None, detailed=False):
         if not self.check_git_repo():
             return {'success': False, 'commits': []}
         
-        result = self.run_git_command([
-            'git', 'log', '--oneline', '--graph', '--decorate', f'-{limit}'
-        ])
+        if detailed:
+            # Structured commits (hash, author, date, subject) from git_core, read in-process when possible
+            commits = self.core.log(limit, skip, revision)
+            return {'success': commits is not None, 'commits': commits or []}
+        
+        command = ['git', 'log', '--oneline', '--graph', '--decorate', f'-{limit}']
+        if skip:
+            command.append(f'--skip={skip}')
+        if revision:
+            command.append(revision)
+        result = self.run_git_command(command)
         
         if result['success']:
-            commits = []
-            if result['output']:
-                for line in result['output'].strip().split('\n'):
-                    commits.append(line)
-            return {'success': True, 'commits': commits}
+            return {'success': True, 'commits': self.parse_history_output(result['output'])}
         else:
             return {'success': False, 'commits': []}
     
+    def get_diff(self, filename=None, staged=False):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        command = ['git', 'diff'] + (['--cached'] if staged else []) + (['--', filename] if filename else [])
+        capture = run_captured(command, self.project_path)
+        if not capture.success:
+            capture.close()
+            return {'success': False, 'message': f'Eroare: {capture.error}'}
+        
+        # Only the head of a huge diff goes into the JSON; the rest is fetched with Range requests
+        result = {'success': True, **capture.summary()}
+        if capture.spilled:
+            outputs.add(capture)
+        else:
+            del result['id']
+        return result
+    
     def get_branches(self):
         if not self.check_git_repo():
             return {'success': False, 'branches': []}
         
-        result = self.run_git_command(['git', 'branch'])
+        result = self.cached_git_command('branches', ['git', 'branch'])
         
         if result['success']:
-            branches = []
-            current = None
-            
-            for line in result['output'].strip().split('\n'):
-                if line.strip():
-                    if line.startswith('*'):
-                        branch_name = line[2:].strip()
-                        current = branch_name
-                        branches.append({'name': branch_name, 'current': True})
-                    else:
-                        branch_name = line.strip()
-                        branches.append({'name': branch_name, 'current': False})
-            
+            branches, current = self.parse_branches_output(result['output'], self.branch_worktrees())
+            self.add_branch_tracking(branches)
             return {'success': True, 'branches': branches, 'current': current}
         else:
             return {'success': False, 'branches': []}
     
-    def create_branch(self, branch_name):
+    def create_branch(self, branch_name, worktree=False):
         if not branch_name.strip():
             return {'success': False, 'message': 'Numele branch-ului nu poate fi gol'}
         
+        if worktree:
+            # New branch in its own linked worktree: the current files stay untouched
+            result = WorktreeManager(self.project_path).create(branch_name, new_branch=True, base='HEAD')
+            if not result['success']:
+                return result
+            return self.switch_worktree(branch_name)
+        
         result = self.run_git_command(['git', 'checkout', '-b', branch_name])
         
         if result['success']:
@@ -257,7 +432,11 @@ build/
         else:
             return {'success': False, 'message': f'Eroare: {result["error"]}'}
     
-    def switch_branch(self, branch_name):
+    def switch_branch(self, branch_name, worktree=False):
+        # A branch that already has a worktree is never checked out a second time
+        if worktree or WorktreeManager(self.project_path).find(branch_name):
+            return self.switch_worktree(branch_name)
+        
         result = self.run_git_command(['git', 'checkout', branch_name])
         
         if result['success']:
@@ -265,46 +444,207 @@ build/
         else:
             return {'success': False, 'message': f'Eroare: {result["error"]}'}
     
-    def setup_remote(self, remote_url):
+    def get_worktrees(self):
+        if not self.check_git_repo():
+            return {'success': False, 'worktrees': []}
+        
+        return {'success': True, 'worktrees': WorktreeManager(self.project_path).list_worktrees(),
+                'active': self.project_path}
+    
+    def create_worktree(self, branch_name, path=None, new_branch=False):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        if not branch_name.strip():
+            return {'success': False, 'message': 'Numele branch-ului nu poate fi gol'}
+        
+        return WorktreeManager(self.project_path).create(branch_name, path or None, new_branch)
+    
+    def switch_worktree(self, branch_or_path):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        if not branch_or_path.strip():
+            return {'success': False, 'message': 'Branch-ul sau calea nu pot fi goale'}
+        
+        result = WorktreeManager(self.project_path).switch(branch_or_path.strip())
+        if result['success']:
+            # O(1) switch: the manager simply continues in the other directory
+            self.project_path = result['path']
+        return result
+    
+    def remove_worktree(self, branch_or_path, force=False):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        manager = WorktreeManager(self.project_path)
+        worktree = manager.find(branch_or_path)
+        if worktree and worktree['path'] == self.project_path:
+            return {'success': False, 'message': 'Comută pe alt worktree înainte de a-l șterge pe cel activ'}
+        return manager.remove(branch_or_path, force)
+    
+    def prune_worktrees(self):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        return WorktreeManager(self.project_path).prune()
+    
+    def setup_remote(self, remote_url, name='origin'):
         if not remote_url.strip():
             return {'success': False, 'message': 'URL-ul nu poate fi gol'}
+        if not name.strip():
+            return {'success': False, 'message': 'Numele remote-ului nu poate fi gol'}
         
-        # Check existing remotes
-        check_result = self.run_git_command(['git', 'remote', '-v'])
+        # Other remotes are kept; an existing remote with the same name gets the new URL
+        return RemoteManager(self.project_path).add_or_update(name.strip(), remote_url.strip())
+    
+    def remove_remote(self, name):
+        if not name.strip():
+            return {'success': False, 'message': 'Numele remote-ului nu poate fi gol'}
         
-        if check_result['success'] and check_result['output']:
-            # Remove existing origin
-            self.run_git_command(['git', 'remote', 'remove', 'origin'])
+        return RemoteManager(self.project_path).remove(name.strip())
+    
+    def get_remotes(self):
+        if not self.check_git_repo():
+            return {'success': False, 'remotes': []}
         
-        result = self.run_git_command(['git', 'remote', 'add', 'origin', remote_url])
+        return {'success': True, 'remotes': RemoteManager(self.project_path).list_remotes()}
+    
+    def fetch_remotes(self, remotes=None, timeout=None):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
         
-        if result['success']:
-            return {'success': True, 'message': 'Repository remote configurat'}
-        else:
-            return {'success': False, 'message': f'Eroare: {result["error"]}'}
+        return RemoteManager(self.project_path).fetch_all(remotes, timeout or 120)
     
-    def push_changes(self, first_push=False):
+    def push_changes(self, first_push=False, remotes=None, timeout=None):
         if not self.check_git_repo():
             return {'success': False, 'message': 'Repository nu este inițializat'}
         
         # Check if remote exists
-        remote_result = self.run_git_command(['git', 'remote', '-v'])
-        if not remote_result['success'] or not remote_result['output']:
+        remote_manager = RemoteManager(self.project_path)
+        remote_names = remote_manager.remote_names()
+        if not remote_names:
             return {'success': False, 'message': 'Nu este configurat repository remote'}
         
         # Get current branch
         branch_result = self.run_git_command(['git', 'branch', '--show-current'])
         current_branch = branch_result['output'].strip() if branch_result['success'] else 'main'
         
+        warnings = BloatAnalyzer(self.project_path).outgoing_warnings()
+        
+        # Multiple remotes (or an explicit selection): push to all of them in parallel
+        if remotes or len(remote_names) > 1:
+            result = remote_manager.push_all(current_branch, remotes, first_push, timeout or 120)
+            return {**result, 'warnings': warnings}
+        
         if first_push:
-            result = self.run_git_command(['git', 'push', '-u', 'origin', current_branch])
+            result = self.run_git_command(['git', 'push', '-u', upstream_remote(remote_names), current_branch])
         else:
             result = self.run_git_command(['git', 'push'])
         
         if result['success']:
-            return {'success': True, 'message': 'Modificări trimise pe server'}
+            return {'success': True, 'message': 'Modificări trimise pe server', 'warnings': warnings}
         else:
-            return {'success': False, 'message': f'Eroare: {result["error"]}'}
+            return {'success': False, 'message': f'Eroare: {result["error"]}', 'warnings': warnings}
+    
+    def run_batch(self, operations):
+        """
+        Runs several read operations in one request. They share one snapshot
+        (project path, git probe and HEAD commit) and run in parallel.
+        """
+        if not isinstance(operations, list) or not operations:
+            return {'success': False, 'message': 'Lista de operații este goală'}
+        if len(operations) > BATCH_MAX_OPERATIONS:
+            return {'success': False, 'message': f'Maxim {BATCH_MAX_OPERATIONS} operații pe cerere'}
+        
+        # Snapshot: a concurrent worktree switch cannot split the batch across two repositories
+        snapshot = copy.copy(self)
+        git_installed, git_message = snapshot.check_git_installation()
+        initialized = git_installed and snapshot.check_git_repo()
+        head = None
+        if initialized:
+            head = snapshot.core.rev_parse('HEAD')
+        
+        def run(operation):
+            if isinstance(operation, str):
+                operation = {'op': operation}
+            name = operation.get('op')
+            
+            if name == 'status':
+                status = {'git_installed': git_installed, 'git_message': git_message,
+                          'project_path': snapshot.project_path, **snapshot.get_status()}
+                return snapshot.versioned_status(status, operation.get('since'))
+            if not initialized:
+                return {'success': False, 'message': 'Repository nu este inițializat'}
+            if name == 'branches':
+                return snapshot.get_branches()
+            if name == 'history':
+                # An unborn branch has no history yet
+                if head is None:
+                    return {'success': True, 'commits': []}
+                return snapshot.get_commit_history(int(operation.get('limit', 10)), int(operation.get('skip', 0)), head)
+            if name == 'remotes':
+                return snapshot.get_remotes()
+            if name == 'worktrees':
+                return snapshot.get_worktrees()
+            return {'success': False, 'message': f'Operație necunoscută: {name}'}
+        
+        keys = [(op if isinstance(op, str) else op.get('id') or op.get('op')) for op in operations]
+        with ThreadPoolExecutor(max_workers=min(BATCH_MAX_WORKERS, len(operations))) as pool:
+            results = list(pool.map(run, operations))
+        
+        return {'success': True, 'head': head, 'results': dict(zip(keys, results))}
+    
+    def stream_operation(self, operation, options=None):
+        """Generator of NDJSON events with the live output of a long git command"""
+        options = options or {}
+        if not self.check_git_repo():
+            yield {'type': 'end', 'success': False, 'message': 'Repository nu este inițializat'}
+            return
+        
+        if operation == 'push':
+            remote_names = RemoteManager(self.project_path).remote_names()
+            if not remote_names:
+                yield {'type': 'end', 'success': False, 'message': 'Nu este configurat repository remote'}
+                return
+            
+            for warning in BloatAnalyzer(self.project_path).outgoing_warnings():
+                yield {'type': 'warning', 'text': warning}
+            
+            # Multiple remotes keep their per-remote summary from push_all
+            if options.get('remotes') or len(remote_names) > 1:
+                result = self.push_changes(options.get('first_push', False), options.get('remotes'),
+                                           options.get('timeout'))
+                yield {'type': 'end', **result, 'warnings': []}
+                return
+            
+            if options.get('first_push'):
+                branch_result = self.run_git_command(['git', 'branch', '--show-current'])
+                current_branch = branch_result['output'].strip() if branch_result['success'] else 'main'
+                command = ['git', 'push', '--progress', '-u', upstream_remote(remote_names), current_branch]
+            else:
+                command = ['git', 'push', '--progress']
+            success_message = 'Modificări trimise pe server'
+        elif operation == 'pull':
+            command = ['git', 'pull', '--progress']
+            success_message = 'Modificări descărcate și combinate'
+        elif operation == 'fetch':
+            command = ['git', 'fetch', '--all', '--prune', '--progress']
+            success_message = 'Fetch finalizat'
+        else:
+            yield {'type': 'end', 'success': False, 'message': f'Operație necunoscută: {operation}'}
+            return
+        
+        up_to_date = False
+        for event in GitStream(command, self.project_path, options.get('timeout') or 600):
+            if event['type'] == 'line' and 'Already up to date' in event['text']:
+                up_to_date = True
+            if event['type'] == 'end':
+                if not event['success']:
+                    event['message'] = f"Eroare: {event['error'] or 'cod de ieșire ' + str(event['returncode'])}"
+                elif up_to_date:
+                    event['message'] = 'Proiectul este deja la zi'
+                else:
+                    event['message'] = success_message
+            yield event
     
     def pull_changes(self):
         result = self.run_git_command(['git', 'pull'])
@@ -317,64 +657,296 @@ build/
         else:
             return {'success': False, 'message': f'Eroare: {result["error"]}'}
     
-    def quick_backup(self):
+    def quick_backup(self, skip_checks=False, snapshot=None):
         if not self.check_git_repo():
             return {'success': False, 'message': 'Repository nu este inițializat'}
         
-        # Check for changes
-        status_result = self.run_git_command(['git', 'status', '--porcelain'])
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        commit_message = f"Backup automat - {timestamp}"
+        
+        # Snapshot mode (explicit or gitmanager.backupMode=snapshot) leaves the index and the branch alone
+        if snapshot is None:
+            snapshot = SnapshotBackup(self.project_path).is_default()
+        if snapshot:
+            return self.snapshot_backup(commit_message, skip_checks)
+        
+        # Fast path: compară snapshot-ul salvat la ultimul backup, fără git status
+        detector = ChangeDetector(self.project_path)
+        changed = detector.detect()
         
-        if not status_result['success']:
-            return {'success': False, 'message': 'Nu se poate verifica status-ul'}
+        # Submodules are saved first (deepest first); the parent then records their new commits
+        submodules = SubmoduleManager(self.project_path)
+        submodule_result = None
+        if submodules.has_submodules():
+            has_remote = bool(RemoteManager(self.project_path).remote_names())
+            submodule_result = submodules.backup(commit_message, push=has_remote)
+            # The stat snapshot cannot see inside submodules: use a full status instead
+            if submodule_result['committed'] or not submodule_result['success']:
+                changed = None
         
-        if not status_result['output'] or not status_result['output'].strip():
+        if changed == []:
             return {'success': True, 'message': 'Nu există modificări de salvat'}
         
-        # Add all files
-        add_result = self.run_git_command(['git', 'add', '.'])
-        if not add_result['success']:
-            return {'success': False, 'message': f'Eroare la adăugare: {add_result["error"]}'}
+        if changed is None:
+            # Check for changes
+            pathspecs = self.status_pathspecs()
+            status_result = self.run_git_command(['git', 'status', '--porcelain'] + pathspecs)
+            
+            if not status_result['success']:
+                return {'success': False, 'message': 'Nu se poate verifica status-ul'}
+            
+            if not status_result['output'] or not status_result['output'].strip():
+                detector.refresh()
+                return {'success': True, 'message': 'Nu există modificări de salvat'}
+            
+            # Add all files
+            add_command = ['git', 'add', '-A'] + pathspecs if pathspecs else ['git', 'add', '.']
+            add_result = self.run_git_command(add_command)
+            if not add_result['success']:
+                return {'success': False, 'message': f'Eroare la adăugare: {add_result["error"]}'}
+        else:
+            # Add only the changed paths
+            added, add_error = detector.add_paths(changed)
+            if not added:
+                return {'success': False, 'message': f'Eroare la adăugare: {add_error}'}
+            
+            if not detector.has_staged_changes():
+                detector.update(changed)
+                return {'success': True, 'message': 'Nu există modificări de salvat'}
+        
+        if not skip_checks:
+            checks = PrecommitPipeline(self.project_path).run()
+            if not checks['success']:
+                checks['message'] += ' (fișierele au rămas în staging, backup-ul nu a fost făcut)'
+                return checks
         
         # Commit with timestamp
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        commit_message = f"Backup automat - {timestamp}"
-        
         commit_result = self.run_git_command(['git', 'commit', '-m', commit_message])
         if not commit_result['success']:
             return {'success': False, 'message': f'Eroare la commit: {commit_result["error"]}'}
         
-        # Try to push if remote exists
-        remote_result = self.run_git_command(['git', 'remote', '-v'])
-        if remote_result['success'] and remote_result['output']:
-            push_result = self.run_git_command(['git', 'push'])
+        if changed is None:
+            detector.refresh()
+        else:
+            detector.update(changed)
+        
+        # Write an incremental bundle if an offline target is configured
+        bundle = BundleBackup(self.project_path)
+        bundle_result = bundle.create() if bundle.target_dir else None
+        warnings = []
+        if bundle_result and not bundle_result['success']:
+            warnings.append(bundle_result['message'])
+        if submodule_result and not submodule_result['success']:
+            warnings.append(submodule_result['message'])
+        
+        # Try to push if remote exists (to every configured remote)
+        remote_manager = RemoteManager(self.project_path)
+        remote_names = remote_manager.remote_names()
+        if remote_names:
+            warnings += BloatAnalyzer(self.project_path).outgoing_warnings()
+            if len(remote_names) > 1:
+                branch_result = self.run_git_command(['git', 'branch', '--show-current'])
+                push_result = remote_manager.push_all(branch_result['output'].strip())
+            else:
+                push_result = self.run_git_command(['git', 'push'])
             if push_result['success']:
-                return {'success': True, 'message': 'Backup complet realizat (local + server)'}
+                message = 'Backup complet realizat (local + server)'
             else:
-                return {'success': True, 'message': 'Backup local realizat (eroare la push)'}
+                message = 'Backup local realizat (eroare la push)'
+                warnings.append(push_result.get('message') or push_result.get('error'))
+        elif bundle_result and bundle_result['success']:
+            message = 'Backup local realizat (commit + bundle)'
         else:
-            return {'success': True, 'message': 'Backup local realizat'}
+            message = 'Backup local realizat'
+        
+        return {'success': True, 'message': message, 'warnings': warnings, 'bundle': bundle_result,
+                'submodules': submodule_result}
+    
+    def snapshot_backup(self, message, skip_checks=False):
+        backup = SnapshotBackup(self.project_path)
+        check = None if skip_checks else (lambda env: PrecommitPipeline(self.project_path, env=env).run())
+        result = backup.create(message, check=check)
+        if not result['success'] or not result.get('committed'):
+            return result
+        
+        warnings = []
+        message = f"Snapshot local realizat ({result['ref']})"
+        if RemoteManager(self.project_path).remote_names():
+            push_result = backup.push(result['ref'])
+            if push_result['success']:
+                message = f"Snapshot realizat (local + server, {result['ref']})"
+            else:
+                warnings.append(push_result['message'])
+        return {'success': True, 'message': message, 'warnings': warnings, 'snapshot': result}
+    
+    def list_snapshots(self):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        return {'success': True, 'backups': SnapshotBackup(self.project_path).list_backups()}
+    
+    def sync_analytics(self):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        return RepoAnalytics(self.project_path).sync()
+    
+    def get_analytics(self, report, limit=20, path=None):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        analytics = RepoAnalytics(self.project_path)
+        
+        if report == 'churn':
+            data = analytics.top_churned_paths(limit)
+        elif report == 'authors':
+            data = analytics.commits_per_author_week(limit)
+        elif report == 'growth':
+            data = analytics.file_size_growth(path)
+        elif report == 'summary':
+            data = analytics.summary()
+        else:
+            return {'success': False, 'message': f'Raport necunoscut: {report}'}
+        
+        return {'success': True, 'report': report, 'data': data}
+    
+    def analyze_bloat(self, limit=20, with_commits=True):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        report = BloatAnalyzer(self.project_path).analyze(limit, with_commits)
+        return {'success': True, **report}
+    
+    def analyze_untracked(self):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        return UntrackedAnalyzer(self.project_path).analyze()
+    
+    def apply_ignore_rules(self, rules):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        return UntrackedAnalyzer(self.project_path).apply(rules or [])
+    
+    def get_sparse_info(self):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        return SparseCheckoutManager(self.project_path).get_info()
+    
+    def update_sparse(self, action, directories=None):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        sparse = SparseCheckoutManager(self.project_path)
+        directories = directories or []
+        
+        if action == 'enable':
+            return sparse.convert(directories)
+        elif action == 'add':
+            return sparse.add(directories)
+        elif action == 'remove':
+            return sparse.remove(directories)
+        elif action == 'disable':
+            return sparse.disable()
+        return {'success': False, 'message': f'Acțiune necunoscută: {action}'}
+    
+    def clone_sparse(self, url, destination, directories=None, switch=True):
+        if not url.strip() or not destination.strip():
+            return {'success': False, 'message': 'URL-ul și destinația sunt obligatorii'}
+        
+        result = SparseCheckoutManager(self.project_path).clone(url.strip(), destination.strip(), directories)
+        if result['success'] and switch:
+            # The manager continues on the freshly cloned repository
+            self.project_path = result['destination']
+        return result
+    
+    def get_bundles(self):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        return BundleBackup(self.project_path).summary()
+    
+    def set_bundle_target(self, target_dir):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        if not target_dir.strip():
+            return {'success': False, 'message': 'Directorul nu poate fi gol'}
+        
+        return BundleBackup(self.project_path).set_target(target_dir)
+    
+    def create_bundle(self):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        return BundleBackup(self.project_path).create()
+    
+    def verify_bundles(self):
+        if not self.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+        
+        return BundleBackup(self.project_path).verify()
+    
+    def restore_bundles(self, destination, upto=None):
+        if not destination.strip():
+            return {'success': False, 'message': 'Destinația nu poate fi goală'}
+        
+        return BundleBackup(self.project_path).restore(destination, upto)
 
 # Flask App
 app = Flask(__name__)
 app.secret_key = secrets.token_hex(16)
 
 git_manager = GitManagerWeb()
+maintenance = MaintenanceScheduler(lambda: git_manager.project_path)
+fetch_scheduler = FetchScheduler(lambda: git_manager.project_path, git_manager.branch_tracking)
+
+# Minified, content-hashed static files (static/dist), rebuilt when the sources change
+assets = AssetPipeline(app.static_folder)
+
+@app.context_processor
+def inject_assets():
+    return assets.template_context()
+
+@app.before_request
+def track_request_start():
+    maintenance.request_started(write=request.method != 'GET')
+
+@app.teardown_request
+def track_request_end(exc=None):
+    maintenance.request_finished(write=request.method != 'GET')
+    # Writes may touch only the working tree, which the daemon cannot fingerprint
+    if request.method != 'GET' and request.endpoint != 'api_batch':
+        git_manager.daemon.invalidate(git_manager.project_path)
 
 @app.route('/')
 def index():
     return render_template('index.html')
 
+@app.route('/static/dist/<filename>')
+def static_dist(filename):
+    # Precompressed variant when the browser accepts it; the name changes with the content
+    found = assets.lookup(filename, request.headers.get('Accept-Encoding', ''))
+    if found is None:
+        return Response(status=404)
+    path, mimetype, headers = found
+    response = send_file(path, mimetype=mimetype, conditional=True)
+    response.headers.update(headers)
+    return response
+
 @app.route('/api/status')
 def api_status():
     git_installed, git_message = git_manager.check_git_installation()
-    status = git_manager.get_status()
+    lite = request.args.get('lite') == '1'
+    status = git_manager.get_status(lite=lite)
     
-    return jsonify({
+    return jsonify(git_manager.versioned_status({
         'git_installed': git_installed,
         'git_message': git_message,
         'project_path': git_manager.project_path,
         **status
-    })
+    }, request.args.get('since', type=int), lite))
 
 @app.route('/api/init', methods=['POST'])
 def api_init():
@@ -392,15 +964,50 @@ def api_add():
 def api_commit():
     data = request.get_json()
     message = data.get('message', '')
-    result = git_manager.commit_changes(message)
+    result = git_manager.commit_changes(message, data.get('skip_checks', False))
+    return jsonify(result)
+
+@app.route('/api/batch', methods=['POST'])
+def api_batch():
+    data = request.get_json(silent=True) or {}
+    result = git_manager.run_batch(data.get('operations'))
     return jsonify(result)
 
 @app.route('/api/history')
 def api_history():
     limit = request.args.get('limit', 10, type=int)
-    result = git_manager.get_commit_history(limit)
+    skip = request.args.get('skip', 0, type=int)
+    detailed = request.args.get('format') == 'json'
+    result = git_manager.get_commit_history(limit, skip, detailed=detailed)
+    return jsonify(result)
+
+@app.route('/api/diff')
+def api_diff():
+    result = git_manager.get_diff(request.args.get('file'), request.args.get('staged') == '1')
     return jsonify(result)
 
+@app.route('/api/output/<output_id>')
+def api_output(output_id):
+    capture = outputs.get(output_id)
+    if capture is None:
+        return jsonify({'success': False, 'message': 'Output-ul a expirat sau nu există'}), 404
+    
+    # Byte ranges of the full output, read from the spill file chunk by chunk
+    byte_range = request.range.range_for_length(capture.size) if request.range else None
+    if request.range and byte_range is None:
+        return Response(status=416, headers={'Content-Range': f'bytes */{capture.size}'})
+    start, end = byte_range or (0, capture.size)
+    
+    def generate():
+        for position in range(start, end, CHUNK_SIZE):
+            yield capture.read_range(position, min(position + CHUNK_SIZE, end))
+    
+    response = Response(generate(), status=206 if byte_range else 200, mimetype='text/plain',
+                        headers={'Accept-Ranges': 'bytes', 'Content-Length': str(end - start)})
+    if byte_range:
+        response.headers['Content-Range'] = f'bytes {start}-{end - 1}/{capture.size}'
+    return response
+
 @app.route('/api/branches')
 def api_branches():
     result = git_manager.get_branches()
@@ -410,30 +1017,90 @@ def api_branches():
 def api_create_branch():
     data = request.get_json()
     branch_name = data.get('name', '')
-    result = git_manager.create_branch(branch_name)
+    result = git_manager.create_branch(branch_name, data.get('worktree', False))
     return jsonify(result)
 
 @app.route('/api/branch/switch', methods=['POST'])
 def api_switch_branch():
     data = request.get_json()
     branch_name = data.get('name', '')
-    result = git_manager.switch_branch(branch_name)
+    result = git_manager.switch_branch(branch_name, data.get('worktree', False))
+    return jsonify(result)
+
+@app.route('/api/worktrees')
+def api_worktrees():
+    result = git_manager.get_worktrees()
+    return jsonify(result)
+
+@app.route('/api/worktrees/create', methods=['POST'])
+def api_worktrees_create():
+    data = request.get_json()
+    result = git_manager.create_worktree(data.get('branch', ''), data.get('path'), data.get('new_branch', False))
+    return jsonify(result)
+
+@app.route('/api/worktrees/switch', methods=['POST'])
+def api_worktrees_switch():
+    data = request.get_json()
+    result = git_manager.switch_worktree(data.get('target', ''))
+    return jsonify(result)
+
+@app.route('/api/worktrees/remove', methods=['POST'])
+def api_worktrees_remove():
+    data = request.get_json()
+    result = git_manager.remove_worktree(data.get('target', ''), data.get('force', False))
+    return jsonify(result)
+
+@app.route('/api/worktrees/prune', methods=['POST'])
+def api_worktrees_prune():
+    result = git_manager.prune_worktrees()
     return jsonify(result)
 
 @app.route('/api/remote/setup', methods=['POST'])
 def api_setup_remote():
     data = request.get_json()
     remote_url = data.get('url', '')
-    result = git_manager.setup_remote(remote_url)
+    name = data.get('name', 'origin')
+    result = git_manager.setup_remote(remote_url, name)
+    return jsonify(result)
+
+@app.route('/api/remote/remove', methods=['POST'])
+def api_remove_remote():
+    data = request.get_json()
+    name = data.get('name', '')
+    result = git_manager.remove_remote(name)
+    return jsonify(result)
+
+@app.route('/api/remotes')
+def api_remotes():
+    result = git_manager.get_remotes()
+    return jsonify(result)
+
+@app.route('/api/fetch', methods=['POST'])
+def api_fetch():
+    data = request.get_json(silent=True) or {}
+    result = git_manager.fetch_remotes(data.get('remotes'), data.get('timeout'))
     return jsonify(result)
 
 @app.route('/api/push', methods=['POST'])
 def api_push():
     data = request.get_json()
     first_push = data.get('first_push', False)
-    result = git_manager.push_changes(first_push)
+    result = git_manager.push_changes(first_push, data.get('remotes'), data.get('timeout'))
     return jsonify(result)
 
+@app.route('/api/stream/<operation>', methods=['POST'])
+def api_stream(operation):
+    data = request.get_json(silent=True) or {}
+    events = git_manager.stream_operation(operation, data)
+    
+    def generate():
+        for event in events:
+            yield json.dumps(event, ensure_ascii=False) + '\n'
+    
+    # Chunked NDJSON: one event per line, flushed as soon as git prints it
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/api/pull', methods=['POST'])
 def api_pull():
     result = git_manager.pull_changes()
@@ -441,7 +1108,132 @@ def api_pull():
 
 @app.route('/api/backup', methods=['POST'])
 def api_backup():
-    result = git_manager.quick_backup()
+    data = request.get_json(silent=True) or {}
+    result = git_manager.quick_backup(data.get('skip_checks', False), data.get('snapshot'))
+    return jsonify(result)
+
+@app.route('/api/backups')
+def api_backups():
+    result = git_manager.list_snapshots()
+    return jsonify(result)
+
+@app.route('/api/analytics/sync', methods=['POST'])
+def api_analytics_sync():
+    result = git_manager.sync_analytics()
+    return jsonify(result)
+
+@app.route('/api/analytics/churn')
+def api_analytics_churn():
+    limit = request.args.get('limit', 20, type=int)
+    result = git_manager.get_analytics('churn', limit=limit)
+    return jsonify(result)
+
+@app.route('/api/analytics/authors')
+def api_analytics_authors():
+    weeks = request.args.get('weeks', 12, type=int)
+    result = git_manager.get_analytics('authors', limit=weeks)
+    return jsonify(result)
+
+@app.route('/api/analytics/growth')
+def api_analytics_growth():
+    path = request.args.get('path')
+    result = git_manager.get_analytics('growth', path=path)
+    return jsonify(result)
+
+@app.route('/api/analytics/summary')
+def api_analytics_summary():
+    result = git_manager.get_analytics('summary')
+    return jsonify(result)
+
+@app.route('/api/bloat')
+def api_bloat():
+    limit = request.args.get('limit', 20, type=int)
+    with_commits = request.args.get('commits', '1') != '0'
+    result = git_manager.analyze_bloat(limit, with_commits)
+    return jsonify(result)
+
+@app.route('/api/untracked')
+def api_untracked():
+    result = git_manager.analyze_untracked()
+    return jsonify(result)
+
+@app.route('/api/untracked/apply', methods=['POST'])
+def api_untracked_apply():
+    data = request.get_json(silent=True) or {}
+    result = git_manager.apply_ignore_rules(data.get('rules'))
+    return jsonify(result)
+
+@app.route('/api/metrics')
+def api_metrics():
+    # Git process governor: active/queued processes, queue wait times, timeouts
+    return jsonify({'success': True, 'governor': governor.get_metrics()})
+
+@app.route('/api/maintenance')
+def api_maintenance():
+    result = maintenance.get_status()
+    return jsonify(result)
+
+@app.route('/api/fetch/schedule')
+def api_fetch_schedule():
+    result = fetch_scheduler.get_status()
+    return jsonify(result)
+
+@app.route('/api/maintenance/run', methods=['POST'])
+def api_maintenance_run():
+    data = request.get_json(silent=True) or {}
+    result = maintenance.run_in_background(force=data.get('force', False))
+    return jsonify(result)
+
+@app.route('/api/sparse')
+def api_sparse():
+    result = git_manager.get_sparse_info()
+    return jsonify(result)
+
+@app.route('/api/sparse/<action>', methods=['POST'])
+def api_sparse_update(action):
+    data = request.get_json(silent=True) or {}
+    result = git_manager.update_sparse(action, data.get('directories'))
+    return jsonify(result)
+
+@app.route('/api/clone', methods=['POST'])
+def api_clone():
+    data = request.get_json()
+    result = git_manager.clone_sparse(
+        data.get('url', ''),
+        data.get('destination', ''),
+        data.get('directories'),
+        data.get('switch', True)
+    )
+    return jsonify(result)
+
+@app.route('/api/bundles')
+def api_bundles():
+    result = git_manager.get_bundles()
+    return jsonify(result)
+
+@app.route('/api/bundles/target', methods=['POST'])
+def api_bundles_target():
+    data = request.get_json()
+    target_dir = data.get('path', '')
+    result = git_manager.set_bundle_target(target_dir)
+    return jsonify(result)
+
+@app.route('/api/bundles/create', methods=['POST'])
+def api_bundles_create():
+    result = git_manager.create_bundle()
+    return jsonify(result)
+
+@app.route('/api/bundles/verify', methods=['POST'])
+def api_bundles_verify():
+    result = git_manager.verify_bundles()
+    return jsonify(result)
+
+@app.route('/api/bundles/restore', methods=['POST'])
+def api_bundles_restore():
+    data = request.get_json()
+    destination = data.get('destination', '')
+    upto = data.get('upto')
+    result = git_manager.restore_bundles(destination, upto)
     return jsonify(result)
 
 if __name__ == '__main__':
@@ -453,4 +1245,9 @@ if __name__ == '__main__':
     print("🌐 Accesează: http://localhost:5000")
     print("🛑 Pentru oprire: Ctrl+C")
     
+    # Cu reloader-ul activ, doar procesul copil (cel care servește cererile) rulează mentenanța
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        maintenance.start()
+        fetch_scheduler.start()
+    
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager Web App - Variantă asyncio (ASGI)
+Aceeași interfață și același API JSON ca git_web_app.py, dar comenzile git
+sunt rulate cu asyncio.create_subprocess_exec: sute de cereri concurente
+(status, istoric, push) așteaptă procesele pe un singur event loop, fiecare
+cu timeout propriu, iar procesele sunt oprite dacă cererea este anulată.
+Procesele ocupă locuri în coada guvernatorului (git_governor), ca cele
+pornite din thread-uri, deci limitele globale și per repository rămân comune.
+
+Pornire: pip install quart hypercorn && python git_web_async.py
+"""
+
+import asyncio
+import contextlib
+import functools
+import json
+import os
+import signal
+import socket
+import sys
+import time
+
+try:
+    from quart import Quart, render_template, request, jsonify, Response, send_file
+except ImportError:
+    Quart = None
+
+from git_bloat import BloatAnalyzer
+from git_governor import NON_INTERACTIVE_ENV, TIMEOUTS, classify, governor
+from git_manager_daemon import MAX_RESPONSE_BYTES
+from git_output import CHUNK_SIZE, STDERR_LIMIT, CapturedOutput, outputs
+from git_submodules import SubmoduleManager
+from git_remotes import RemoteManager, upstream_remote
+from git_web_app import app as flask_app, assets, fetch_scheduler, git_manager, maintenance
+
+
+class AsyncGitManager:
+    """Operațiile frecvente din GitManagerWeb, rulate fără a bloca un thread per cerere"""
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.env = dict(os.environ)
+        for key, value in NON_INTERACTIVE_ENV.items():
+            self.env.setdefault(key, value)
+
+    @property
+    def project_path(self):
+        # Același project_path ca varianta sincronă (worktree-ul activ, clone noi)
+        return self.manager.project_path
+
+    async def in_thread(self, function, *args, **kwargs):
+        """Pentru operațiile rare sau compuse, reutilizează implementarea sincronă"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(function, *args, **kwargs))
+
+    def _kill(self, process):
+        if process.returncode is not None:
+            return
+        try:
+            if os.name == 'posix':
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    @contextlib.asynccontextmanager
+    async def governed(self, operation):
+        """
+        Un loc în coada guvernatorului pentru un proces pornit de pe event loop;
+        produce timpul de așteptare (ms) sau None dacă locul nu a fost obținut.
+        """
+        cwd = self.project_path
+        # Așteptarea la coadă blochează, deci ocupă un thread doar cât stă la coadă
+        acquiring = asyncio.ensure_future(self.in_thread(governor.acquire, cwd, operation))
+        try:
+            waited = await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # Locul obținut după anularea cererii este eliberat imediat
+            acquiring.add_done_callback(lambda future: future.result() is not None and governor.release(cwd))
+            raise
+        try:
+            yield waited
+        finally:
+            if waited is not None:
+                governor.release(cwd)
+
+    async def run_git_command(self, command, timeout=None):
+        """Echivalentul async al GitManagerWeb.run_git_command (același format de rezultat)"""
+        operation = classify(command)
+        timeout = timeout or governor.timeouts[operation]
+
+        async with self.governed(operation) as waited:
+            if waited is None:
+                return {'success': False, 'output': None, 'error': 'Prea multe procese git în așteptare'}
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self.project_path,
+                    env=self.env,
+                    start_new_session=(os.name == 'posix')
+                )
+            except OSError as e:
+                return {'success': False, 'output': None, 'error': str(e)}
+
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                governor.record_timeout(operation)
+                self._kill(process)
+                await process.wait()
+                return {'success': False, 'output': None, 'error': f'Timeout după {timeout}s'}
+            except asyncio.CancelledError:
+                # Clientul a renunțat la cerere: procesul (și copiii lui) nu mai sunt necesari
+                self._kill(process)
+                await process.wait()
+                raise
+
+        if process.returncode != 0:
+            error = stderr.decode('utf-8', errors='replace')
+            return {'success': False, 'output': None, 'error': error or f'Cod de ieșire {process.returncode}'}
+        return {'success': True, 'output': stdout.decode('utf-8', errors='replace'), 'error': None}
+
+    async def run_captured(self, command, timeout=None):
+        """Echivalentul async al git_output.run_captured: stdout citit în bucăți într-un CapturedOutput"""
+        operation = classify(command)
+        timeout = timeout or governor.timeouts[operation]
+        output = CapturedOutput()
+
+        async with self.governed(operation) as waited:
+            if waited is None:
+                output.returncode, output.error = -1, 'Prea multe procese git în așteptare'
+                return output
+            start = time.perf_counter()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=self.project_path,
+                    env=self.env,
+                    start_new_session=(os.name == 'posix')
+                )
+            except OSError as e:
+                output.returncode, output.error = -1, str(e)
+                return output
+
+            async def read_stdout():
+                while True:
+                    chunk = await process.stdout.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    output.write(chunk)
+
+            try:
+                # stderr este citit în paralel: un pipe plin ar bloca procesul
+                _, stderr = await asyncio.wait_for(
+                    asyncio.gather(read_stdout(), process.stderr.read()), timeout)
+                output.returncode = await process.wait()
+            except asyncio.TimeoutError:
+                output.timed_out = True
+                governor.record_timeout(operation)
+                self._kill(process)
+                await process.wait()
+            except asyncio.CancelledError:
+                self._kill(process)
+                await process.wait()
+                output.close()
+                raise
+
+        output.finish()
+        output.duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        if output.timed_out:
+            output.error = f'Timeout după {timeout}s'
+        elif output.returncode != 0:
+            output.error = stderr[:STDERR_LIMIT].decode('utf-8', errors='replace') or f'Cod de ieșire {output.returncode}'
+        return output
+
+    async def daemon_query(self, name, **params):
+        """DaemonClient.query pe event loop (None dacă daemon-ul nu rulează)"""
+        client = self.manager.daemon
+        if not hasattr(socket, 'AF_UNIX') or not os.path.exists(client.socket_path):
+            return None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(client.socket_path, limit=MAX_RESPONSE_BYTES), client.timeout)
+            try:
+                writer.write(json.dumps(client.query_request(self.project_path, name, **params)).encode('utf-8') + b'\n')
+                await writer.drain()
+                response = json.loads(await asyncio.wait_for(reader.readline(), client.timeout))
+            finally:
+                writer.close()
+        except (OSError, ValueError, asyncio.TimeoutError):
+            return None
+        return response['result'] if response.get('ok') else None
+
+    async def check_git_installation(self):
+        result = await self.run_git_command(['git', '--version'])
+        return (True, "Git este instalat") if result['success'] else (False, "Git nu este instalat")
+
+    async def get_status(self, lite=False):
+        if lite or not self.manager.check_git_repo():
+            # Varianta lite citește .git/index în proces (fără git), deci rulează într-un thread
+            return await self.in_thread(self.manager.get_status, lite)
+
+        # Același răspuns ca varianta Flask: cache-ul daemon-ului, STATUS_FILES_LIMIT, output-ul complet pe disc
+        cached_status, cached_branch = await asyncio.gather(self.daemon_query('status'), self.daemon_query('branch'))
+        capture = branch_result = None
+        if cached_status is not None:
+            files = self.manager.parse_status_output(cached_status['output']) if cached_status['success'] else []
+            if cached_branch is None:
+                branch_result = await self.run_git_command(['git', 'branch', '--show-current'])
+        else:
+            pathspecs = self.manager.status_pathspecs()
+            capture, branch_result = await asyncio.gather(
+                self.run_captured(['git', 'status', '--porcelain'] + pathspecs),
+                self.run_git_command(['git', 'branch', '--show-current']) if cached_branch is None
+                else asyncio.sleep(0)
+            )
+            files = self.manager.parse_status_lines(capture.iter_lines()) if capture.success else iter(())
+
+        if cached_branch is not None:
+            current_branch = cached_branch['output'].strip() if cached_branch['success'] else None
+        else:
+            current_branch = branch_result['output'].strip() if branch_result['success'] else None
+
+        # Ca în varianta Flask: '' = HEAD detașat, 'main' doar dacă branch-ul nu poate fi citit
+        status = self.manager.limited_status(files, 'main' if current_branch is None else current_branch, capture)
+        if SubmoduleManager(self.project_path).has_submodules():
+            status.update(await self.in_thread(self.manager.get_submodule_status))
+        return status
+
+    async def get_commit_history(self, limit=10, skip=0):
+        if not self.manager.check_git_repo():
+            return {'success': False, 'commits': []}
+
+        command = ['git', 'log', '--oneline', '--graph', '--decorate', f'-{limit}']
+        if skip:
+            command.append(f'--skip={skip}')
+        result = await self.run_git_command(command)
+        if result['success']:
+            return {'success': True, 'commits': self.manager.parse_history_output(result['output'])}
+        return {'success': False, 'commits': []}
+
+    async def get_branches(self):
+        if not self.manager.check_git_repo():
+            return {'success': False, 'branches': []}
+
+        result, worktrees = await asyncio.gather(
+            self.run_git_command(['git', 'branch']),
+            self.in_thread(self.manager.branch_worktrees)
+        )
+        if result['success']:
+            branches, current = self.manager.parse_branches_output(result['output'], worktrees)
+            await self.in_thread(self.manager.add_branch_tracking, branches)
+            return {'success': True, 'branches': branches, 'current': current}
+        return {'success': False, 'branches': []}
+
+    async def pull_changes(self):
+        result = await self.run_git_command(['git', 'pull'], TIMEOUTS['network'])
+
+        if result['success']:
+            if "Already up to date" in result['output']:
+                return {'success': True, 'message': 'Proiectul este deja la zi'}
+            return {'success': True, 'message': 'Modificări descărcate și combinate'}
+        return {'success': False, 'message': f'Eroare: {result["error"]}'}
+
+    async def push_changes(self, first_push=False, remotes=None, timeout=None):
+        if not self.manager.check_git_repo():
+            return {'success': False, 'message': 'Repository nu este inițializat'}
+
+        remote_names = await self.in_thread(RemoteManager(self.project_path).remote_names)
+        # Mai multe remote-uri: implementarea sincronă le tratează deja în paralel
+        if remotes or len(remote_names) > 1:
+            return await self.in_thread(self.manager.push_changes, first_push, remotes, timeout)
+        if not remote_names:
+            return {'success': False, 'message': 'Nu este configurat repository remote'}
+
+        branch_result, warnings = await asyncio.gather(
+            self.run_git_command(['git', 'branch', '--show-current']),
+            self.in_thread(BloatAnalyzer(self.project_path).outgoing_warnings)
+        )
+        current_branch = branch_result['output'].strip() if branch_result['success'] else 'main'
+
+        command = ['git', 'push', '-u', upstream_remote(remote_names), current_branch] if first_push else ['git', 'push']
+        result = await self.run_git_command(command, timeout or TIMEOUTS['network'])
+
+        if result['success']:
+            return {'success': True, 'message': 'Modificări trimise pe server', 'warnings': warnings}
+        return {'success': False, 'message': f'Eroare: {result["error"]}', 'warnings': warnings}
+
+
+def dispatch_to_flask(method, path, query_string, data, content_type):
+    """Rulează ruta Flask corespunzătoare (într-un thread) pentru endpoint-urile fără variantă async"""
+    with flask_app.test_request_context(path, method=method, query_string=query_string,
+                                        data=data, content_type=content_type):
+        response = flask_app.full_dispatch_request()
+        return response.get_data(), response.status_code, response.headers.get('Content-Type')
+
+
+def create_app():
+    if Quart is None:
+        raise RuntimeError('Varianta async necesită: pip install quart hypercorn')
+
+    app = Quart(__name__)
+    backend = AsyncGitManager(git_manager)
+
+    @app.before_request
+    async def track_request_start():
+        # Rutele delegate către Flask sunt numărate de hook-urile Flask
+        if request.endpoint != 'api_fallback':
+            maintenance.request_started(write=request.method != 'GET')
+
+    @app.teardown_request
+    async def track_request_end(exc=None):
+        if request.endpoint != 'api_fallback':
+            maintenance.request_finished(write=request.method != 'GET')
+
+    @app.context_processor
+    async def inject_assets():
+        return assets.template_context()
+
+    @app.route('/')
+    async def index():
+        return await render_template('index.html')
+
+    @app.route('/static/dist/<filename>')
+    async def static_dist(filename):
+        found = assets.lookup(filename, request.headers.get('Accept-Encoding', ''))
+        if found is None:
+            return Response('', status=404)
+        path, mimetype, headers = found
+        response = await send_file(path, mimetype=mimetype, conditional=True)
+        response.headers.update(headers)
+        return response
+
+    @app.route('/api/status')
+    async def api_status():
+        lite = request.args.get('lite') == '1'
+        (git_installed, git_message), status = await asyncio.gather(
+            backend.check_git_installation(),
+            backend.get_status(lite)
+        )
+        return jsonify(git_manager.versioned_status({
+            'git_installed': git_installed,
+            'git_message': git_message,
+            'project_path': backend.project_path,
+            **status
+        }, request.args.get('since', type=int), lite))
+
+    @app.route('/api/history')
+    async def api_history():
+        limit = request.args.get('limit', 10, type=int)
+        skip = request.args.get('skip', 0, type=int)
+        if request.args.get('format') == 'json':
+            return jsonify(await backend.in_thread(git_manager.get_commit_history, limit, skip, detailed=True))
+        return jsonify(await backend.get_commit_history(limit, skip))
+
+    @app.route('/api/branches')
+    async def api_branches():
+        return jsonify(await backend.get_branches())
+
+    @app.route('/api/pull', methods=['POST'])
+    async def api_pull():
+        return jsonify(await backend.pull_changes())
+
+    @app.route('/api/push', methods=['POST'])
+    async def api_push():
+        data = await request.get_json()
+        first_push = data.get('first_push', False)
+        return jsonify(await backend.push_changes(first_push, data.get('remotes'), data.get('timeout')))
+
+    @app.route('/api/stream/<operation>', methods=['POST'])
+    async def api_stream(operation):
+        data = await request.get_json(silent=True) or {}
+        events = git_manager.stream_operation(operation, data)
+
+        async def generate():
+            finished = object()
+            try:
+                while True:
+                    # Citirea blochează până la următoarea linie, deci rulează într-un thread
+                    event = await backend.in_thread(next, events, finished)
+                    if event is finished:
+                        break
+                    yield (json.dumps(event, ensure_ascii=False) + '\n').encode('utf-8')
+            finally:
+                await backend.in_thread(events.close)
+
+        return generate(), 200, {'Content-Type': 'application/x-ndjson', 'Cache-Control': 'no-cache'}
+
+    @app.route('/api/output/<output_id>')
+    async def api_output(output_id):
+        capture = outputs.get(output_id)
+        if capture is None:
+            return jsonify({'success': False, 'message': 'Output-ul a expirat sau nu există'}), 404
+
+        # Output-ul complet este citit din fișierul de pe disc în bucăți, fără a fi ținut în memorie
+        byte_range = request.range.range_for_length(capture.size) if request.range else None
+        if request.range and byte_range is None:
+            return Response('', status=416, headers={'Content-Range': f'bytes */{capture.size}'})
+        start, end = byte_range or (0, capture.size)
+
+        async def generate():
+            for position in range(start, end, CHUNK_SIZE):
+                yield await backend.in_thread(capture.read_range, position, min(position + CHUNK_SIZE, end))
+
+        headers = {'Content-Type': 'text/plain; charset=utf-8', 'Accept-Ranges': 'bytes',
+                   'Content-Length': str(end - start)}
+        if byte_range:
+            headers['Content-Range'] = f'bytes {start}-{end - 1}/{capture.size}'
+        return generate(), 206 if byte_range else 200, headers
+
+    @app.route('/api/<path:endpoint>', methods=['GET', 'POST'])
+    async def api_fallback(endpoint):
+        body, status_code, content_type = await backend.in_thread(
+            dispatch_to_flask,
+            request.method,
+            request.path,
+            request.query_string.decode('latin-1'),
+            await request.get_data(),
+            request.content_type
+        )
+        return Response(body, status=status_code, content_type=content_type)
+
+    return app
+
+
+app = create_app() if Quart is not None else None
+
+if __name__ == '__main__':
+    if Quart is None:
+        print("❌ Varianta async necesită: pip install quart hypercorn")
+        sys.exit(1)
+
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    config = Config()
+    config.bind = ['0.0.0.0:5000']
+
+    print("🚀 Git Manager Web App (asyncio) pornește...")
+    print("🌐 Accesează: http://localhost:5000")
+    print("🛑 Pentru oprire: Ctrl+C")
+
+    maintenance.start()
+    fetch_scheduler.start()
+    asyncio.run(serve(app, config))
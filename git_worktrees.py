@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Git Manager - Worktree-uri pentru comutarea rapidă între branch-uri
+Fiecare branch poate avea propriul director de lucru (git worktree), care
+împarte același istoric cu repository-ul principal. Comutarea înseamnă doar
+schimbarea directorului activ al managerului: niciun fișier nu este rescris,
+iar cache-urile de build ale fiecărui branch rămân valide.
+"""
+
+import json
+import os
+import re
+
+from git_governor import run_process
+from git_state import state_dir
+
+CONFIG_KEY = 'gitmanager.worktreeDir'
+STATE_FILE = 'worktrees.json'
+
+
+def branch_directory_name(branch):
+    """Nume de director sigur pentru un branch (feature/login -> feature-login)"""
+    return re.sub(r'[^A-Za-z0-9._-]+', '-', branch).strip('-.') or 'worktree'
+
+
+class WorktreeManager:
+    """Worktree-urile legate de un repository și worktree-ul activ al managerului"""
+
+    def __init__(self, project_path):
+        self.project_path = os.path.abspath(project_path)
+
+    def _git(self, args):
+        return run_process(['git'] + args, self.project_path)
+
+    # --- Listare ---
+
+    def list_worktrees(self):
+        """Parsează 'git worktree list --porcelain' (primul element este worktree-ul principal)"""
+        result = self._git(['worktree', 'list', '--porcelain'])
+        if result.returncode != 0:
+            return []
+
+        worktrees = []
+        current = None
+        for line in result.stdout.split('\n'):
+            if line.startswith('worktree '):
+                current = {'path': os.path.normpath(line[len('worktree '):]), 'head': None, 'branch': None,
+                           'detached': False, 'bare': False, 'locked': False, 'prunable': False}
+                worktrees.append(current)
+            elif current is None or not line:
+                continue
+            elif line.startswith('HEAD '):
+                current['head'] = line[len('HEAD '):][:7]
+            elif line.startswith('branch '):
+                current['branch'] = line[len('branch '):].replace('refs/heads/', '', 1)
+            elif line == 'detached':
+                current['detached'] = True
+            elif line == 'bare':
+                current['bare'] = True
+            elif line.startswith('locked'):
+                current['locked'] = True
+            elif line.startswith('prunable'):
+                current['prunable'] = True
+
+        for index, worktree in enumerate(worktrees):
+            worktree['main'] = index == 0
+            worktree['current'] = worktree['path'] == self.project_path
+        return worktrees
+
+    def find(self, branch_or_path):
+        """Worktree-ul în care este activ un branch (sau cel cu calea dată)"""
+        target = os.path.normpath(os.path.abspath(os.path.expanduser(branch_or_path)))
+        for worktree in self.list_worktrees():
+            if worktree['branch'] == branch_or_path or worktree['path'] == target:
+                return worktree
+        return None
+
+    def main_path(self):
+        worktrees = self.list_worktrees()
+        return worktrees[0]['path'] if worktrees else self.project_path
+
+    def default_path(self, branch):
+        """<director configurat>/<branch>, implicit lângă repository: <proiect>.worktrees/<branch>"""
+        result = self._git(['config', '--get', CONFIG_KEY])
+        base = result.stdout.strip() if result.returncode == 0 else ''
+        if not base:
+            main_path = self.main_path()
+            base = os.path.join(os.path.dirname(main_path), os.path.basename(main_path) + '.worktrees')
+        return os.path.join(os.path.expanduser(base), branch_directory_name(branch))
+
+    # --- Creare / ștergere ---
+
+    def create(self, branch, path=None, new_branch=False, base=None):
+        """
+        Creează un worktree pentru branch. Dacă branch-ul are deja un
+        worktree, îl returnează pe acela (comutarea rămâne instantă).
+        """
+        branch = branch.strip()
+        existing = self.find(branch)
+        if existing:
+            return {'success': True, 'message': f'Branch-ul {branch} are deja un worktree', 'worktree': existing}
+
+        path = os.path.abspath(os.path.expanduser(path)) if path else self.default_path(branch)
+        if new_branch:
+            args = ['worktree', 'add', '-b', branch, path] + ([base] if base else [])
+        else:
+            args = ['worktree', 'add', path, branch]
+
+        result = self._git(args)
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare: {result.stderr.strip()}'}
+        return {'success': True, 'message': f'Worktree creat în {path}', 'worktree': self.find(path)}
+
+    def remove(self, branch_or_path, force=False):
+        worktree = self.find(branch_or_path)
+        if not worktree:
+            return {'success': False, 'message': f'Worktree inexistent: {branch_or_path}'}
+        if worktree['main']:
+            return {'success': False, 'message': 'Worktree-ul principal nu poate fi șters'}
+
+        result = self._git(['worktree', 'remove'] + (['--force'] if force else []) + [worktree['path']])
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare: {result.stderr.strip()}'}
+
+        if self.active_path() == worktree['path']:
+            self.set_active(None)
+        return {'success': True, 'message': f'Worktree șters: {worktree["path"]}'}
+
+    def prune(self):
+        """Elimină înregistrările worktree-urilor al căror director nu mai există"""
+        result = self._git(['worktree', 'prune', '-v'])
+        if result.returncode != 0:
+            return {'success': False, 'message': f'Eroare: {result.stderr.strip()}'}
+
+        pruned = [line for line in (result.stdout + result.stderr).strip().split('\n') if line]
+        message = f'{len(pruned)} worktree-uri eliminate' if pruned else 'Nu există worktree-uri de eliminat'
+        return {'success': True, 'message': message, 'pruned': pruned}
+
+    # --- Worktree activ ---
+
+    def _state_path(self):
+        return os.path.join(state_dir(self.project_path), STATE_FILE)
+
+    def active_path(self):
+        """Worktree-ul ales ultima dată (doar dacă încă există)"""
+        try:
+            with open(self._state_path(), 'r', encoding='utf-8') as f:
+                path = json.load(f).get('active')
+        except (OSError, ValueError):
+            return None
+        if path and os.path.isdir(path) and any(w['path'] == path for w in self.list_worktrees()):
+            return path
+        return None
+
+    def set_active(self, path):
+        with open(self._state_path(), 'w', encoding='utf-8') as f:
+            json.dump({'active': path}, f, ensure_ascii=False)
+
+    def switch(self, branch_or_path, create=True):
+        """
+        Returnează worktree-ul pentru branch (creat la nevoie) și îl
+        memorează ca activ. Apelantul își schimbă apoi project_path.
+        """
+        worktree = self.find(branch_or_path)
+        if worktree is None:
+            if not create:
+                return {'success': False, 'message': f'Worktree inexistent: {branch_or_path}'}
+            result = self.create(branch_or_path)
+            if not result['success']:
+                return result
+            worktree = result['worktree']
+        if worktree['prunable']:
+            return {'success': False, 'message': f'Directorul worktree-ului lipsește: {worktree["path"]}'}
+
+        self.set_active(None if worktree['main'] else worktree['path'])
+        return {
+            'success': True,
+            'message': f'Worktree activ: {worktree["path"]} ({worktree["branch"] or "HEAD detașat"})',
+            'path': worktree['path'],
+            'worktree': worktree
+        }
@@ -3,7 +3,14 @@ class GitManagerUI {
     constructor() {
         this.apiBase = '/api';
         this.currentStatus = null;
+        // Status version and files the UI already has (the server then sends only the differences)
+        this.statusVersion = null;
+        this.statusFiles = new Map();
+        this.statusView = null;
         this.selectedFiles = [];
+        this.maxConsoleLines = 2000;
+        // Branches/history/remotes from the last batch refresh (used to open modals instantly)
+        this.cache = {};
         this.init();
     }
 
@@ -40,9 +47,17 @@ class GitManagerUI {
     }
 
     // Status Management
+    refreshOperations() {
+        return [{ op: 'status', since: this.statusVersion }, 'branches', 'remotes', { op: 'history', limit: 10 }];
+    }
+
     async refreshStatus() {
         try {
-            const status = await this.apiCall('/status');
+            // One request for everything the UI shows, read from the same repository snapshot
+            const batch = await this.apiCall('/batch', 'POST', { operations: this.refreshOperations() });
+            const status = this.applyStatusDelta(batch.success ? batch.results.status :
+                await this.apiCall(this.statusVersion === null ? '/status' : `/status?since=${this.statusVersion}`));
+            this.cache = batch.success ? batch.results : {};
             this.currentStatus = status;
             this.updateStatusDisplay(status);
             this.updateButtons(status);
@@ -52,10 +67,25 @@ class GitManagerUI {
         }
     }
 
+    applyStatusDelta(status) {
+        // A full status replaces the known files; a delta is applied over them
+        if (status.full === false) {
+            const delta = status.files_delta;
+            delta.removed.forEach(name => this.statusFiles.delete(name));
+            delta.added.concat(delta.changed).forEach(file => this.statusFiles.set(file.name, file));
+        } else {
+            this.statusFiles = new Map((status.files || []).map(file => [file.name, file]));
+        }
+        this.statusVersion = status.version ?? null;
+        status.files = Array.from(this.statusFiles.values());
+        return status;
+    }
+
     updateStatusDisplay(status) {
         const statusContent = document.getElementById('status-content');
         
         if (!status.git_installed) {
+            this.statusView = null;
             statusContent.innerHTML = `
                 <div class="status-card">
                     <h4>⚠️ Git Status</h4>
@@ -67,6 +97,7 @@ class GitManagerUI {
         }
 
         if (!status.initialized) {
+            this.statusView = null;
             statusContent.innerHTML = `
                 <div class="status-card">
                     <h4>📂 Repository</h4>
@@ -82,52 +113,128 @@ class GitManagerUI {
             return;
         }
 
-        const fileCount = status.files ? status.files.length : 0;
-        const modifiedCount = status.files ? status.files.filter(f => f.status !== 'untracked').length : 0;
-        const untrackedCount = status.files ? status.files.filter(f => f.status === 'untracked').length : 0;
+        // The cards are built once; later refreshes only patch what changed
+        const view = this.statusView || (this.statusView = this.createStatusView(statusContent));
+        const files = status.files || [];
+        const modifiedCount = files.filter(f => f.status !== 'untracked').length;
+        const untrackedCount = files.length - modifiedCount;
+
+        view.branch.textContent = status.branch || 'main';
+        view.count.textContent = files.length;
+        view.counts.textContent = `Modificate: ${modifiedCount}, Noi: ${untrackedCount}`;
+        view.message.textContent = status.message;
+        view.summary.textContent = files.length === 0 ? 'Working tree curat' : 'Modificări detectate';
+        view.path.textContent = this.truncatePath(status.project_path);
+
+        this.patchFileRows(view, status);
+        view.filesCard.style.display = files.length > 0 ? '' : 'none';
+
+        // Show submodules (nested repositories) if any
+        const submodules = status.submodules || [];
+        const submodulesKey = JSON.stringify(submodules);
+        if (submodulesKey !== view.submodulesKey) {
+            view.submodulesKey = submodulesKey;
+            view.submodules.innerHTML = submodules.map(submodule => `
+                <div class="file-item" style="padding-left: ${submodule.depth * 16}px;">
+                    <span class="file-icon">${submodule.dirty ? '📝' : '📦'}</span>
+                    <span class="file-name">${submodule.path} @ ${submodule.commit}</span>
+                    <span class="file-status">${submodule.state === 'uninitialized' ? 'Neinițializat' :
+                        (submodule.dirty ? `${submodule.changes} modificări` : 'Curat')}</span>
+                </div>
+            `).join('');
+        }
+        view.submodulesCard.style.display = submodules.length > 0 ? '' : 'none';
+    }
 
+    createStatusView(statusContent) {
         statusContent.innerHTML = `
             <div class="status-card">
                 <h4>🌿 Branch</h4>
-                <div class="value">${status.branch || 'main'}</div>
+                <div class="value" data-field="branch"></div>
                 <div class="description">Branch-ul curent activ</div>
             </div>
             <div class="status-card">
                 <h4>📊 Fișiere</h4>
-                <div class="value">${fileCount}</div>
-                <div class="description">Modificate: ${modifiedCount}, Noi: ${untrackedCount}</div>
+                <div class="value" data-field="count"></div>
+                <div class="description" data-field="counts"></div>
             </div>
             <div class="status-card">
                 <h4>📍 Status</h4>
-                <div class="value">${status.message}</div>
-                <div class="description">${fileCount === 0 ? 'Working tree curat' : 'Modificări detectate'}</div>
+                <div class="value" data-field="message"></div>
+                <div class="description" data-field="summary"></div>
             </div>
             <div class="status-card">
                 <h4>📁 Locație</h4>
-                <div class="value">${this.truncatePath(status.project_path)}</div>
+                <div class="value" data-field="path"></div>
                 <div class="description">Directorul de lucru</div>
             </div>
+            <div class="status-card" data-field="filesCard" style="grid-column: 1 / -1;">
+                <h4>📄 Fișiere Modificate</h4>
+                <div class="file-list" data-field="files"></div>
+            </div>
+            <div class="status-card" data-field="submodulesCard" style="grid-column: 1 / -1;">
+                <h4>📦 Submodule</h4>
+                <div class="file-list" data-field="submodules"></div>
+            </div>
         `;
 
-        // Show files if any
-        if (status.files && status.files.length > 0) {
-            const filesHtml = status.files.map(file => `
-                <div class="file-item">
-                    <span class="file-icon">${file.icon}</span>
-                    <span class="file-name">${file.name}</span>
-                    <span class="file-status status-${file.status}">${this.getStatusText(file.status)}</span>
-                </div>
-            `).join('');
+        // File rows keyed by name, so a delta touches only its own rows
+        const view = { rows: new Map(), submodulesKey: null };
+        statusContent.querySelectorAll('[data-field]').forEach(element => {
+            view[element.dataset.field] = element;
+        });
+        return view;
+    }
 
-            statusContent.innerHTML += `
-                <div class="status-card" style="grid-column: 1 / -1;">
-                    <h4>📄 Fișiere Modificate</h4>
-                    <div class="file-list">
-                        ${filesHtml}
-                    </div>
-                </div>
-            `;
+    patchFileRows(view, status) {
+        const delta = status.files_delta;
+        if (!delta || !view.populated) {
+            view.rows.clear();
+            view.files.textContent = '';
+            view.populated = true;
+            this.appendFileRows(view, status.files || []);
+            return;
         }
+
+        delta.removed.forEach(name => {
+            const row = view.rows.get(name);
+            if (row) {
+                row.remove();
+                view.rows.delete(name);
+            }
+        });
+        delta.changed.forEach(file => {
+            const row = view.rows.get(file.name);
+            if (row) {
+                this.fillFileRow(row, file);
+            }
+        });
+        this.appendFileRows(view, delta.added.filter(file => !view.rows.has(file.name)));
+    }
+
+    appendFileRows(view, files) {
+        const fragment = document.createDocumentFragment();
+        files.forEach(file => {
+            const row = document.createElement('div');
+            row.className = 'file-item';
+            ['file-icon', 'file-name', 'file-status'].forEach(className => {
+                const span = document.createElement('span');
+                span.className = className;
+                row.appendChild(span);
+            });
+            this.fillFileRow(row, file);
+            view.rows.set(file.name, row);
+            fragment.appendChild(row);
+        });
+        view.files.appendChild(fragment);
+    }
+
+    fillFileRow(row, file) {
+        const [icon, name, status] = row.children;
+        icon.textContent = file.icon;
+        name.textContent = file.name;
+        status.className = `file-status status-${file.status}`;
+        status.textContent = this.getStatusText(file.status);
     }
 
     updateButtons(status) {
@@ -194,6 +301,71 @@ class GitManagerUI {
         consoleEl.scrollTop = consoleEl.scrollHeight;
     }
 
+    addConsoleOutput(text, type = 'info', line = null) {
+        // Raw git output is inserted as text (never as HTML); progress updates reuse the same line
+        const consoleEl = document.getElementById('console');
+        if (!line) {
+            line = document.createElement('div');
+            line.className = `console-line ${type}`;
+            line.innerHTML = '<span class="output"></span>';
+            consoleEl.appendChild(line);
+            // Bounded console: the oldest lines are dropped
+            while (consoleEl.childElementCount > this.maxConsoleLines) {
+                consoleEl.removeChild(consoleEl.firstElementChild);
+            }
+        }
+        line.querySelector('.output').textContent = text;
+        consoleEl.scrollTop = consoleEl.scrollHeight;
+        return line;
+    }
+
+    async streamCommand(operation, data = {}) {
+        // Reads the NDJSON stream from /api/stream/<operation> as git produces it
+        let response;
+        try {
+            response = await fetch(`${this.apiBase}/stream/${operation}`, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(data)
+            });
+        } catch (error) {
+            this.addConsoleMessage(`❌ Eroare API: ${error.message}`, 'error');
+            return { success: false, message: error.message };
+        }
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let progressLine = null;
+        let result = { success: false, message: 'Conexiune întreruptă' };
+
+        const handle = (event) => {
+            if (event.type === 'start') {
+                this.addConsoleMessage(`$ ${event.command}`, 'info');
+            } else if (event.type === 'line') {
+                const line = this.addConsoleOutput(event.text, 'info', progressLine);
+                progressLine = event.progress ? line : null;
+            } else if (event.type === 'warning') {
+                this.addConsoleMessage(`⚠️ ${event.text}`, 'warning');
+            } else if (event.type === 'end') {
+                result = event;
+            }
+        };
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.filter(line => line.trim()).forEach(line => handle(JSON.parse(line)));
+        }
+        if (buffer.trim()) {
+            handle(JSON.parse(buffer));
+        }
+        return result;
+    }
+
     clearConsole() {
         const consoleEl = document.getElementById('console');
         consoleEl.innerHTML = '';
@@ -278,20 +450,20 @@ class GitManagerUI {
 
     async commitChanges() {
         const message = document.getElementById('commit-message').value;
-        const result = await this.apiCall('/commit', 'POST', { message });
+        const result = await this.overrideChecks('/commit', { message }, await this.apiCall('/commit', 'POST', { message }));
         this.addConsoleMessage(result.message, result.success ? 'success' : 'error');
         this.closeModal('commit-modal');
         await this.refreshStatus();
     }
 
-    async showHistory() {
+    async showHistory(force = false) {
         const modal = document.getElementById('history-modal');
         modal.style.display = 'block';
 
         const container = document.getElementById('history-content');
         container.innerHTML = '<div class="loading">Se încarcă...</div>';
 
-        const result = await this.apiCall('/history');
+        const result = (!force && this.cache.history) || await this.apiCall('/history');
         if (result.success && result.commits) {
             container.innerHTML = result.commits.map(line => `<div class="commit-line">${line}</div>`).join('');
         } else {
@@ -299,62 +471,149 @@ class GitManagerUI {
         }
     }
 
-    async showBranches() {
+    async showBranches(force = false) {
         const modal = document.getElementById('branches-modal');
         modal.style.display = 'block';
 
         const list = document.getElementById('branches-list');
         list.innerHTML = '<div class="loading">Se încarcă...</div>';
 
-        const result = await this.apiCall('/branches');
+        const result = (!force && this.cache.branches) || await this.apiCall('/branches');
         if (result.success && result.branches) {
             list.innerHTML = result.branches.map(branch => `
                 <div class="branch-item ${branch.current ? 'current' : ''}">
-                    <span>${branch.name}</span>
-                    ${!branch.current ? `<button onclick="app.switchBranch('${branch.name}')">Comută</button>` : ''}
+                    <span>${branch.worktree ? '📂 ' : ''}${branch.name}${this.formatDivergence(branch)}</span>
+                    ${!branch.current ? `<span>
+                        <button onclick="app.switchBranch('${branch.name}')">Comută</button>
+                        ${!branch.worktree ? `<button onclick="app.switchBranch('${branch.name}', true)">Worktree</button>` : ''}
+                    </span>` : ''}
                 </div>
             `).join('');
+            await this.showWorktrees();
         } else {
             list.innerHTML = `<div class="error">Eroare la încărcarea branch-urilor</div>`;
         }
     }
 
+    formatDivergence(branch) {
+        // Ahead/behind the upstream, as of the last (background) fetch
+        if (!branch.upstream) return '';
+        if (branch.gone) return ` <span class="branch-divergence behind" title="${branch.upstream}">upstream șters</span>`;
+        const counts = [branch.ahead ? `↑${branch.ahead}` : '', branch.behind ? `↓${branch.behind}` : ''].filter(Boolean);
+        const state = branch.behind ? 'behind' : branch.ahead ? 'ahead' : '';
+        return ` <span class="branch-divergence ${state}" title="${branch.upstream}">${counts.join(' ') || '✓'}</span>`;
+    }
+
+    async showWorktrees() {
+        const list = document.getElementById('worktrees-list');
+        const result = await this.apiCall('/worktrees');
+        if (!result.success) {
+            list.innerHTML = `<div class="error">Eroare la încărcarea worktree-urilor</div>`;
+            return;
+        }
+        list.innerHTML = result.worktrees.map(worktree => `
+            <div class="branch-item ${worktree.path === result.active ? 'current' : ''}">
+                <span>${worktree.prunable ? '⚠️' : '📂'} ${worktree.branch || worktree.head} — ${this.truncatePath(worktree.path)}</span>
+                ${!worktree.main && worktree.path !== result.active ?
+                    `<button onclick="app.removeWorktree('${worktree.path}')">Șterge</button>` : ''}
+            </div>
+        `).join('');
+    }
+
+    async removeWorktree(path) {
+        const result = await this.apiCall('/worktrees/remove', 'POST', { target: path });
+        this.addConsoleMessage(result.message, result.success ? 'success' : 'error');
+        await this.showBranches(true);
+    }
+
+    async pruneWorktrees() {
+        const result = await this.apiCall('/worktrees/prune', 'POST');
+        this.addConsoleMessage(result.message, result.success ? 'success' : 'error');
+        await this.showBranches(true);
+    }
+
     async createBranch() {
         const name = document.getElementById('new-branch-name').value;
-        const result = await this.apiCall('/branch/create', 'POST', { name });
+        const worktree = document.getElementById('new-branch-worktree').checked;
+        const result = await this.apiCall('/branch/create', 'POST', { name, worktree });
         this.addConsoleMessage(result.message, result.success ? 'success' : 'error');
-        await this.showBranches();
+        await this.showBranches(true);
         await this.refreshStatus();
     }
 
-    async switchBranch(name) {
-        const result = await this.apiCall('/branch/switch', 'POST', { name });
+    async switchBranch(name, worktree = false) {
+        const result = await this.apiCall('/branch/switch', 'POST', { name, worktree });
         this.addConsoleMessage(result.message, result.success ? 'success' : 'error');
         await this.refreshStatus();
     }
 
+    showRemoteModal() {
+        document.getElementById('remote-modal').style.display = 'block';
+    }
+
     async setupRemote() {
         const url = document.getElementById('remote-url').value;
-        const result = await this.apiCall('/remote/setup', 'POST', { url });
+        const name = document.getElementById('remote-name').value.trim() || 'origin';
+        const result = await this.apiCall('/remote/setup', 'POST', { url, name });
         this.addConsoleMessage(result.message, result.success ? 'success' : 'error');
         this.closeModal('remote-modal');
         await this.refreshStatus();
     }
 
+    showWarnings(result) {
+        (result.warnings || []).forEach(warning => {
+            this.addConsoleMessage(`⚠️ ${warning}`, 'warning');
+        });
+    }
+
+    showProblems(result) {
+        // Pre-commit check failures per file (paths are inserted as text)
+        (result.problems || []).forEach(problem => {
+            this.addConsoleOutput(`❌ ${problem.path} [${problem.check}]: ${problem.message}`, 'error');
+        });
+    }
+
+    async overrideChecks(endpoint, data, result) {
+        // Failed pre-commit checks block the operation; the user may explicitly retry without them
+        if (result.success || !(result.problems || []).length) {
+            return result;
+        }
+        this.showProblems(result);
+        if (!window.confirm(`Verificările pre-commit au găsit ${result.problems.length} probleme. Continui fără verificări?`)) {
+            return result;
+        }
+        this.addConsoleMessage('⚠️ Verificările pre-commit au fost ignorate', 'warning');
+        return this.apiCall(endpoint, 'POST', { ...data, skip_checks: true });
+    }
+
+    showRemoteResults(result) {
+        (result.results || []).forEach(entry => {
+            const icon = entry.success ? '✅' : (entry.timed_out ? '⏱️' : '❌');
+            const detail = entry.success ? `${Math.round(entry.duration_ms)} ms` : (entry.error || '');
+            this.addConsoleMessage(`${icon} ${entry.remote}: ${detail}`, entry.success ? 'info' : 'error');
+        });
+    }
+
     async pushChanges() {
-        const result = await this.apiCall('/push', 'POST', { first_push: false });
+        const result = await this.streamCommand('push', { first_push: false });
+        this.showWarnings(result);
+        this.showRemoteResults(result);
         this.addConsoleMessage(result.message, result.success ? 'success' : 'error');
         await this.refreshStatus();
     }
 
     async pullChanges() {
-        const result = await this.apiCall('/pull', 'POST');
+        const result = await this.streamCommand('pull');
         this.addConsoleMessage(result.message, result.success ? 'success' : 'error');
         await this.refreshStatus();
     }
 
     async quickBackup() {
-        const result = await this.apiCall('/backup', 'POST');
+        const result = await this.overrideChecks('/backup', {}, await this.apiCall('/backup', 'POST'));
+        this.showWarnings(result);
+        if (result.submodules && result.submodules.committed.length > 0) {
+            this.addConsoleMessage(result.submodules.message, 'info');
+        }
         this.addConsoleMessage(result.message, result.success ? 'success' : 'error');
         await this.refreshStatus();
     }
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Teste pentru ChangeDetector: directoarele goale (sau doar cu fișiere
+ignorate) trebuie urmărite, altfel un fișier nou creat în ele nu este
+detectat și backup-ul rapid raportează greșit "nicio modificare".
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from git_change_detect import ChangeDetector  # noqa: E402
+
+
+def git(cwd, *args):
+    subprocess.run(['git'] + list(args), cwd=cwd, check=True, capture_output=True)
+
+
+class ChangeDetectorDirectoriesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = self.tmp.name
+        git(self.repo, 'init', '-q')
+        git(self.repo, 'config', 'user.name', 'test')
+        git(self.repo, 'config', 'user.email', 'test@example.com')
+        self.write('README.md', 'readme\n')
+        self.write('.gitignore', '*.log\n')
+        git(self.repo, 'add', '.')
+        git(self.repo, 'commit', '-q', '-m', 'init')
+        self.detector = ChangeDetector(self.repo)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, path, content):
+        full_path = os.path.join(self.repo, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def settle(self):
+        # Fișierele modificate în fereastra "racy" a snapshot-ului sunt raportate din nou
+        time.sleep(1.1)
+
+    def refresh(self):
+        self.settle()
+        self.assertTrue(self.detector.refresh())
+        self.settle()
+
+    def test_new_file_in_directory_created_empty(self):
+        self.refresh()
+        os.mkdir(os.path.join(self.repo, 'docs'))
+        self.assertEqual(self.detector.detect(), ['docs'])
+        self.detector.update(['docs'])
+
+        self.settle()
+        self.write('docs/new.md', 'new\n')
+        self.assertEqual(self.detector.detect(), ['docs/new.md'])
+
+    def test_new_file_in_directory_empty_at_refresh(self):
+        os.makedirs(os.path.join(self.repo, 'empty', 'nested'))
+        self.refresh()
+        self.write('empty/nested/new.md', 'new\n')
+        self.assertEqual(self.detector.detect(), ['empty/nested/new.md'])
+
+    def test_new_file_in_directory_with_only_ignored_files(self):
+        self.write('logs/app.log', 'log\n')
+        self.refresh()
+        self.write('logs/notes.txt', 'notes\n')
+        self.assertEqual(self.detector.detect(), ['logs/notes.txt'])
+
+
+if __name__ == '__main__':
+    unittest.main()